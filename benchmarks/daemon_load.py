@@ -0,0 +1,164 @@
+"""
+Load test for the labelgend render daemon
+
+Starts a daemon with the example template (or uses a running one), sends
+small jobs from several concurrent clients and reports throughput and job
+latency percentiles. With --cold the same job is also rendered by fresh
+labelgen processes, which is the cost the daemon avoids:
+
+    python benchmarks/daemon_load.py
+    python benchmarks/daemon_load.py --clients 16 --requests 200 --rows 5 --workers 4
+    python benchmarks/daemon_load.py --socket /tmp/labelgen.sock --format zpl --cold 5
+"""
+import argparse
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+SRC = os.path.join(ROOT, "src")
+TEMPLATE_SPEC = os.path.join(ROOT, "examples", "assets", "template.py") + ":label_template"
+
+sys.path.insert(0, HERE)
+sys.path.insert(0, SRC)
+
+from dataset import COLUMNS, synthetic_rows
+from LabelGenerator.client import DaemonClient
+
+def _env():
+    """Environment for child processes, with the source tree importable"""
+    return dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC, os.environ.get("PYTHONPATH")])))
+
+def start_daemon(socket_path, workers, timeout=60):
+    """
+    Start labelgend with the example template and wait for its socket
+
+    Returns:
+        Daemon Popen object
+    """
+    process = subprocess.Popen(
+        [sys.executable, "-m", "LabelGenerator.daemon", "-t", f"asset={TEMPLATE_SPEC}",
+         "-s", socket_path, "-j", str(workers), "--log-level", "error"],
+        env=_env())
+    deadline = time.perf_counter() + timeout
+    while not os.path.exists(socket_path):
+        if process.poll() is not None or time.perf_counter() > deadline:
+            process.kill()
+            raise RuntimeError("Daemon did not start")
+        time.sleep(0.05)
+    return process
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a sorted list"""
+    index = min(len(values) - 1, max(0, int(round(fraction * len(values) + 0.5)) - 1))
+    return values[index]
+
+def run_load(socket_path, template, clients, requests, rows, format):
+    """
+    Send jobs from concurrent clients
+
+    Returns:
+        (wall seconds, sorted job latencies in seconds, error count)
+    """
+    jobs = [list(synthetic_rows(rows, seed=i)) for i in range(requests)]
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def client_loop():
+        with DaemonClient(socket_path) as client:
+            for job in jobs:
+                start = time.perf_counter()
+                try:
+                    client.render(template, job, format=format)
+                except Exception as e:
+                    with lock:
+                        errors.append(e)
+                    continue
+                with lock:
+                    latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client_loop) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, sorted(latencies), len(errors)
+
+def run_cold(runs, rows):
+    """
+    Render the same job size with fresh labelgen processes
+
+    Returns:
+        Sorted latencies in seconds
+    """
+    latencies = []
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "job.csv")
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(synthetic_rows(rows))
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-m", "LabelGenerator.cli", TEMPLATE_SPEC, csv_path,
+                            "-o", os.path.join(tmp, "job.pdf"), "--progress", "0", "--log-level", "error"],
+                           env=_env(), check=True)
+            latencies.append(time.perf_counter() - start)
+    return sorted(latencies)
+
+def print_latencies(title, latencies):
+    print(f"{title}: p50 {percentile(latencies, 0.5) * 1000:.1f} ms, "
+          f"p95 {percentile(latencies, 0.95) * 1000:.1f} ms, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.1f} ms, max {latencies[-1] * 1000:.1f} ms")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="labelgend load test")
+    parser.add_argument("--socket", help="Socket of a running daemon, default starts a new one")
+    parser.add_argument("--template", default="asset", help="Template name on a running daemon (default: asset)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes of the started daemon (default: CPU count)")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent client connections (default: 8)")
+    parser.add_argument("--requests", type=int, default=50, help="Jobs per client (default: 50)")
+    parser.add_argument("--rows", type=int, default=1, help="Labels per job (default: 1)")
+    parser.add_argument("--format", default="pdf", choices=["pdf", "zpl", "pbm"], help="Output format (default: pdf)")
+    parser.add_argument("--cold", type=int, default=0, metavar="N",
+                        help="Also time N fresh labelgen processes for the same job size")
+    args = parser.parse_args(argv)
+
+    process = None
+    tmp = None
+    socket_path = args.socket
+    if socket_path is None:
+        tmp = tempfile.TemporaryDirectory()
+        socket_path = os.path.join(tmp.name, "labelgen.sock")
+        start = time.perf_counter()
+        process = start_daemon(socket_path, args.workers)
+        print(f"Daemon started with {args.workers} workers in {time.perf_counter() - start:.2f}s")
+
+    try:
+        elapsed, latencies, errors = run_load(socket_path, args.template, args.clients,
+                                              args.requests, args.rows, args.format)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+            tmp.cleanup()
+
+    jobs = len(latencies)
+    print(f"{jobs} jobs of {args.rows} labels from {args.clients} clients in {elapsed:.2f}s: "
+          f"{jobs / elapsed:.1f} jobs/s, {jobs * args.rows / elapsed:.0f} labels/s, {errors} errors")
+    if latencies:
+        print_latencies("Daemon latency", latencies)
+    if args.cold:
+        print_latencies("Cold process latency", run_cold(args.cold, args.rows))
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
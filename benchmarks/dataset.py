@@ -0,0 +1,62 @@
+"""
+Synthetic label datasets shaped like examples/assets/contents.csv
+"""
+import csv
+import random
+import sys
+
+COLUMNS = ["AssetNum", "Category", "Name", "Description", "P/N", "S/N", "ImportDate", "HASH"]
+
+CATEGORIES = ["网络设备", "服务器", "存储设备", "办公设备", "安防设备", "电源设备"]
+NAMES = ["Router", "Switch", "ONU", "Firewall", "NAS", "UPS", "Printer", "Camera", "AP"]
+DESCRIPTIONS = ["软路由", "核心交换机", "接入交换机", "光猫", "防火墙", "网络存储",
+                "不间断电源", "彩色激光打印机", "室外摄像头", "无线接入点", ""]
+PREFIXES = {"网络设备": "NET", "服务器": "SRV", "存储设备": "STO",
+            "办公设备": "OFF", "安防设备": "SEC", "电源设备": "PWR"}
+
+def synthetic_rows(count, seed=0):
+    """
+    Generate rows with the columns of the example asset CSV
+    
+    Args:
+        count: Number of rows
+        seed: Random seed, the same seed always gives the same rows
+        
+    Returns:
+        Generator of row dicts
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        category = rng.choice(CATEGORIES)
+        year = rng.randint(2018, 2025)
+        month = rng.randint(1, 12)
+        day = rng.randint(1, 28)
+        digest = f"{rng.getrandbits(24):06X}"
+        yield {
+            "AssetNum": f"{PREFIXES[category]}{year}{month:02d}{day:02d}{i:04d}{digest}",
+            "Category": category,
+            "Name": rng.choice(NAMES),
+            "Description": rng.choice(DESCRIPTIONS),
+            "P/N": f"PN-{rng.randint(1000, 9999)}",
+            "S/N": f"SN{rng.getrandbits(40):010X}",
+            "ImportDate": f"{year}-{month:02d}-{day:02d}",
+            "HASH": digest,
+        }
+
+def write_csv(path, count, seed=0):
+    """
+    Write a synthetic dataset as CSV, in the encoding used by the example file
+    
+    Args:
+        path: Output CSV path
+        count: Number of rows
+        seed: Random seed
+    """
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(synthetic_rows(count, seed))
+
+if __name__ == "__main__":
+    # Usage: python benchmarks/dataset.py contents_10k.csv 10000
+    write_csv(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
@@ -0,0 +1,313 @@
+"""
+Benchmark suite for label throughput and peak memory
+
+Every benchmark runs in its own subprocess so that peak RSS is measured per
+benchmark and row count; worker processes started with --jobs are reported
+by the peak of the largest worker. Font scans use a temporary font index, so
+the user's cache is left alone. Results are printed as a table and saved as
+JSON for comparison between versions:
+
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --rows 1000 10000 100000 --only document qrcode
+    python benchmarks/run_benchmarks.py --compare results/old.json
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+TEMPLATE_SPEC = os.path.join(ROOT, "examples", "assets", "template.py") + ":label_template"
+
+sys.path.insert(0, HERE)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+def peak_rss_kb(who=None):
+    """
+    Peak resident set size in KiB, None where unsupported
+    
+    By default this process is measured. With resource.RUSAGE_CHILDREN it is
+    the peak of the largest terminated child process, e.g. an export worker.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF if who is None else who).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB on Linux
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def _element_canvas():
+    from reportlab.pdfgen import canvas
+    return canvas.Canvas(io.BytesIO(), pagesize=(40, 30))
+
+def _draw_elements(element, update, rows):
+    """Draw one element per row on its own page, as export does"""
+    from LabelGenerator import LabelDocument, LabelPage
+    document = LabelDocument()
+    page = LabelPage(width=40, height=30)
+    c = _element_canvas()
+    count = 0
+    for row in rows:
+        update(element, row)
+        document._draw_element(c, page, element)
+        c.showPage()
+        count += 1
+    c.save()
+    return count
+
+def bench_document(rows, jobs):
+    """Full example template streamed into a PDF"""
+    from LabelGenerator import LabelDocument
+    from LabelGenerator.cli import load_template, iter_pages
+    template = load_template(TEMPLATE_SPEC)
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "labels.pdf")
+        pages = iter_pages(template, rows)
+        if jobs and jobs != 1:
+            LabelDocument().export_parallel(pages, output, jobs=jobs)
+        else:
+            LabelDocument().export_stream(pages, output)
+        size = os.path.getsize(output)
+    return None, {"pdf_bytes": size}
+
+def bench_imposed(rows, jobs):
+    """Full example template tiled onto A4 sheets"""
+    from LabelGenerator import LabelDocument, SheetLayout
+    from LabelGenerator.cli import load_template, iter_pages
+    template = load_template(TEMPLATE_SPEC)
+    layout = SheetLayout(40, 30, cut_marks=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "sheets.pdf")
+        LabelDocument().export_imposed(iter_pages(template, rows), output, layout)
+        size = os.path.getsize(output)
+    return None, {"pdf_bytes": size}
+
+def bench_raster(rows, jobs):
+    """Full example template rendered to a 203 dpi PBM batch"""
+    from LabelGenerator import LabelDocument
+    from LabelGenerator.cli import load_template, iter_pages
+    template = load_template(TEMPLATE_SPEC)
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "labels.pbm")
+        LabelDocument().export_raster(iter_pages(template, rows), output, dpi=203)
+        size = os.path.getsize(output)
+    return None, {"pbm_bytes": size}
+
+def bench_zpl(rows, jobs):
+    """Full example template converted to a 203 dpi ZPL job"""
+    from LabelGenerator import LabelDocument
+    from LabelGenerator.cli import load_template, iter_pages
+    template = load_template(TEMPLATE_SPEC)
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "labels.zpl")
+        LabelDocument().export_zpl(iter_pages(template, rows), output, dpi=203)
+        size = os.path.getsize(output)
+    return None, {"zpl_bytes": size}
+
+def bench_qrcode(rows, jobs):
+    """LabelQRCode.draw with distinct asset numbers"""
+    from LabelGenerator import LabelQRCode
+    element = LabelQRCode()
+    element.set_size(40, 40)
+    element.set_error_correction(element.ERROR_LEVEL.LOW)
+    return _draw_elements(element, lambda e, row: e.set_data(row["AssetNum"]), rows), None
+
+def bench_barcode(rows, jobs):
+    """LabelBarcode.draw with Code128 data"""
+    from LabelGenerator import LabelBarcode
+    element = LabelBarcode()
+    element.set_size(120, 10)
+    element.set_barcode_type("code128")
+    return _draw_elements(element, lambda e, row: e.set_data(row["S/N"]), rows), None
+
+def bench_barcode_native(rows, jobs):
+    """LabelBarcode.draw with Code128 data as one path snapped to 300 DPI"""
+    from LabelGenerator import LabelBarcode
+    element = LabelBarcode()
+    element.set_size(120, 10)
+    element.set_barcode_type("code128")
+    element.set_render_mode(LabelBarcode.RENDER_MODE.NATIVE)
+    element.set_dpi(300)
+    return _draw_elements(element, lambda e, row: e.set_data(row["S/N"]), rows), None
+
+def bench_text(rows, jobs):
+    """LabelText.draw with CJK text"""
+    from LabelGenerator import LabelText
+    element = LabelText()
+    element.set_location(0, 12)
+    element.set_font("Microsoft YaHei", 10, "normal")
+    return _draw_elements(element, lambda e, row: e.set_text(row["Category"] + row["Description"]), rows), None
+
+def bench_font_scan(rows, jobs):
+    """Full font directory scan, ignoring the font cache"""
+    from LabelGenerator import font_manager
+    font_manager.refresh()
+    return len(font_manager.fonts), {"fonts": len(font_manager.fonts)}
+
+def bench_font_lookup(rows, jobs):
+    """FontManager.get_font_path over the installed families and common names"""
+    from LabelGenerator import font_manager
+    names = [(family, style) for family in font_manager.fonts_by_family
+             for style in ("normal", "bold")]
+    names += [("Microsoft YaHei", "normal"), ("Consolas", "bold"), ("Arial", "normal")]
+    count = 0
+    for i, row in enumerate(rows):
+        font_manager.get_font_path(*names[i % len(names)])
+        count += 1
+    return count, {"distinct_names": len(names)}
+
+BENCHMARKS = {
+    "document": bench_document,
+    "imposed": bench_imposed,
+    "raster": bench_raster,
+    "zpl": bench_zpl,
+    "qrcode": bench_qrcode,
+    "barcode": bench_barcode,
+    "barcode_native": bench_barcode_native,
+    "text": bench_text,
+    "font_scan": bench_font_scan,
+    "font_lookup": bench_font_lookup,
+}
+
+# Benchmarks that do not depend on the row count run once
+SINGLE_RUN = {"font_scan"}
+
+def run_worker(name, count, jobs):
+    """Run one benchmark in this process and return its result dict"""
+    from dataset import synthetic_rows
+    from LabelGenerator import logger
+    logger.set_level("error")
+    
+    # Materialize the dataset first, its memory is part of the baseline
+    rows = list(synthetic_rows(count))
+    rss_start = peak_rss_kb()
+    
+    start = time.perf_counter()
+    items, extra = BENCHMARKS[name](rows, jobs)
+    elapsed = time.perf_counter() - start
+    
+    if items is None:
+        items = count
+    result = {
+        "benchmark": name,
+        "rows": count,
+        "items": items,
+        "seconds": elapsed,
+        "items_per_second": items / elapsed if elapsed > 0 else None,
+        "rss_start_kb": rss_start,
+        "peak_rss_kb": peak_rss_kb(),
+        # Worker processes have exited when the benchmark returns
+        "workers_peak_rss_kb": peak_rss_kb(resource.RUSAGE_CHILDREN) if resource else None,
+    }
+    if extra:
+        result.update(extra)
+    return result
+
+def run_in_subprocess(name, count, jobs, font_cache):
+    """Run one benchmark in a fresh interpreter and return its result dict"""
+    command = [sys.executable, os.path.abspath(__file__), "--worker", name, str(count), "--jobs", str(jobs)]
+    # Font scans must not read or overwrite the user's font index
+    env = dict(os.environ, LABELGENERATOR_FONT_CACHE=font_cache)
+    process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True,
+                             env=env)
+    if process.returncode != 0:
+        return {"benchmark": name, "rows": count, "error": process.stderr.strip().splitlines()[-1:]}
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+def _git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL, universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _package_version():
+    try:
+        from importlib.metadata import version
+        return version("LabelGenerator")
+    except Exception:
+        return None
+
+def print_table(results, baseline=None, stream=None):
+    """Print results, with the change against a baseline result file if given"""
+    stream = stream or sys.stdout
+    previous = {}
+    for result in (baseline or {}).get("results", []):
+        previous[(result["benchmark"], result["rows"])] = result
+    
+    stream.write(f"{'benchmark':<14} {'rows':>8} {'items/s':>12} {'seconds':>9} {'peak RSS MiB':>13} "
+                 f"{'worker MiB':>11}  change\n")
+    for result in results:
+        if "error" in result:
+            stream.write(f"{result['benchmark']:<14} {result['rows']:>8}  failed: {' '.join(result['error'])}\n")
+            continue
+        rate = result["items_per_second"] or 0
+        peak = result["peak_rss_kb"]
+        peak_text = f"{peak / 1024:.1f}" if peak is not None else "n/a"
+        workers = result.get("workers_peak_rss_kb")
+        workers_text = f"{workers / 1024:.1f}" if workers else "-"
+        change = ""
+        old = previous.get((result["benchmark"], result["rows"]))
+        if old and old.get("items_per_second"):
+            change = f"{(rate / old['items_per_second'] - 1) * 100:+.1f}%"
+        stream.write(f"{result['benchmark']:<14} {result['rows']:>8} {rate:>12.1f} "
+                     f"{result['seconds']:>9.2f} {peak_text:>13} {workers_text:>11}  {change}\n")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LabelGenerator throughput and memory benchmarks")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Dataset sizes to run (default: 1000 10000 100000)")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for the document benchmark")
+    parser.add_argument("--output", help="Result JSON path (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="Previous result JSON to compare throughput against")
+    parser.add_argument("--worker", nargs=2, metavar=("NAME", "ROWS"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    
+    if args.worker:
+        name, count = args.worker
+        print(json.dumps(run_worker(name, int(count), args.jobs)))
+        return 0
+    
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        font_cache = os.path.join(tmp, "font_index.json")
+        for name in args.only or list(BENCHMARKS):
+            for count in ([min(args.rows)] if name in SINGLE_RUN else args.rows):
+                results.append(run_in_subprocess(name, count, args.jobs, font_cache))
+    
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "version": _package_version(),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "jobs": args.jobs,
+        "results": results,
+    }
+    output = args.output or os.path.join(HERE, "results", datetime.now().strftime("%Y%m%d_%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_table(results, baseline)
+    print(f"Results saved to {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -31,4 +31,13 @@ setup(
         "qrcode>=6.1",
         "pillow>=8.0.0"
     ],
+    entry_points={
+        "console_scripts": [
+            "labelgen=LabelGenerator.cli:main",
+            "labelgend=LabelGenerator.daemon:main",
+        ],
+    },
+    extras_require={
+        "parallel": ["pypdf>=3.0.0"],
+    },
 )
\ No newline at end of file
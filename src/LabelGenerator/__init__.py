@@ -1,19 +1,67 @@
-from .document import LabelDocument
-from .page import LabelPage
-from .text import LabelText
-from .barcode import LabelBarcode
-from .qrcode import LabelQRCode
+import importlib
+import sys
+
+# The logger only depends on the standard library. It is imported eagerly so the
+# 'logger' attribute is the logger instance rather than the submodule of that name.
 from .logger import LabelLogger, logger
-from .fonts import FontManager, font_manager
+
+# Public names and the submodules defining them. Submodules (and with them
+# ReportLab, qrcode and PIL) are only imported on first attribute access.
+_LAZY_ATTRIBUTES = {
+    'LabelDocument': '.document',
+    'LabelPage': '.page',
+    'LabelTemplate': '.template',
+    'LabelText': '.text',
+    'LabelBarcode': '.barcode',
+    'LabelQRCode': '.qrcode',
+    'FontManager': '.fonts',
+    'font_manager': '.fonts',
+    'FontRegistry': '.fonts',
+    'font_registry': '.fonts',
+    'ExportProfiler': '.profiling',
+    'RasterRenderer': '.raster',
+    'ZPLRenderer': '.zpl',
+    'SheetLayout': '.imposition',
+    'AsyncExporter': '.aio',
+    'RenderDaemon': '.daemon',
+    'DaemonClient': '.client',
+}
 
 __all__ = [
     'LabelDocument',
     'LabelPage',
+    'LabelTemplate',
     'LabelText',
     'LabelBarcode',
     'LabelQRCode',
     'LabelLogger',
     'logger',
     'FontManager',
-    'font_manager'
-]
\ No newline at end of file
+    'font_manager',
+    'FontRegistry',
+    'font_registry',
+    'ExportProfiler',
+    'RasterRenderer',
+    'ZPLRenderer',
+    'SheetLayout',
+    'AsyncExporter',
+    'RenderDaemon',
+    'DaemonClient'
+]
+
+def __getattr__(name):
+    """Import the submodule defining a public name on first access"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is not supported, import everything eagerly
+    for _name in _LAZY_ATTRIBUTES:
+        globals()[_name] = __getattr__(_name)
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+from .logger import logger
+from .document import _uses_workers
+
+class ExportCancelled(asyncio.CancelledError):
+    """Raised in the render thread when an async export is cancelled between pages"""
+
+def _cancellable(pages, event):
+    """
+    Iterate pages until the cancel event is set
+
+    Args:
+        pages: Iterable of LabelPage objects
+        event: threading.Event set by the cancelled coroutine
+
+    Yields:
+        LabelPage objects
+    """
+    for page in pages:
+        if event.is_set():
+            raise ExportCancelled()
+        yield page
+
+class AsyncExporter:
+    """
+    Runs PDF exports from asyncio code without blocking the event loop
+
+    Rendering runs on an executor, by default the loop's thread pool. At most
+    max_concurrency exports of one exporter run at the same time, further
+    calls wait for a free slot. Services can keep separate exporters, e.g. a
+    small one for interactive reprints next to one for bulk jobs, so that a
+    large job cannot occupy every slot.
+
+    Cancelling the awaiting task stops the render thread before its next page
+    and no output is written. The slot is freed once the thread has stopped.
+    An exporter belongs to the event loop it is first used on.
+    """
+
+    def __init__(self, executor=None, max_concurrency=None):
+        """
+        Initialize async exporter
+
+        Args:
+            executor: concurrent.futures executor, None uses the loop's default executor.
+                      Pages are passed as they are, so thread pools are supported; use
+                      the jobs argument of export to render on worker processes.
+            max_concurrency: Maximum number of exports running at once, None for no limit
+        """
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        self.active = 0
+
+    def _get_semaphore(self):
+        """Create the semaphore lazily, inside the running event loop"""
+        if self._semaphore is None and self.max_concurrency:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def export(self, document, pages=None, filename=None, jobs=None, profiler=None):
+        """
+        Export pages as PDF on the executor
+
+        Args:
+            document: LabelDocument providing page size and drawing
+            pages: Iterable or generator of LabelPage objects, default is the document pages
+            filename: Output PDF filename or writable binary stream, None returns the PDF bytes
+            jobs: Number of worker processes, None or 1 renders on the executor thread
+            profiler: Optional ExportProfiler recording timings, single process export only
+
+        Returns:
+            Output PDF filename or stream, or PDF bytes when filename is None
+
+        Raises:
+            ValueError: A profiler was given together with worker processes
+            asyncio.CancelledError: The awaiting task was cancelled
+        """
+        parallel = _uses_workers(jobs, profiler)
+        if pages is None:
+            pages = document.pages
+        event = threading.Event()
+        pages = _cancellable(pages, event)
+
+        def run():
+            if filename is None:
+                return document.export_bytes(pages, jobs=jobs, profiler=profiler)
+            if parallel:
+                return document.export_parallel(pages, filename, jobs=jobs)
+            return document.export_stream(pages, filename, profiler=profiler)
+
+        semaphore = self._get_semaphore()
+        if semaphore is not None:
+            await semaphore.acquire()
+        self.active += 1
+
+        def release(future):
+            self.active -= 1
+            if semaphore is not None:
+                semaphore.release()
+            if future is not None and not future.cancelled():
+                # Mark the result as retrieved, a cancelled export ends with ExportCancelled
+                future.exception()
+
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, run)
+        except BaseException:
+            release(None)
+            raise
+        # The slot is held until the render thread has actually finished
+        future.add_done_callback(release)
+        try:
+            # Shielded so cancelling the task does not detach the future from the thread
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            event.set()
+            logger.info("Async PDF export cancelled: %s", filename)
+            raise
@@ -1,7 +1,25 @@
+import copy
+from enum import Enum
 from reportlab.graphics.barcode import code39, code128, usps
 from reportlab.graphics.barcode import eanbc, qr, ecc200datamatrix
+from reportlab.graphics import renderPDF
+from reportlab.lib.rl_accel import fp_str
 from reportlab.lib.units import mm
 from .logger import logger
+from .cache import LRUCache
+
+class _BarRecorder:
+    """Stand-in canvas collecting the bar rectangles a reportlab barcode draws"""
+    
+    def __init__(self):
+        self.bars = []
+    
+    def rect(self, x, y, width, height, stroke=0, fill=1, **kwargs):
+        self.bars.append((x, y, width, height))
+    
+    def __getattr__(self, name):
+        # Text and state operations are not part of the bar pattern
+        return lambda *args, **kwargs: None
 
 class LabelBarcode:
     """
@@ -14,6 +32,25 @@ class LabelBarcode:
         TOP = 1
         BOTTOM = 2
     
+    class RENDER_MODE(Enum):
+        """Barcode rendering mode enumeration"""
+        REPORTLAB = "reportlab"  # Draw through reportlab, one fill operation per bar
+        NATIVE = "native"        # Draw linear barcodes as one filled path
+    
+    # Barcode constructors by lowercase type name, called as builder(data, bar_width, bar_height)
+    BUILDERS = {
+        'code39': lambda data, w, h: code39.Standard39(data, barWidth=w, barHeight=h),
+        'code128': lambda data, w, h: code128.Code128(data, barWidth=w, barHeight=h),
+        'ean13': lambda data, w, h: eanbc.Ean13BarcodeWidget(data, barWidth=w, barHeight=h),
+        'ean8': lambda data, w, h: eanbc.Ean8BarcodeWidget(data, barWidth=w, barHeight=h),
+        'upca': lambda data, w, h: eanbc.Ean13BarcodeWidget("0" + data, barWidth=w, barHeight=h),
+        'datamatrix': lambda data, w, h: ecc200datamatrix.ECC200DataMatrix(data),
+    }
+    
+    # Process-wide cache of built barcodes shared by all instances,
+    # keyed by (type, data, width, height)
+    cache = LRUCache(maxsize=4096)
+    
     def __init__(self):
         """Initialize barcode element"""
         self.x = 0
@@ -27,7 +64,9 @@ class LabelBarcode:
         self.text_location = self.TEXT.BOTTOM
         self.text_color = (0, 0, 0)
         self.text_size = 8
-        logger.info(f"Created new barcode element, type: {self.barcode_type}")
+        self.render_mode = self.RENDER_MODE.REPORTLAB
+        self.dpi = None
+        logger.render.info("Created new barcode element, type: %s", self.barcode_type)
         
     def set_location(self, x, y):
         """
@@ -39,7 +78,7 @@ class LabelBarcode:
         """
         self.x = x
         self.y = y
-        logger.debug(f"Barcode position set: ({x}, {y})")
+        logger.render.debug("Barcode position set: (%s, %s)", x, y)
         
     def set_size(self, width, height):
         """
@@ -51,7 +90,7 @@ class LabelBarcode:
         """
         self.width = width
         self.height = height
-        logger.debug(f"Barcode size set: {width}x{height}")
+        logger.render.debug("Barcode size set: %sx%s", width, height)
         
     def set_data(self, data):
         """
@@ -61,7 +100,7 @@ class LabelBarcode:
             data: Barcode data
         """
         self.data = data
-        logger.debug(f"Barcode data set: {data}")
+        logger.render.debug("Barcode data set: %s", data)
         
     def set_barcode_type(self, barcode_type):
         """
@@ -71,7 +110,7 @@ class LabelBarcode:
             barcode_type: Barcode type (code39, code128, ean13, ean8, upca, usps, etc)
         """
         self.barcode_type = barcode_type
-        logger.debug(f"Barcode type set: {barcode_type}")
+        logger.render.debug("Barcode type set: %s", barcode_type)
         
     def set_color(self, color):
         """
@@ -88,7 +127,7 @@ class LabelBarcode:
             self.color = (r, g, b)
         else:
             self.color = color
-        logger.debug(f"Barcode color set: {self.color}")
+        logger.render.debug("Barcode color set: %s", self.color)
             
     def enable_text(self, show=True):
         """
@@ -98,7 +137,7 @@ class LabelBarcode:
             show: Whether to show text
         """
         self.show_text = show
-        logger.debug(f"Barcode text display set: {show}")
+        logger.render.debug("Barcode text display set: %s", show)
         
     def set_text_location(self, location):
         """
@@ -108,7 +147,7 @@ class LabelBarcode:
             location: Text position (TEXT.NONE, TEXT.TOP, TEXT.BOTTOM)
         """
         self.text_location = location
-        logger.debug(f"Barcode text position set: {location}")
+        logger.render.debug("Barcode text position set: %s", location)
         
     def set_text_color(self, color):
         """
@@ -125,7 +164,7 @@ class LabelBarcode:
             self.text_color = (r, g, b)
         else:
             self.text_color = color
-        logger.debug(f"Barcode text color set: {self.text_color}")
+        logger.render.debug("Barcode text color set: %s", self.text_color)
             
     def set_text_size(self, size):
         """
@@ -135,63 +174,134 @@ class LabelBarcode:
             size: Text size
         """
         self.text_size = size
-        logger.debug(f"Barcode text size set: {size}")
+        logger.render.debug("Barcode text size set: %s", size)
+        
+    def set_render_mode(self, mode):
+        """
+        Set barcode rendering mode
+        
+        NATIVE mode applies to linear barcodes drawn by reportlab as bars
+        (code128, code39), other types are always drawn through reportlab.
+        
+        Args:
+            mode: Rendering mode, use value from RENDER_MODE enumeration
+        """
+        self.render_mode = mode
+        logger.render.debug("Barcode render mode set: %s", mode)
+    
+    def set_dpi(self, dpi):
+        """
+        Set printer resolution that bar edges are snapped to in NATIVE mode
+        
+        Args:
+            dpi: Printer resolution in dots per inch, None disables snapping
+        """
+        self.dpi = dpi
+        logger.render.debug("Barcode DPI set: %s", dpi)
+    
+    @classmethod
+    def cache_stats(cls):
+        """
+        Get statistics of the shared barcode cache
+        
+        Returns:
+            Dict with hits, misses, evictions, size and maxsize
+        """
+        return cls.cache.stats()
+    
+    @classmethod
+    def set_cache_size(cls, maxsize):
+        """
+        Set maximum number of entries of the shared barcode cache
+        
+        Args:
+            maxsize: Maximum number of entries, 0 disables caching
+        """
+        cls.cache.resize(maxsize)
+        logger.debug("Barcode cache size set: %s", maxsize)
+    
+    @classmethod
+    def clear_cache(cls):
+        """Clear the shared barcode cache and its statistics"""
+        cls.cache.clear()
+    
+    def _get_cache_entry(self):
+        """
+        Get the shared cache entry for the current settings, building the barcode on a miss
         
-    def draw(self, canvas):
+        Returns:
+            Dict with the 'barcode' object, whether it is 'linear' and, for
+            widget based types, its 'bounds'
+        """
+        barcode_type = self.barcode_type.lower()
+        key = (barcode_type, self.data, self.width, self.height)
+        entry = self.cache.get(key)
+        if entry is None:
+            builder = self.BUILDERS.get(barcode_type)
+            if builder is None:
+                # Default to Code128
+                logger.warning(f"Unknown barcode type: {self.barcode_type}, using default type code128")
+                builder = self.BUILDERS['code128']
+            barcode = builder(self.data, self.width/150, self.height)
+            
+            # Widgets are scaled to the element size when drawn, their bounds are fixed
+            linear = isinstance(barcode, (code128.Code128, code39.Standard39))
+            bounds = None
+            if not linear and hasattr(barcode, 'getBounds'):
+                try:
+                    bounds = barcode.getBounds()
+                except Exception as e:
+                    logger.error(f"Failed to measure barcode component: {e}")
+            entry = {'barcode': barcode, 'bounds': bounds, 'linear': linear}
+            self.cache.put(key, entry)
+        return entry
+    
+    def draw(self, canvas, y=None):
         """
         Draw barcode on PDF canvas
         
         Args:
             canvas: reportlab Canvas object
+            y: Optional y coordinate of the bar bottoms, default is self.y
         """
-        logger.debug(f"Drawing barcode: '{self.data}', type: {self.barcode_type}, position: ({self.x}, {self.y})")
+        if y is None:
+            y = self.y
+        logger.render.debug("Drawing barcode: '%s', type: %s, position: (%s, %s)", self.data, self.barcode_type, self.x, y)
         try:
             # Save current graphics state
             canvas.saveState()
             
-            # Create barcode
-            if self.barcode_type.lower() == 'code39':
-                barcode = code39.Standard39(self.data, barWidth=self.width/150, barHeight=self.height)
-            elif self.barcode_type.lower() == 'code128':
-                barcode = code128.Code128(self.data, barWidth=self.width/150, barHeight=self.height)
-            elif self.barcode_type.lower() == 'ean13':
-                barcode = eanbc.Ean13BarcodeWidget(self.data, barWidth=self.width/150, barHeight=self.height)
-            elif self.barcode_type.lower() == 'ean8':
-                barcode = eanbc.Ean8BarcodeWidget(self.data, barWidth=self.width/150, barHeight=self.height)
-            elif self.barcode_type.lower() == 'upca':
-                barcode = eanbc.Ean13BarcodeWidget("0" + self.data, barWidth=self.width/150, barHeight=self.height)
-            elif self.barcode_type.lower() == 'datamatrix':
-                barcode = ecc200datamatrix.ECC200DataMatrix(self.data)
-            else:
-                # Default to Code128
-                logger.warning(f"Unknown barcode type: {self.barcode_type}, using default type code128")
-                barcode = code128.Code128(self.data, barWidth=self.width/150, barHeight=self.height)
+            # Get barcode from the shared cache
+            entry = self._get_cache_entry()
+            barcode = entry['barcode']
             
             # Set barcode color
             canvas.setFillColorRGB(*[x/255 for x in self.color])
             canvas.setStrokeColorRGB(*[x/255 for x in self.color])
             
             # Draw barcode - different types of barcodes have different drawing methods
-            if isinstance(barcode, code128.Code128) or isinstance(barcode, code39.Standard39):
-                # These types use direct drawing method
-                barcode.drawOn(canvas, self.x, self.y)
+            if self.render_mode == self.RENDER_MODE.NATIVE and entry['linear']:
+                self._draw_native(canvas, entry, y)
+            elif isinstance(barcode, code128.Code128) or isinstance(barcode, code39.Standard39):
+                # These types use direct drawing method. drawOn sets and removes
+                # the canvas on the barcode, so draw a copy of the shared object
+                copy.copy(barcode).drawOn(canvas, self.x, y)
             elif hasattr(barcode, 'draw'):
                 try:
                     # For components with draw method
-                    from reportlab.graphics import renderPDF
-                    d = barcode.getBounds()
+                    d = entry['bounds']
                     width = d[2] - d[0]
                     height = d[3] - d[1]
-                    renderPDF.draw(barcode, canvas, self.x, self.y, self.width/width, self.height/height)
+                    renderPDF.draw(barcode, canvas, self.x, y, self.width/width, self.height/height)
                 except Exception as e:
                     # Fallback method
                     logger.error(f"Failed to draw barcode component: {e}, using text fallback")
-                    canvas.drawString(self.x, self.y, f"BARCODE: {self.data}")
+                    canvas.drawString(self.x, y, f"BARCODE: {self.data}")
             else:
                 # For barcode types that don't support direct drawing
                 logger.warning(f"Barcode type not directly drawable: {self.barcode_type}, using text instead")
                 try:
-                    canvas.drawString(self.x, self.y, f"BARCODE: {self.data}")
+                    canvas.drawString(self.x, y, f"BARCODE: {self.data}")
                 except Exception as e:
                     logger.error(f"Barcode text fallback also failed: {e}")
             
@@ -204,13 +314,98 @@ class LabelBarcode:
                 # Draw text according to position
                 text_width = canvas.stringWidth(self.data, "Helvetica", self.text_size)
                 if self.text_location == self.TEXT.TOP:
-                    canvas.drawCentredString(self.x + self.width/2, self.y + self.height + 2, self.data)
+                    canvas.drawCentredString(self.x + self.width/2, y + self.height + 2, self.data)
                 elif self.text_location == self.TEXT.BOTTOM:
-                    canvas.drawCentredString(self.x + self.width/2, self.y - self.text_size - 2, self.data)
-                logger.debug(f"Drew barcode text: '{self.data}'")
+                    canvas.drawCentredString(self.x + self.width/2, y - self.text_size - 2, self.data)
+                logger.render.debug("Drew barcode text: '%s'", self.data)
             
             # Restore graphics state
             canvas.restoreState()
         except Exception as e:
             logger.error(f"Error drawing barcode: {e}")
             raise
+    
+    def _get_bars(self, entry, dpi):
+        """
+        Record the bar pattern of a cached barcode
+        
+        Without a DPI the pattern is
+        given in multiples of the bar width. With a DPI it is given in printer
+        dots: the module width is the bar width REPORTLAB mode draws with,
+        rounded to whole dots. Every bar and gap is then rounded in sequence,
+        so bars of the same module width always get the same number of dots
+        and the ink width stays within half a dot per module of REPORTLAB mode.
+        The leading quiet zone keeps its width in points, so the first bar
+        starts where REPORTLAB mode draws it.
+        
+        Args:
+            entry: Barcode cache entry
+            dpi: Printer resolution, None for an unsnapped pattern
+            
+        Returns:
+            List of (x, y, width, height) tuples in pattern units
+        """
+        # Draw a copy, the cached barcode may be shared with other threads
+        barcode = copy.copy(entry['barcode'])
+        barcode.canv = _BarRecorder()
+        barcode.draw()
+        bars = sorted(barcode.canv.bars)
+        
+        bar_width = entry['barcode'].barWidth
+        pattern = []
+        if dpi:
+            dot = 72.0 / dpi
+            dots_per_module = max(1, round(bar_width / dot))
+            position, end = (round(bars[0][0] / dot), bars[0][0]) if bars else (0, 0)
+            for x, y, width, height in bars:
+                left = position + round((x - end) / bar_width * dots_per_module)
+                right = left + max(1, round(width / bar_width * dots_per_module))
+                position, end = right, x + width
+                bottom = round(y / dot)
+                top = max(round((y + height) / dot), bottom + 1)
+                pattern.append((left, bottom, right - left, top - bottom))
+        else:
+            for x, y, width, height in bars:
+                pattern.append((round(x / bar_width, 4), round(y / bar_width, 4),
+                                round(width / bar_width, 4), round(height / bar_width, 4)))
+        return pattern
+    
+    def _draw_native(self, canvas, entry, y):
+        """
+        Draw a linear barcode as one filled path
+        
+        The path is written in units of the bar width, or of one printer dot
+        when a DPI is set, so the content stream holds short integer operands.
+        The symbol has the geometry REPORTLAB mode draws, quiet zones included.
+        
+        Args:
+            canvas: reportlab Canvas object
+            entry: Barcode cache entry
+            y: Y coordinate of the bar bottoms
+        """
+        if self.dpi:
+            unit = 72.0 / self.dpi
+            origin_x = round(self.x / unit) * unit
+            origin_y = round(y / unit) * unit
+        else:
+            unit = entry['barcode'].barWidth
+            origin_x, origin_y = self.x, y
+        
+        canvas.saveState()
+        canvas.transform(unit, 0, 0, unit, origin_x, origin_y)
+        if hasattr(canvas, 'addLiteral'):
+            # Path operators are formatted once per cache entry and resolution
+            paths = entry.setdefault('paths', {})
+            code = paths.get(self.dpi)
+            if code is None:
+                code = paths[self.dpi] = ' '.join(
+                    fp_str(x, y, width, height) + ' re' for x, y, width, height in self._get_bars(entry, self.dpi))
+            canvas.addLiteral(code)
+            canvas.addLiteral('f*')
+        else:
+            path = canvas.beginPath()
+            for x, y, width, height in self._get_bars(entry, self.dpi):
+                path.rect(x, y, width, height)
+            canvas.drawPath(path, fill=1, stroke=0)
+        canvas.restoreState()
+        logger.render.debug("Barcode drawn natively")
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+import threading
+
+class LRUCache:
+    """
+    Bounded, thread-safe cache with least-recently-used eviction
+    Used to share generated data (QR matrices, barcodes) across element instances
+    """
+    
+    def __init__(self, maxsize=1024):
+        """
+        Initialize cache
+        
+        Args:
+            maxsize: Maximum number of entries, 0 disables caching
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        """
+        Get cached value and mark it as recently used
+        
+        Args:
+            key: Cache key
+            default: Value returned when key is not cached
+            
+        Returns:
+            Cached value, or default on a miss
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key, value):
+        """
+        Store value, evicting the least recently used entries if full
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+    
+    def resize(self, maxsize):
+        """
+        Change maximum number of entries
+        
+        Args:
+            maxsize: New maximum number of entries
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+    
+    def clear(self):
+        """Remove all entries and reset statistics"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+    
+    def stats(self):
+        """
+        Get cache statistics
+        
+        Returns:
+            Dict with hits, misses, evictions, size and maxsize
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
+    
+    def _evict(self):
+        """Drop least recently used entries above maxsize (lock must be held)"""
+        while len(self._data) > max(self.maxsize, 0):
+            self._data.popitem(last=False)
+            self.evictions += 1
+    
+    def __len__(self):
+        return len(self._data)
+    
+    def __contains__(self, key):
+        return key in self._data
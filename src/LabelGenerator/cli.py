@@ -0,0 +1,169 @@
+import argparse
+import csv
+import importlib
+import importlib.util
+import os
+import sys
+import time
+from .logger import logger
+
+def load_template(spec):
+    """
+    Load a template object from a 'module:attribute' or 'path/to/file.py:attribute' spec
+    
+    Args:
+        spec: Template spec string
+        
+    Returns:
+        LabelTemplate object or callable taking a row dict and returning a LabelPage
+    """
+    module_name, sep, attribute = spec.rpartition(':')
+    if not sep or not module_name or not attribute:
+        raise ValueError(f"Template must be given as 'module:attribute' or 'file.py:attribute': {spec}")
+    
+    if module_name.endswith('.py') or os.sep in module_name or '/' in module_name:
+        # Load template module from a file path
+        path = os.path.abspath(module_name)
+        name = '_labelgen_template_' + os.path.splitext(os.path.basename(path))[0]
+        module_spec = importlib.util.spec_from_file_location(name, path)
+        if module_spec is None:
+            raise ValueError(f"Cannot load template file: {module_name}")
+        module = importlib.util.module_from_spec(module_spec)
+        sys.modules[name] = module
+        module_spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(module_name)
+    
+    try:
+        return getattr(module, attribute)
+    except AttributeError:
+        raise ValueError(f"Template module {module_name} has no attribute {attribute}")
+
+def iter_pages(template, rows):
+    """
+    Generate pages from a template object and row dicts
+    
+    Args:
+        template: LabelTemplate object or callable taking a row dict
+        rows: Iterable of row dicts
+        
+    Returns:
+        Generator of LabelPage objects
+    """
+    if hasattr(template, 'pages'):
+        return template.pages(rows)
+    if callable(template):
+        return (template(row) for row in rows)
+    raise ValueError(f"Template object is neither a LabelTemplate nor callable: {template!r}")
+
+def _with_progress(pages, every, stream=None):
+    """
+    Pass pages through, reporting progress every N pages
+    
+    Args:
+        pages: Iterable of pages
+        every: Report interval in pages, 0 disables progress output
+        stream: Output stream for progress lines, default is stderr
+    """
+    stream = stream or sys.stderr
+    start = time.perf_counter()
+    count = 0
+    for page in pages:
+        count += 1
+        if every and count % every == 0:
+            elapsed = time.perf_counter() - start
+            stream.write(f"{count} labels, {count / elapsed:.0f} labels/s\n")
+            stream.flush()
+        yield page
+    if every:
+        elapsed = time.perf_counter() - start
+        rate = count / elapsed if elapsed else 0
+        stream.write(f"Done: {count} labels in {elapsed:.1f}s ({rate:.0f} labels/s)\n")
+        stream.flush()
+
+def build_parser():
+    """Build the labelgen argument parser"""
+    parser = argparse.ArgumentParser(
+        prog='labelgen',
+        description='Render labels from a CSV file through a template into a PDF file',
+    )
+    parser.add_argument('template',
+                        help="template as 'module:attribute' or 'file.py:attribute', "
+                             "a LabelTemplate or a callable taking a row dict and returning a LabelPage")
+    parser.add_argument('csv', help="input CSV file, '-' reads from stdin")
+    parser.add_argument('-o', '--output',
+                        help="output PDF file, '-' writes to stdout, default is the CSV name with .pdf")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of worker processes, 0 uses all CPUs (default: 1)')
+    parser.add_argument('--chunk-size', type=int, default=256,
+                        help='pages rendered per worker task when --jobs is not 1 (default: 256)')
+    parser.add_argument('--encoding', default='utf-8-sig', help='CSV file encoding (default: utf-8-sig)')
+    parser.add_argument('--delimiter', default=',', help='CSV field delimiter (default: ,)')
+    parser.add_argument('--progress', type=int, default=1000, metavar='N',
+                        help='report progress every N labels on stderr, 0 disables (default: 1000)')
+    parser.add_argument('--log-level', default='warning',
+                        choices=sorted(logger.LOG_LEVELS), help='log level (default: warning)')
+    return parser
+
+def main(argv=None):
+    """
+    labelgen command line entry point
+    
+    Args:
+        argv: Argument list, default is sys.argv[1:]
+        
+    Returns:
+        Process exit code
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    logger.set_level(args.log_level)
+    # Per-element messages are only wanted when debugging
+    logger.set_quiet_render(args.log_level != 'debug')
+    
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    
+    output = args.output
+    if output is None:
+        if args.csv == '-':
+            parser.error("--output is required when reading from stdin")
+        output = os.path.splitext(args.csv)[0] + '.pdf'
+    elif output == '-':
+        # PDF bytes go to stdout, progress and log messages to stderr
+        logger.console_handler.setStream(sys.stderr)
+        output = sys.stdout.buffer
+    
+    try:
+        template = load_template(args.template)
+    except (ImportError, OSError, ValueError) as e:
+        parser.error(str(e))
+    
+    # Imported here so that argument errors do not pay for loading ReportLab
+    from .document import LabelDocument
+    
+    if args.csv == '-':
+        csv_file = sys.stdin
+    else:
+        csv_file = open(args.csv, newline='', encoding=args.encoding)
+    
+    try:
+        rows = csv.DictReader(csv_file, delimiter=args.delimiter)
+        pages = _with_progress(iter_pages(template, rows), args.progress)
+        document = LabelDocument()
+        if args.jobs == 1:
+            document.export_stream(pages, output)
+        else:
+            document.export_parallel(pages, output, jobs=args.jobs or None, chunk_size=args.chunk_size)
+    except Exception as e:
+        sys.stderr.write(f"labelgen: error: {e}\n")
+        return 1
+    finally:
+        if csv_file is not sys.stdin:
+            csv_file.close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
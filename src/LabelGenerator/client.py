@@ -0,0 +1,171 @@
+import json
+import os
+import socket
+import tempfile
+
+# Socket path used by labelgend and DaemonClient when none is given
+DEFAULT_SOCKET = os.environ.get('LABELGEN_SOCKET') or os.path.join(
+    tempfile.gettempdir(), f"labelgen-{os.getuid() if hasattr(os, 'getuid') else 0}.sock")
+
+class DaemonError(RuntimeError):
+    """A render job was rejected or failed in the daemon"""
+
+def read_message(stream, payload=True):
+    """
+    Read one message from a daemon connection
+
+    A message is a JSON object header line, followed by 'length' bytes of
+    payload when the header has a non-zero length.
+
+    Args:
+        stream: Binary file object of the connection
+        payload: Whether to read the payload, False ignores the 'length' of the header
+
+    Returns:
+        (header dict, payload bytes) tuple, or (None, None) when the connection is closed
+
+    Raises:
+        ValueError: The header line is not a JSON object
+    """
+    line = stream.readline()
+    if not line:
+        return None, None
+    header = json.loads(line)
+    if not isinstance(header, dict):
+        raise ValueError("Message header is not a JSON object")
+    if not payload:
+        return header, b''
+    length = header.get('length', 0)
+    data = stream.read(length) if length else b''
+    if len(data) != length:
+        raise ConnectionError("Connection closed in the middle of a message")
+    return header, data
+
+def write_message(stream, header, payload=b''):
+    """
+    Write one message to a daemon connection
+
+    Args:
+        stream: Binary file object of the connection
+        header: JSON serializable dict, 'length' is set from the payload
+        payload: Optional payload bytes
+    """
+    header = dict(header, length=len(payload))
+    stream.write(json.dumps(header, ensure_ascii=False).encode('utf-8') + b'\n')
+    if payload:
+        stream.write(payload)
+    stream.flush()
+
+class DaemonClient:
+    """
+    Client for the labelgend render daemon
+
+    The connection is opened on the first job and reused for all following
+    jobs. One client should only be used by one thread at a time.
+    This module only uses the standard library, so clients do not pay for
+    importing ReportLab.
+    """
+
+    def __init__(self, socket_path=None, timeout=None):
+        """
+        Initialize daemon client
+
+        Args:
+            socket_path: Daemon Unix socket path, default is DEFAULT_SOCKET
+            timeout: Socket timeout in seconds, None waits forever
+        """
+        self.socket_path = socket_path or DEFAULT_SOCKET
+        self.timeout = timeout
+        self._socket = None
+        self._stream = None
+        self._next_id = 0
+
+    def connect(self):
+        """Open the connection if it is not open yet"""
+        if self._socket is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+            self._socket = sock
+            self._stream = sock.makefile('rwb')
+
+    def close(self):
+        """Close the connection"""
+        if self._socket is not None:
+            try:
+                self._stream.close()
+            finally:
+                self._socket.close()
+                self._socket = None
+                self._stream = None
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def request(self, job):
+        """
+        Send a job description and wait for its result
+
+        Args:
+            job: Job dict as described in RenderDaemon
+
+        Returns:
+            (header dict, payload bytes) tuple of the response
+        """
+        self.connect()
+        self._next_id += 1
+        job = dict(job)
+        job.setdefault('id', self._next_id)
+        try:
+            write_message(self._stream, job)
+            header, payload = read_message(self._stream)
+        except (OSError, ValueError):
+            # The connection is in an unknown state after a failed exchange
+            self.close()
+            raise
+        if header is None:
+            self.close()
+            raise ConnectionError("Daemon closed the connection")
+        if not header.get('ok'):
+            raise DaemonError(header.get('error', 'Unknown daemon error'))
+        return header, payload
+
+    def render(self, template, rows, format='pdf', output=None, dpi=None):
+        """
+        Render rows through a template loaded by the daemon
+
+        Args:
+            template: Template name the daemon was started with
+            rows: List of row dicts
+            format: Output format, 'pdf', 'zpl' or 'pbm'
+            output: Optional file path written by the daemon instead of returning the data
+            dpi: Printer resolution for 'zpl' and 'pbm' output
+
+        Returns:
+            Rendered document bytes, or the output path when output is given
+        """
+        job = {'template': template, 'rows': list(rows), 'format': format}
+        if output is not None:
+            job['output'] = os.path.abspath(output)
+        if dpi is not None:
+            job['dpi'] = dpi
+        header, payload = self.request(job)
+        return header['output'] if output is not None else payload
+
+    def stats(self):
+        """
+        Get daemon statistics
+
+        Returns:
+            Dict with the served job count, worker count and template names
+        """
+        header, _ = self.request({'command': 'stats'})
+        return header['stats']
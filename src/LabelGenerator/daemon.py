@@ -0,0 +1,381 @@
+import argparse
+import errno
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from .logger import logger
+from .client import DEFAULT_SOCKET, read_message, write_message
+
+# Templates and renderers of a worker process, filled by _init_daemon_worker
+_templates = {}
+_renderers = {}
+
+def _load_templates(specs):
+    """
+    Load templates into this process
+
+    Args:
+        specs: Dict mapping template name to 'module:attribute' or 'file.py:attribute' spec
+    """
+    from .cli import load_template
+    for name, spec in specs.items():
+        if name not in _templates:
+            _templates[name] = load_template(spec)
+
+def _init_daemon_worker(specs, font_files):
+    """
+    Register fonts and load templates once per daemon worker process
+
+    Workers started with fork inherit both from the daemon process, so this
+    only does work on platforms that spawn fresh interpreters.
+
+    Args:
+        specs: Dict mapping template name to template spec
+        font_files: Dict mapping registration name to font file path
+    """
+    from .document import _init_export_worker
+    _init_export_worker(font_files)
+    _load_templates(specs)
+
+def _warm_worker():
+    """Task run once per worker at startup, so workers exist before the first job"""
+    return os.getpid()
+
+def _get_renderer(format, dpi):
+    """Get a cached ZPL or raster renderer of this worker, keeping its caches warm"""
+    key = (format, dpi)
+    renderer = _renderers.get(key)
+    if renderer is None:
+        if format == 'zpl':
+            from .zpl import ZPLRenderer
+            renderer = ZPLRenderer(dpi=dpi)
+        else:
+            from .raster import RasterRenderer
+            renderer = RasterRenderer(dpi=dpi)
+        _renderers[key] = renderer
+    return renderer
+
+def _render_job(template_name, rows, format, dpi, output):
+    """
+    Render one job (runs in a worker process)
+
+    Args:
+        template_name: Name of a loaded template
+        rows: List of row dicts
+        format: 'pdf', 'zpl' or 'pbm'
+        dpi: Printer resolution for 'zpl' and 'pbm'
+        output: Output file path, None returns the data
+
+    Returns:
+        (page count, payload bytes) tuple, the payload is empty when output is given
+    """
+    from .cli import iter_pages
+    from .document import LabelDocument
+    template = _templates[template_name]
+
+    count = 0
+    def counted(pages):
+        nonlocal count
+        for count, page in enumerate(pages, 1):
+            yield page
+
+    pages = counted(iter_pages(template, rows))
+    target = output if output is not None else BytesIO()
+    if format == 'pdf':
+        LabelDocument().export_stream(pages, target)
+    else:
+        _get_renderer(format, dpi).export(pages, target)
+    return count, b'' if output is not None else target.getvalue()
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    """Serves newline-delimited JSON jobs of one client connection"""
+
+    def handle(self):
+        daemon = self.server.render_daemon
+        while True:
+            try:
+                # Jobs carry no payload, a 'length' sent by the client is ignored
+                job, _ = read_message(self.rfile, payload=False)
+            except ValueError as e:
+                # Jobs are single lines, so the connection stays usable
+                write_message(self.wfile, {'ok': False, 'error': f"Invalid job: {e}"})
+                continue
+            if job is None:
+                return
+            write_message(self.wfile, *daemon.handle_job(job))
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+class RenderDaemon:
+    """
+    Resident render server with warm fonts and templates
+
+    The daemon loads its templates, and with them the fonts they register,
+    once at startup and renders jobs in a pool of worker processes that
+    keep them loaded. Clients connect to a local Unix socket and send one
+    JSON job per line:
+
+        {"id": 1, "template": "asset", "rows": [{...}], "format": "pdf"}
+
+    'format' is 'pdf' (default), 'zpl' or 'pbm', 'dpi' sets the printer
+    resolution of the last two and 'output' makes the daemon write a file
+    instead of returning the data. Each job is answered with a JSON line
+    {"id": 1, "ok": true, "pages": 1, "length": N} followed by N bytes of
+    output, or {"id": 1, "ok": false, "error": "..."}. The job
+    {"command": "stats"} returns daemon statistics. Lines that are not JSON
+    objects are answered with an error, jobs never carry a payload.
+
+    Only templates given at startup can be used, jobs cannot load code.
+    """
+
+    FORMATS = ('pdf', 'zpl', 'pbm')
+
+    def __init__(self, templates, socket_path=None, jobs=None):
+        """
+        Initialize render daemon
+
+        Args:
+            templates: Dict mapping template name to 'module:attribute' or 'file.py:attribute' spec
+            socket_path: Unix socket path, default is DEFAULT_SOCKET
+            jobs: Number of worker processes, default is the CPU count
+        """
+        self.templates = dict(templates)
+        self.socket_path = socket_path or DEFAULT_SOCKET
+        self.jobs = jobs or os.cpu_count() or 1
+        self.served = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+        self._executor = None
+        self._server = None
+        self._serving = False
+
+    def start(self):
+        """
+        Load templates, start the worker pool and bind the socket
+
+        Workers are started before the socket accepts connections, so the
+        first job does not pay for process startup.
+
+        Raises:
+            OSError: Another daemon is listening on the socket
+        """
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+            except OSError:
+                # Left behind by a daemon that did not shut down cleanly
+                os.unlink(self.socket_path)
+            else:
+                raise OSError(errno.EADDRINUSE, "Another render daemon is listening", self.socket_path)
+            finally:
+                probe.close()
+
+        # Loaded here first, so forked workers inherit parsed fonts and templates
+        _load_templates(self.templates)
+        self._executor = self._start_workers()
+
+        self._server = _Server(self.socket_path, _JobHandler)
+        self._server.render_daemon = self
+        # Only the owner may submit jobs
+        os.chmod(self.socket_path, 0o600)
+        logger.info("Render daemon listening on %s, workers: %s, templates: %s",
+                    self.socket_path, self.jobs, ", ".join(self.templates))
+
+    def _start_workers(self):
+        """
+        Start the worker pool and wait until every worker is running
+
+        Returns:
+            ProcessPoolExecutor of the workers
+        """
+        from .fonts import font_manager
+        executor = ProcessPoolExecutor(max_workers=self.jobs,
+                                       initializer=_init_daemon_worker,
+                                       initargs=(self.templates, dict(font_manager.registered_fonts)))
+        for future in [executor.submit(_warm_worker) for _ in range(self.jobs)]:
+            future.result()
+        return executor
+
+    def _restart_workers(self, broken):
+        """
+        Replace a broken worker pool, once for all jobs that found it broken
+
+        Args:
+            broken: The executor the failed job was submitted to
+        """
+        with self._pool_lock:
+            if self._executor is broken:
+                logger.warning("A render worker died, restarting %s workers", self.jobs)
+                broken.shutdown(wait=False)
+                self._executor = self._start_workers()
+
+    def serve_forever(self):
+        """Serve jobs until stop() is called"""
+        if self._server is None:
+            self.start()
+        self._serving = True
+        try:
+            self._server.serve_forever()
+        finally:
+            self._serving = False
+
+    def stop(self):
+        """Stop serving, shut down the worker pool and remove the socket"""
+        if self._server is not None:
+            if self._serving:
+                self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        logger.info("Render daemon stopped after %s jobs", self.served)
+
+    def stats(self):
+        """
+        Get daemon statistics
+
+        Returns:
+            Dict with served and failed job counts, worker count and template names
+        """
+        return {'served': self.served, 'failed': self.failed, 'jobs': self.jobs,
+                'templates': sorted(self.templates)}
+
+    def handle_job(self, job):
+        """
+        Run one job description on the worker pool
+
+        Args:
+            job: Job dict received from a client
+
+        Returns:
+            (response header, payload bytes) tuple
+        """
+        header = {'id': job.get('id')}
+        if job.get('command') == 'stats':
+            return dict(header, ok=True, stats=self.stats()), b''
+        try:
+            template = job.get('template')
+            if template not in self.templates:
+                raise ValueError(f"Unknown template: {template}")
+            format = job.get('format', 'pdf')
+            if format not in self.FORMATS:
+                raise ValueError(f"Unknown format: {format}")
+            rows = job.get('rows', [])
+            if not isinstance(rows, list):
+                raise ValueError("rows must be a list of objects")
+            output = job.get('output')
+            args = (template, rows, format, int(job.get('dpi', 203)), output)
+            # A worker killed by a crash or the OOM killer breaks the whole pool.
+            # The pool is rebuilt and the job retried once, a job that kills
+            # its worker again fails alone
+            for attempt in range(2):
+                executor = self._executor
+                try:
+                    pages, payload = executor.submit(_render_job, *args).result()
+                    break
+                except BrokenProcessPool:
+                    self._restart_workers(executor)
+                    if attempt:
+                        raise
+        except Exception as e:
+            logger.error("Render job %s failed: %s", header['id'], e)
+            with self._lock:
+                self.failed += 1
+            return dict(header, ok=False, error=str(e)), b''
+
+        with self._lock:
+            self.served += 1
+        logger.render.debug("Render job %s: %s pages", header['id'], pages)
+        header.update(ok=True, pages=pages, format=format)
+        if output is not None:
+            header['output'] = output
+        return header, payload
+
+def build_parser():
+    """Build the labelgend argument parser"""
+    parser = argparse.ArgumentParser(
+        prog='labelgend',
+        description='Resident label render daemon serving JSON jobs over a Unix socket',
+    )
+    parser.add_argument('-t', '--template', action='append', required=True, metavar='[NAME=]SPEC',
+                        help="template to load, as 'module:attribute' or 'file.py:attribute', "
+                             "optionally named; can be given several times")
+    parser.add_argument('-s', '--socket', default=DEFAULT_SOCKET,
+                        help=f'Unix socket path (default: {DEFAULT_SOCKET})')
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='number of worker processes, 0 uses all CPUs (default: 0)')
+    parser.add_argument('--log-level', default='info',
+                        choices=sorted(logger.LOG_LEVELS), help='log level (default: info)')
+    return parser
+
+def parse_templates(values):
+    """
+    Parse '[NAME=]SPEC' template arguments
+
+    Args:
+        values: List of argument strings
+
+    Returns:
+        Dict mapping template name to spec, unnamed templates are named by their spec
+    """
+    templates = {}
+    for value in values:
+        name, sep, spec = value.partition('=')
+        if not sep:
+            name, spec = value, value
+        templates[name] = spec
+    return templates
+
+def main(argv=None):
+    """
+    labelgend command line entry point
+
+    Args:
+        argv: Argument list, default is sys.argv[1:]
+
+    Returns:
+        Process exit code
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    logger.set_level(args.log_level)
+    logger.set_quiet_render(args.log_level != 'debug')
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative")
+    if not hasattr(socketserver, 'UnixStreamServer'):
+        parser.error("Unix sockets are not supported on this platform")
+
+    daemon = RenderDaemon(parse_templates(args.template), args.socket, jobs=args.jobs or None)
+    try:
+        daemon.start()
+    except (ImportError, OSError, ValueError) as e:
+        sys.stderr.write(f"labelgend: error: {e}\n")
+        return 1
+
+    def terminate(signum, frame):
+        # shutdown() blocks until serve_forever returns, so it runs on another thread
+        threading.Thread(target=daemon._server.shutdown, daemon=True).start()
+    signal.signal(signal.SIGTERM, terminate)
+
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
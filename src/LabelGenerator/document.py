@@ -1,7 +1,102 @@
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+import itertools
 import os
+import pickle
 from .logger import logger
+from .fonts import font_manager
+
+
+def _init_export_worker(font_files):
+    """
+    Reset logging and register fonts once per export worker process
+    
+    Args:
+        font_files: Dict mapping registration name to font file path
+    """
+    # Queued log records would never be written by this process
+    logger.reset_after_fork()
+    _register_worker_fonts(font_files)
+
+
+def _register_worker_fonts(font_files):
+    """
+    Register the fonts a worker process does not know yet
+    
+    Args:
+        font_files: Dict mapping registration name to font file path
+    """
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    
+    registered = set(pdfmetrics.getRegisteredFontNames())
+    for reg_name, font_path in font_files.items():
+        if reg_name not in registered:
+            try:
+                pdfmetrics.registerFont(TTFont(reg_name, font_path))
+            except Exception as e:
+                logger.warning(f"Worker failed to register font {reg_name}: {e}")
+
+
+def _prepare_output(target):
+    """
+    Create the directory of an output filename
+    
+    Args:
+        target: Output filename, or a writable binary stream which is used as is
+    """
+    if hasattr(target, 'write'):
+        return
+    directory = os.path.dirname(target)
+    if directory and not os.path.exists(directory):
+        logger.debug("Creating directory: %s", directory)
+        os.makedirs(directory, exist_ok=True)
+
+
+def _uses_workers(jobs, profiler=None):
+    """
+    Check whether an export renders on worker processes
+    
+    Args:
+        jobs: Number of worker processes, None or 1 renders in this process
+        profiler: Optional ExportProfiler, which only works in this process
+        
+    Returns:
+        True when jobs asks for worker processes
+    """
+    parallel = jobs is not None and jobs != 1
+    if parallel and profiler is not None:
+        raise ValueError("A profiler can only be used with single process export (jobs=None or 1)")
+    return parallel
+
+
+def _render_chunk(pagesize, page_data, font_files=None):
+    """
+    Render a chunk of pickled pages into PDF bytes (runs in a worker process)
+    
+    Args:
+        pagesize: Document page size
+        page_data: List of pickled LabelPage objects
+        font_files: Optional dict mapping registration name to font file path,
+                    fonts registered after the worker started are registered here
+        
+    Returns:
+        PDF document bytes
+    """
+    if font_files:
+        _register_worker_fonts(font_files)
+    buffer = BytesIO()
+    document = LabelDocument(pagesize)
+    c = canvas.Canvas(buffer, pagesize=pagesize)
+    forms = {}
+    for i, data in enumerate(page_data):
+        document._draw_page(c, pickle.loads(data), i + 1, forms)
+        c.showPage()
+    c.save()
+    return buffer.getvalue()
+
 
 class LabelDocument:
     """
@@ -20,7 +115,7 @@ class LabelDocument:
         # ReportLab uses points as units, 1 point = 1/72 inch, approx 0.35mm
         width_mm = round(self.pagesize[0] * 25.4 / 72, 1)
         height_mm = round(self.pagesize[1] * 25.4 / 72, 1)
-        logger.info(f"Created new label document, size: {width_mm} mm × {height_mm} mm")
+        logger.info("Created new label document, size: %s mm × %s mm", width_mm, height_mm)
         
     def add_page(self, page):
         """
@@ -30,74 +125,421 @@ class LabelDocument:
             page: LabelPage object
         """
         self.pages.append(page)
-        logger.debug(f"Page added to document, current page count: {len(self.pages)}")
+        logger.render.debug("Page added to document, current page count: %s", len(self.pages))
         
-    def export_pdf(self, filename):
+    def export_pdf(self, filename, jobs=None, profiler=None):
         """
         Export document as PDF file
         
         Args:
-            filename: Output PDF filename
+            filename: Output PDF filename or writable binary stream
+            jobs: Number of worker processes, None or 1 renders in this process
+            profiler: Optional ExportProfiler recording timings, single process export only
+            
+        Raises:
+            ValueError: A profiler was given together with worker processes
         """
-        logger.info(f"Starting PDF export: {filename}")
+        if _uses_workers(jobs, profiler):
+            return self.export_parallel(self.pages, filename, jobs=jobs)
+        return self.export_stream(self.pages, filename, profiler=profiler)
+    
+    def export_bytes(self, pages=None, jobs=None, profiler=None):
+        """
+        Export pages as PDF and return the document in memory
+        
+        Args:
+            pages: Iterable or generator of LabelPage objects, default is the document pages
+            jobs: Number of worker processes, None or 1 renders in this process
+            profiler: Optional ExportProfiler recording timings, single process export only
+            
+        Returns:
+            PDF document as bytes
+            
+        Raises:
+            ValueError: A profiler was given together with worker processes
+        """
+        if pages is None:
+            pages = self.pages
+        output = BytesIO()
+        if _uses_workers(jobs, profiler):
+            self.export_parallel(pages, output, jobs=jobs)
+        else:
+            self.export_stream(pages, output, profiler=profiler)
+        return output.getvalue()
+    
+    async def export_async(self, filename=None, pages=None, jobs=None, exporter=None):
+        """
+        Export pages as PDF without blocking the asyncio event loop
+        
+        Rendering runs on the loop's default executor, or on the executor of
+        the given AsyncExporter, which also bounds the number of concurrent
+        exports. Cancelling the awaiting task stops rendering before the next page.
+        
+        Args:
+            filename: Output PDF filename or writable binary stream, None returns the PDF bytes
+            pages: Iterable or generator of LabelPage objects, default is the document pages
+            jobs: Number of worker processes, None or 1 renders on the executor thread
+            exporter: Optional AsyncExporter holding the executor and concurrency limit
+            
+        Returns:
+            Output PDF filename or stream, or PDF bytes when filename is None
+        """
+        from .aio import AsyncExporter
+        if exporter is None:
+            exporter = AsyncExporter()
+        return await exporter.export(self, pages, filename, jobs=jobs)
+    
+    def export_stream(self, pages, filename, profiler=None):
+        """
+        Export pages from any iterable as PDF file
+        
+        Each page is drawn as soon as it is produced and is not referenced
+        afterwards, so a generator of pages can be exported without holding
+        the whole document in memory.
+        
+        Args:
+            pages: Iterable or generator of LabelPage objects
+            filename: Output PDF filename or writable binary stream
+            profiler: Optional ExportProfiler recording stage, page and element timings
+            
+        Returns:
+            Output PDF filename or stream
+        """
+        logger.info("Starting PDF export: %s", filename)
         
         try:
             # Ensure directory exists
-            directory = os.path.dirname(filename)
-            if directory and not os.path.exists(directory):
-                logger.debug(f"Creating directory: {directory}")
-                os.makedirs(directory)
-                
+            _prepare_output(filename)
+            
             # Create PDF canvas
+            if profiler is not None:
+                start = profiler.clock()
             c = canvas.Canvas(filename, pagesize=self.pagesize)
+            if profiler is not None:
+                profiler.record(profiler.STAGE, 'canvas', profiler.clock() - start)
             
             # Process each page
-            for i, page in enumerate(self.pages):
-                logger.debug(f"Processing page {i+1}...")
-                # Set page size
-                c.setPageSize((page.width, page.height))
-                
-                # Draw page background
-                if page.background_color:
-                    logger.debug(f"Drawing page background, color: {page.background_color}")
-                    c.setFillColorRGB(*[x/255 for x in page.background_color])
-                    c.rect(0, 0, page.width, page.height, fill=1, stroke=0)
-                
-                # Draw all elements on the page
-                for j, element in enumerate(page.elements):
-                    logger.debug(f"Drawing element {j+1} on page {i+1}")
-                    # Save current graphics state
-                    c.saveState()
-                    
-                    # Coordinate conversion - convert from top-left to ReportLab's bottom-left
-                    # If element uses top-left coordinate system, we only need to convert y coordinate
-                    y_position = page.height - element.y
-                    
-                    # Temporarily save original coordinates
-                    original_x, original_y = element.x, element.y
-                    
-                    # Set converted coordinates
-                    element.y = y_position
+            page_count = 0
+            forms = {}
+            for page in pages:
+                page_count += 1
+                logger.render.debug("Processing page %s...", page_count)
+                if profiler is None:
+                    self._draw_page(c, page, page_count, forms)
                     
-                    try:
-                        # Draw element
-                        element.draw(c)
-                    except Exception as e:
-                        logger.error(f"Failed to draw element: {e}")
-                    
-                    # Restore original coordinates (for potential reuse of element)
-                    element.x, element.y = original_x, original_y
-                    
-                    # Restore graphics state
-                    c.restoreState()
-                
-                # End current page, start new page
-                c.showPage()
+                    # End current page, start new page
+                    c.showPage()
+                else:
+                    start = profiler.clock()
+                    self._draw_page(c, page, page_count, forms, profiler)
+                    drawn = profiler.clock()
+                    c.showPage()
+                    end = profiler.clock()
+                    profiler.record(profiler.STAGE, 'draw', drawn - start)
+                    profiler.record(profiler.STAGE, 'show_page', end - drawn)
+                    profiler.record(profiler.PAGE, page_count, end - start)
             
             # Save PDF
+            if profiler is not None:
+                start = profiler.clock()
             c.save()
-            logger.info(f"PDF exported successfully: {filename}")
+            if profiler is not None:
+                profiler.record(profiler.STAGE, 'save', profiler.clock() - start)
+            logger.info("PDF exported successfully: %s, pages: %s", filename, page_count)
             return filename
         except Exception as e:
             logger.exception(f"PDF export failed: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    def export_parallel(self, pages, filename, jobs=None, chunk_size=256):
+        """
+        Export pages as PDF file, rendering chunks of pages in worker processes
+        
+        Pages are split into chunks of chunk_size, each chunk is rendered to a
+        separate PDF by a worker process and the results are merged into one
+        PDF in the original page order. Fonts registered in this process are
+        registered once per worker, fonts registered while pages are generated
+        are sent along with the chunks that follow. Requires the optional pypdf package, falls
+        back to export_stream when it is not installed.
+        
+        Args:
+            pages: Iterable or generator of LabelPage objects
+            filename: Output PDF filename or writable binary stream
+            jobs: Number of worker processes, default is the CPU count
+            chunk_size: Number of pages rendered per worker task
+            
+        Returns:
+            Output PDF filename or stream
+        """
+        try:
+            from pypdf import PdfReader, PdfWriter
+        except ImportError:
+            logger.warning("pypdf is not installed, falling back to single process export")
+            return self.export_stream(pages, filename)
+        
+        jobs = jobs or os.cpu_count() or 1
+        logger.info("Starting parallel PDF export: %s, jobs: %s, chunk size: %s", filename, jobs, chunk_size)
+        
+        try:
+            # Ensure directory exists
+            _prepare_output(filename)
+            
+            # Pages are pickled as soon as they are produced, so generators that
+            # reuse and refill the same page object still yield distinct pages.
+            # The font map is taken after the chunk, as generating it may register fonts
+            def chunks():
+                iterator = iter(pages)
+                while True:
+                    chunk = [pickle.dumps(page) for page in itertools.islice(iterator, chunk_size)]
+                    if not chunk:
+                        return
+                    yield chunk, dict(font_manager.registered_fonts)
+            
+            writer = PdfWriter()
+            page_count = 0
+            with ProcessPoolExecutor(max_workers=jobs,
+                                     initializer=_init_export_worker,
+                                     initargs=(dict(font_manager.registered_fonts),)) as executor:
+                # Keep a bounded number of chunks in flight and merge them in order
+                pending = []
+                for chunk, font_files in chunks():
+                    pending.append(executor.submit(_render_chunk, self.pagesize, chunk, font_files))
+                    if len(pending) >= jobs * 2:
+                        page_count += self._merge_chunk(writer, PdfReader, pending.pop(0))
+                for future in pending:
+                    page_count += self._merge_chunk(writer, PdfReader, future)
+            
+            writer.write(filename)
+            logger.info("PDF exported successfully: %s, pages: %s", filename, page_count)
+            return filename
+        except Exception as e:
+            logger.exception(f"Parallel PDF export failed: {e}")
+            raise
+    
+    def export_imposed(self, pages, filename, layout):
+        """
+        Export pages tiled onto sheets, several labels per PDF page
+        
+        Each label is drawn through a translation into its grid cell and
+        clipped to the cell, static layers are shared as with export_stream.
+        
+        Args:
+            pages: Iterable or generator of LabelPage objects
+            filename: Output PDF filename or writable binary stream
+            layout: SheetLayout object describing sheet, grid and cut marks
+            
+        Returns:
+            Output PDF filename or stream
+        """
+        logger.info("Starting imposed PDF export: %s, %s labels per sheet", filename, layout.per_sheet)
+        try:
+            _prepare_output(filename)
+            
+            c = canvas.Canvas(filename, pagesize=layout.size)
+            positions = layout.positions()
+            cell_width, cell_height = layout.label_size
+            marks = layout.cut_mark_lines() if layout.cut_marks else None
+            forms = {}
+            label_count = 0
+            sheet_count = 0
+            slot = 0
+            for page in pages:
+                label_count += 1
+                if slot == 0:
+                    sheet_count += 1
+                    if marks:
+                        c.setLineWidth(0.25)
+                        c.setStrokeColorRGB(0, 0, 0)
+                        c.lines(marks)
+            
+                x, y = positions[slot]
+                c.saveState()
+                c.translate(x, y)
+                clip = c.beginPath()
+                clip.rect(0, 0, cell_width, cell_height)
+                c.clipPath(clip, stroke=0, fill=0)
+                # Pages are laid out from the top of their cell
+                c.translate(0, cell_height - page.height)
+                self._draw_tile(c, page, label_count, forms)
+                c.restoreState()
+            
+                slot += 1
+                if slot == len(positions):
+                    c.showPage()
+                    slot = 0
+            if slot:
+                c.showPage()
+            c.save()
+            
+            logger.info("Imposed PDF export completed, %s labels on %s sheets: %s", label_count, sheet_count, filename)
+            return filename
+        except Exception as e:
+            logger.exception(f"Imposed PDF export failed: {e}")
+            raise
+    
+    def export_raster(self, pages, filename, dpi=203):
+        """
+        Export pages as 1-bit images for thermal printers, without building a PDF
+        
+        Args:
+            pages: Iterable or generator of LabelPage objects
+            filename: Numbered filename pattern such as 'labels/{:06d}.png',
+                      or a '.pbm' file or writable binary stream holding all
+                      labels as PBM images
+            dpi: Printer resolution in dots per inch
+            
+        Returns:
+            Number of rendered labels
+        """
+        from .raster import RasterRenderer
+        return RasterRenderer(dpi=dpi).export(pages, filename)
+    
+    def export_zpl(self, pages, filename, dpi=203, fonts=None):
+        """
+        Export pages as a ZPL job for Zebra-compatible printers
+        
+        Args:
+            pages: Iterable or generator of LabelPage objects
+            filename: Output ZPL filename or writable binary stream
+            dpi: Printer resolution in dots per inch
+            fonts: Optional dict mapping font names to printer font files
+            
+        Returns:
+            Number of exported labels
+        """
+        from .zpl import ZPLRenderer
+        return ZPLRenderer(dpi=dpi, fonts=fonts).export(pages, filename)
+    
+    def _merge_chunk(self, writer, reader_class, future):
+        """
+        Append the pages of a rendered chunk to the PDF writer
+        
+        Args:
+            writer: pypdf PdfWriter object
+            reader_class: pypdf PdfReader class
+            future: Future returning the chunk PDF bytes
+            
+        Returns:
+            Number of pages appended
+        """
+        reader = reader_class(BytesIO(future.result()))
+        for pdf_page in reader.pages:
+            writer.add_page(pdf_page)
+        logger.debug("Merged chunk with %s pages", len(reader.pages))
+        return len(reader.pages)
+    
+    def _draw_page(self, c, page, page_number, forms=None, profiler=None):
+        """
+        Draw a single page onto the canvas
+        
+        Args:
+            c: reportlab Canvas object
+            page: LabelPage object
+            page_number: Page number, used for logging
+            forms: Dict mapping static layer keys to Form XObject names
+                   already defined on this canvas
+            profiler: Optional ExportProfiler recording element timings
+        """
+        # Set page size
+        c.setPageSize((page.width, page.height))
+        self._draw_tile(c, page, page_number, forms, profiler)
+    
+    def _draw_tile(self, c, page, page_number, forms=None, profiler=None):
+        """
+        Draw the content of a page in the current coordinate system, without
+        changing the canvas page size
+        
+        Args:
+            c: reportlab Canvas object
+            page: LabelPage object
+            page_number: Page number, used for logging
+            forms: Dict mapping static layer keys to Form XObject names
+                   already defined on this canvas
+            profiler: Optional ExportProfiler recording element timings
+        """
+        if page.static_elements and forms is not None:
+            # Background and static elements are drawn from a shared form
+            c.doForm(self._get_static_form(c, page, forms, profiler))
+            static_ids = set(id(element) for element in page.static_elements)
+            elements = [element for element in page.elements if id(element) not in static_ids]
+        else:
+            self._draw_background(c, page)
+            elements = page.elements
+        
+        # Draw all elements on the page
+        for j, element in enumerate(elements):
+            logger.render.debug("Drawing element %s on page %s", j+1, page_number)
+            self._draw_element(c, page, element, profiler)
+    
+    def _get_static_form(self, c, page, forms, profiler=None):
+        """
+        Get the Form XObject holding the static layer of a page, defining it
+        on first use
+        
+        Args:
+            c: reportlab Canvas object
+            page: LabelPage object with static elements
+            forms: Dict mapping static layer keys to Form XObject names
+            profiler: Optional ExportProfiler recording element timings
+            
+        Returns:
+            Form XObject name
+        """
+        key = page.static_key()
+        name = forms.get(key)
+        if name is None:
+            name = f"StaticLayer{len(forms) + 1}"
+            logger.debug("Defining static layer form: %s", name)
+            c.beginForm(name, 0, 0, page.width, page.height)
+            self._draw_background(c, page)
+            for element in page.static_elements:
+                self._draw_element(c, page, element, profiler)
+            c.endForm()
+            forms[key] = name
+        return name
+    
+    def _draw_background(self, c, page):
+        """
+        Draw page background
+        
+        Args:
+            c: reportlab Canvas object
+            page: LabelPage object
+        """
+        if page.background_color:
+            logger.render.debug("Drawing page background, color: %s", page.background_color)
+            c.setFillColorRGB(*[x/255 for x in page.background_color])
+            c.rect(0, 0, page.width, page.height, fill=1, stroke=0)
+    
+    def _draw_element(self, c, page, element, profiler=None):
+        """
+        Draw a single element, converting its top-left based y coordinate
+        
+        Args:
+            c: reportlab Canvas object
+            page: LabelPage the element belongs to
+            element: Page element object
+            profiler: Optional ExportProfiler recording the element draw time
+        """
+        if profiler is not None:
+            start = profiler.clock()
+        
+        # Save current graphics state
+        c.saveState()
+        
+        # Coordinate conversion - convert from top-left to ReportLab's bottom-left
+        # If element uses top-left coordinate system, we only need to convert y coordinate.
+        # The converted y is passed in, elements may be shared by concurrent exports
+        y_position = page.height - element.y
+        
+        try:
+            # Draw element
+            element.draw(c, y=y_position)
+        except Exception as e:
+            logger.error(f"Failed to draw element: {e}")
+        
+        # Restore graphics state
+        c.restoreState()
+        
+        if profiler is not None:
+            profiler.record(profiler.ELEMENT, type(element).__name__, profiler.clock() - start)
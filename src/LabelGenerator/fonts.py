@@ -1,15 +1,131 @@
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
+from concurrent.futures import ThreadPoolExecutor
+import json
 import os
 import platform
-import glob
+import struct
+import threading
 from .logger import logger
 
+# Name table IDs: font family, font subfamily, typographic family, typographic subfamily
+_NAME_FAMILY = 1
+_NAME_SUBFAMILY = 2
+_NAME_TYPOGRAPHIC_FAMILY = 16
+_NAME_TYPOGRAPHIC_SUBFAMILY = 17
+
+def _read_font_names(font_path):
+    """
+    Read family and subfamily names from the name table of a TTF/OTF/TTC file
+    
+    Only the file header, the table directory and the name table are read.
+    For font collections the first font is used.
+    
+    Args:
+        font_path: Font file path
+        
+    Returns:
+        Tuple (family, subfamily), or None if the names cannot be read
+    """
+    try:
+        with open(font_path, 'rb') as f:
+            header = f.read(12)
+            if header[:4] == b'ttcf':
+                # Font collection, jump to the first font
+                offset, = struct.unpack('>I', f.read(4))
+                f.seek(offset)
+                header = f.read(12)
+            num_tables, = struct.unpack('>H', header[4:6])
+            directory = f.read(16 * num_tables)
+            for i in range(num_tables):
+                tag, _, offset, length = struct.unpack('>4sIII', directory[i * 16:i * 16 + 16])
+                if tag == b'name':
+                    break
+            else:
+                return None
+            f.seek(offset)
+            table = f.read(length)
+        
+        _, count, string_offset = struct.unpack('>HHH', table[:6])
+        names = {}
+        for i in range(count):
+            platform_id, encoding_id, language_id, name_id, length, offset = \
+                struct.unpack('>HHHHHH', table[6 + i * 12:18 + i * 12])
+            if name_id not in (_NAME_FAMILY, _NAME_SUBFAMILY, _NAME_TYPOGRAPHIC_FAMILY, _NAME_TYPOGRAPHIC_SUBFAMILY):
+                continue
+            raw = table[string_offset + offset:string_offset + offset + length]
+            # Prefer Windows English names, then other Unicode names, then Mac Roman
+            if platform_id == 3 and language_id == 0x409:
+                priority, text = 3, raw.decode('utf-16-be', errors='replace')
+            elif platform_id in (0, 3):
+                priority, text = 2, raw.decode('utf-16-be', errors='replace')
+            elif platform_id == 1 and encoding_id == 0:
+                priority, text = 1, raw.decode('mac_roman', errors='replace')
+            else:
+                continue
+            if priority > names.get(name_id, (0, None))[0]:
+                names[name_id] = (priority, text)
+        
+        family = names.get(_NAME_TYPOGRAPHIC_FAMILY) or names.get(_NAME_FAMILY)
+        subfamily = names.get(_NAME_TYPOGRAPHIC_SUBFAMILY) or names.get(_NAME_SUBFAMILY)
+        if family is None:
+            return None
+        return family[1], subfamily[1] if subfamily else 'Regular'
+    except (OSError, struct.error, ValueError):
+        return None
+
+def _list_directory(directory):
+    """
+    List one directory for the font scanner
+    
+    Args:
+        directory: Directory path
+        
+    Returns:
+        Tuple (mtime, (st_dev, st_ino), subdirectories, font file paths)
+    """
+    subdirectories = []
+    font_files = []
+    try:
+        stat = os.stat(directory)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Symlinked directories are followed, the scanner skips directories seen before
+                if entry.is_dir():
+                    subdirectories.append(entry.path)
+                elif entry.name.lower().endswith(FontManager.FONT_EXTENSIONS):
+                    font_files.append(entry.path)
+    except OSError as e:
+        logger.warning(f"Error scanning directory {directory}: {e}")
+        return None, None, [], []
+    return stat.st_mtime, (stat.st_dev, stat.st_ino), subdirectories, font_files
+
 class FontManager:
     """Font manager for finding and registering system fonts"""
     
     _instance = None
     
+    # Supported font file extensions
+    FONT_EXTENSIONS = ('.ttf', '.ttc', '.otf')
+    
+    # Persistent font index, reused while the font directories are unchanged.
+    # The path can be overridden with the LABELGENERATOR_FONT_CACHE environment variable.
+    use_font_cache = True
+    FONT_CACHE_VERSION = 2
+    
+    # Number of threads used to scan font directories and read font names
+    SCAN_WORKERS = 8
+    
+    # Style words recognized in font names for the family/style index
+    STYLE_TOKENS = ('bolditalic', 'bold', 'italic', 'oblique', 'regular', 'light', 'medium', 'black')
+    
+    # Length of the n-grams used by the substring index
+    NGRAM_SIZE = 3
+    
+    # Incremented whenever the set of known fonts changes, lets the font
+    # registry retry fonts that could not be found before
+    _version = 0
+    
     # Font name mapping for common fonts and their file names
     COMMON_FONT_MAPPING = {
         # Microsoft fonts
@@ -53,19 +169,68 @@ class FontManager:
             return
             
         self._initialized = True
-        self.fonts = {}
-        self.fonts_by_family = {}
+        self._fonts = {}
+        self._fonts_by_family = {}
+        # Font directories are scanned lazily, on first font lookup. Other threads
+        # wait on the lock while a scan runs instead of seeing an empty font table
+        self._scanned = False
+        self._scanning = False
+        self._scan_lock = threading.RLock()
+        # Registration name -> font file path, for fonts registered in ReportLab
+        self.registered_fonts = {}
         self.system_font_dirs = self._get_system_font_dirs()
         self.custom_font_dirs = []
-        
-        # Basic font directory to start with
-        logger.info(f"System font directories: {self.system_font_dirs}")
-        
-        # Initiate font scanning
-        self._scan_fonts()
+        # Modification times of all scanned directories, used to validate the font cache
+        self._dir_mtimes = {}
+        # Lookup index over the scanned fonts and memoized lookup results
+        self._index = None
+        self._lookup_cache = {}
+    
+    @property
+    def fonts(self):
+        """Dict of known font files keyed by normalized name, scanned on first access"""
+        self._ensure_scanned()
+        return self._fonts
+    
+    @fonts.setter
+    def fonts(self, value):
+        self._fonts = value
+        self._invalidate_index()
+    
+    @property
+    def fonts_by_family(self):
+        """Dict of normalized font names grouped by family, scanned on first access"""
+        self._ensure_scanned()
+        return self._fonts_by_family
+    
+    @fonts_by_family.setter
+    def fonts_by_family(self, value):
+        self._fonts_by_family = value
+        self._invalidate_index()
+    
+    def _ensure_scanned(self):
+        """Scan font directories if this has not been done yet"""
+        if self._scanned:
+            return
+        with self._scan_lock:
+            # The scan itself reads the font tables through the properties
+            if self._scanned or self._scanning:
+                return
+            self._scanning = True
+            try:
+                # Basic font directory to start with
+                logger.info(f"System font directories: {self.system_font_dirs}")
+                
+                # Initiate font scanning
+                self._scan_fonts()
+                
+                # Set only once the font tables are filled
+                self._scanned = True
+            finally:
+                self._scanning = False
         
         # Log the number of fonts found
-        logger.info(f"Font scanning complete. Found {len(self.fonts)} fonts.")
+        logger.info(f"Font scanning complete. Found {len(self._fonts)} fonts.")
     
     def _get_system_font_dirs(self):
         """Get default font directories for the current operating system"""
@@ -98,36 +263,157 @@ class FontManager:
     
     def add_font_directory(self, directory):
         """Add custom font directory"""
-        if os.path.exists(directory) and directory not in self.custom_font_dirs:
-            self.custom_font_dirs.append(directory)
-            self._scan_directory(directory)
-            logger.info(f"Added font directory: {directory}")
+        with self._scan_lock:
+            if os.path.exists(directory) and directory not in self.custom_font_dirs:
+                self.custom_font_dirs.append(directory)
+                # Before the first scan the directory is picked up by _scan_fonts
+                if self._scanned:
+                    self._scan_directory(directory)
+                logger.info(f"Added font directory: {directory}")
     
     def _scan_fonts(self):
-        """Scan all system and custom font directories"""
-        for directory in self.system_font_dirs + self.custom_font_dirs:
-            self._scan_directory(directory)
+        """Scan all system and custom font directories, using the font cache when valid"""
+        if not self._load_font_cache():
+            self._scan_directories(self.system_font_dirs)
+            self._save_font_cache()
+        
+        self._scan_directories(self.custom_font_dirs)
+    
+    def refresh(self):
+        """Rescan all font directories, ignoring and rebuilding the font cache"""
+        with self._scan_lock:
+            self._scanned = True
+            self.fonts = {}
+            self.fonts_by_family = {}
+            self._dir_mtimes = {}
+            self._scan_directories(self.system_font_dirs)
+            self._save_font_cache()
+            self._scan_directories(self.custom_font_dirs)
+        logger.info(f"Font rescan complete. Found {len(self.fonts)} fonts.")
     
     def _scan_directory(self, directory):
         """Scan specified directory for font files"""
-        # Supported font extensions
-        font_extensions = ['*.ttf', '*.ttc', '*.otf']
+        self._scan_directories([directory])
+    
+    def _scan_directories(self, directories):
+        """
+        Scan directories recursively for font files
+        
+        Directories are listed level by level and font names are read from the
+        font files on a thread pool. Fonts are recorded in path order, so the
+        result does not depend on thread scheduling. Symlinked directories are
+        followed, each directory is scanned once so link cycles terminate.
         
+        Args:
+            directories: List of directory paths
+        """
+        if not directories:
+            return
         try:
-            for ext in font_extensions:
-                pattern = os.path.join(directory, '**', ext)
-                # Add recursive=True to properly scan subdirectories
-                for font_path in glob.glob(pattern, recursive=True):
-                    self._register_font_path(font_path)
-                    
-            # Log how many fonts found in this directory
-            directory_fonts = [f for f in self.fonts.values() if f['path'].startswith(directory)]
-            logger.debug(f"Found {len(directory_fonts)} fonts in {directory}")
+            font_files = []
+            visited = set()
+            with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as executor:
+                level = list(directories)
+                while level:
+                    next_level = []
+                    for directory, (mtime, identity, subdirectories, files) in zip(level, executor.map(_list_directory, level)):
+                        if identity in visited:
+                            continue
+                        if mtime is not None:
+                            visited.add(identity)
+                            self._dir_mtimes[directory] = mtime
+                        next_level.extend(subdirectories)
+                        font_files.extend(files)
+                    level = next_level
+                
+                font_files.sort()
+                font_names = list(executor.map(_read_font_names, font_files))
+            
+            for font_path, names in zip(font_files, font_names):
+                self._register_font_path(font_path, names)
+            
+            logger.debug(f"Found {len(font_files)} fonts in {directories}")
+        except Exception as e:
+            logger.warning(f"Error scanning directories {directories}: {e}")
+    
+    @staticmethod
+    def _get_font_cache_path():
+        """Get path of the persistent font index file"""
+        path = os.environ.get('LABELGENERATOR_FONT_CACHE')
+        if path:
+            return path
+        if platform.system() == "Windows":
+            base = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
+        else:
+            base = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+        return os.path.join(base, 'LabelGenerator', 'font_index.json')
+    
+    def _load_font_cache(self):
+        """
+        Load scan results from the font cache
+        
+        Returns:
+            True if the cache was valid and loaded, False otherwise
+        """
+        if not self.use_font_cache:
+            return False
+        cache_path = self._get_font_cache_path()
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                cache = json.load(f)
+            
+            if cache.get('version') != self.FONT_CACHE_VERSION or cache.get('roots') != self.system_font_dirs:
+                logger.debug("Font cache does not match current font directories")
+                return False
+            
+            # Any added or removed font file changes the mtime of its directory
+            for directory, mtime in cache['directories'].items():
+                if os.stat(directory).st_mtime != mtime:
+                    logger.debug(f"Font directory changed since last scan: {directory}")
+                    return False
+            
+            self.fonts = cache['fonts']
+            self.fonts_by_family = cache['fonts_by_family']
+            self._dir_mtimes = cache['directories']
+            logger.debug(f"Loaded font index from cache: {cache_path}")
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.debug(f"Ignoring unusable font cache {cache_path}: {e}")
+            return False
+    
+    def _save_font_cache(self):
+        """Save scan results of the system font directories to the font cache"""
+        if not self.use_font_cache:
+            return
+        cache_path = self._get_font_cache_path()
+        cache = {
+            'version': self.FONT_CACHE_VERSION,
+            'roots': self.system_font_dirs,
+            'directories': self._dir_mtimes,
+            'fonts': {name: dict(info, registered=False) for name, info in self.fonts.items()},
+            'fonts_by_family': self.fonts_by_family,
+        }
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Write to a temporary file first so readers never see a partial index
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+            os.replace(temp_path, cache_path)
+            logger.debug(f"Saved font index to cache: {cache_path}")
         except Exception as e:
-            logger.warning(f"Error scanning directory {directory}: {e}")
+            logger.debug(f"Failed to save font cache {cache_path}: {e}")
     
-    def _register_font_path(self, font_path):
-        """Record font file path information"""
+    def _register_font_path(self, font_path, names=None):
+        """
+        Record font file path information
+        
+        Args:
+            font_path: Font file path
+            names: Tuple (family, subfamily) read from the font file, if available
+        """
         try:
             # Get basic font name from filename
             font_name = os.path.splitext(os.path.basename(font_path))[0]
@@ -137,22 +423,31 @@ class FontManager:
             
             # Record font information
             if normalized_name not in self.fonts:
+                if names:
+                    family_name, style = names
+                else:
+                    # Font names not readable, guess the family from the file name
+                    # by removing style suffixes
+                    family_name = font_name
+                    for suffix in ['bold', 'italic', 'oblique', 'regular', 'light', 'medium', 'black']:
+                        family_name = family_name.lower().replace(suffix, '').strip()
+                    style = None
+                
                 self.fonts[normalized_name] = {
                     'path': font_path,
                     'name': font_name,
+                    'family': family_name,
+                    'style': style,
                     'registered': False
                 }
                 
-                # Group fonts by family
-                # Remove style suffixes to get family name
-                family_name = font_name
-                for suffix in ['bold', 'italic', 'oblique', 'regular', 'light', 'medium', 'black']:
-                    family_name = family_name.lower().replace(suffix, '').strip()
-                
-                if family_name not in self.fonts_by_family:
-                    self.fonts_by_family[family_name] = []
+                # Group fonts by normalized family name
+                family_key = family_name.lower().replace(' ', '')
+                if family_key not in self.fonts_by_family:
+                    self.fonts_by_family[family_key] = []
                     
-                self.fonts_by_family[family_name].append(normalized_name)
+                self.fonts_by_family[family_key].append(normalized_name)
+                self._invalidate_index()
                 
         except Exception as e:
             logger.warning(f"Error processing font file {font_path}: {e}")
@@ -189,10 +484,106 @@ class FontManager:
         
         return None
     
+    def _invalidate_index(self):
+        """Drop the lookup index and memoized lookups after the font list changed"""
+        self._index = None
+        self._lookup_cache = {}
+        self._version += 1
+    
+    def _get_index(self):
+        """
+        Get the lookup index over the scanned fonts, building it if needed
+        
+        Returns:
+            Dict with 'order' (font key -> scan order), 'ngrams' (n-gram -> set
+            of font keys) and 'family_styles' (family -> style word -> font key)
+        """
+        if self._index is not None:
+            return self._index
+        
+        fonts = self.fonts
+        order = {}
+        ngrams = {}
+        for position, name in enumerate(fonts):
+            order[name] = position
+            for i in range(len(name) - self.NGRAM_SIZE + 1):
+                ngrams.setdefault(name[i:i + self.NGRAM_SIZE], set()).add(name)
+        
+        family_styles = {}
+        for family, font_keys in self.fonts_by_family.items():
+            styles = family_styles.setdefault(family, {})
+            for font_key in font_keys:
+                # Subfamily read from the font file, e.g. 'Bold Italic' -> 'bolditalic'
+                style = fonts[font_key].get('style')
+                if style:
+                    styles.setdefault(self._normalize_style(style), font_key)
+                for token in self.STYLE_TOKENS:
+                    if token in font_key:
+                        styles.setdefault(token, font_key)
+        
+        self._index = {'order': order, 'ngrams': ngrams, 'family_styles': family_styles}
+        logger.debug(f"Built font lookup index: {len(order)} fonts, {len(ngrams)} n-grams")
+        return self._index
+    
+    @staticmethod
+    def _normalize_style(style):
+        """Normalize a style name for the family/style index, e.g. 'Bold Italic' -> 'bolditalic'"""
+        style = style.lower().replace(' ', '').replace('-', '')
+        return 'regular' if style == 'normal' else style
+    
+    def _find_family_style(self, family_name, font_style):
+        """
+        Find a font by family and style in the family/style index
+        
+        Args:
+            family_name: Normalized family name
+            font_style: Font style
+            
+        Returns:
+            Font key, or None if the family has no font with this style
+        """
+        styles = self._get_index()['family_styles'].get(family_name)
+        if not styles:
+            return None
+        return styles.get(self._normalize_style(font_style))
+    
+    def _find_by_substring(self, normalized_name):
+        """
+        Find the first scanned font whose name contains the given name
+        
+        Args:
+            normalized_name: Normalized font name
+            
+        Returns:
+            Font key, or None if no font name contains it
+        """
+        index = self._get_index()
+        if len(normalized_name) < self.NGRAM_SIZE:
+            # Too short for the n-gram index
+            candidates = [name for name in index['order'] if normalized_name in name]
+        else:
+            candidates = None
+            for i in range(len(normalized_name) - self.NGRAM_SIZE + 1):
+                postings = index['ngrams'].get(normalized_name[i:i + self.NGRAM_SIZE])
+                if not postings:
+                    return None
+                candidates = set(postings) if candidates is None else candidates & postings
+                if not candidates:
+                    return None
+            # Sharing all n-grams does not guarantee a substring match
+            candidates = [name for name in candidates if normalized_name in name]
+        
+        if not candidates:
+            return None
+        # Keep the scan order, like a linear search would
+        return min(candidates, key=index['order'].__getitem__)
+    
     def get_font_path(self, font_name, font_style=None):
         """
         Get file path for the specified font
         
+        Results are memoized per (name, style), including fonts that were not found.
+        
         Args:
             font_name: Font name
             font_style: Font style (normal, bold, italic, bold-italic)
@@ -203,6 +594,28 @@ class FontManager:
         # Normalize font name
         normalized_name = font_name.lower().replace(' ', '')
         
+        lookup_key = (normalized_name, font_style.lower() if font_style else None)
+        try:
+            return self._lookup_cache[lookup_key]
+        except KeyError:
+            pass
+        
+        font_path = self._search_font_path(font_name, normalized_name, font_style)
+        self._lookup_cache[lookup_key] = font_path
+        return font_path
+    
+    def _search_font_path(self, font_name, normalized_name, font_style):
+        """
+        Search file path for the specified font, see get_font_path
+        
+        Args:
+            font_name: Font name
+            normalized_name: Normalized font name
+            font_style: Font style (normal, bold, italic, bold-italic)
+            
+        Returns:
+            Found font path, or None if not found
+        """
         # Log what we're looking for
         logger.debug(f"Searching for font: {font_name} ({font_style})")
         
@@ -225,6 +638,12 @@ class FontManager:
             if styled_name and styled_name in self.fonts:
                 logger.debug(f"Found styled font: {styled_name}")
                 return self.fonts[styled_name]['path']
+            
+            # Family and subfamily names read from the font files
+            font_key = self._find_family_style(normalized_name, font_style)
+            if font_key:
+                logger.debug(f"Found font in family with style: {font_key}")
+                return self.fonts[font_key]['path']
         
         # 3. Try to match basic font name
         if normalized_name in self.fonts:
@@ -232,17 +651,22 @@ class FontManager:
             return self.fonts[normalized_name]['path']
         
         # 4. Fuzzy matching, check if font name is part of any font
-        for name, info in self.fonts.items():
-            if normalized_name in name:
-                logger.debug(f"Found font by fuzzy match: {name}")
-                return info['path']
+        fuzzy_match = self._find_by_substring(normalized_name)
+        if fuzzy_match:
+            logger.debug(f"Found font by fuzzy match: {fuzzy_match}")
+            return self.fonts[fuzzy_match]['path']
         
         # 5. Try to find by font family
         family_name = normalized_name
         if family_name in self.fonts_by_family:
             # Prioritize style-matching font
-            for font_key in self.fonts_by_family[family_name]:
-                if font_style and font_style.lower() in font_key:
+            if font_style:
+                style = font_style.lower()
+                font_key = self._find_family_style(family_name, font_style)
+                if font_key is None and style not in self.STYLE_TOKENS:
+                    # Style is not an indexed style word, check the family directly
+                    font_key = next((key for key in self.fonts_by_family[family_name] if style in key), None)
+                if font_key:
                     logger.debug(f"Found font in family with style: {font_key}")
                     return self.fonts[font_key]['path']
             
@@ -294,6 +718,7 @@ class FontManager:
                     font_path = self._find_font_in_windows_by_filename(font_name, font_style)
                     if font_path and os.path.exists(font_path):
                         pdfmetrics.registerFont(TTFont(reg_name, font_path))
+                        self.registered_fonts[reg_name] = font_path
                         logger.info(f"Directly registered font: {reg_name}, path: {font_path}")
                         return reg_name
                 except Exception as e:
@@ -318,6 +743,7 @@ class FontManager:
             # Check if font is already registered
             if reg_name not in pdfmetrics.getRegisteredFontNames():
                 pdfmetrics.registerFont(TTFont(reg_name, font_path))
+                self.registered_fonts[reg_name] = font_path
                 logger.debug(f"Successfully registered font: {reg_name}, path: {font_path}")
                 
                 # Update registration status
@@ -339,5 +765,90 @@ class FontManager:
         """Return a list of all registered fonts"""
         return sorted(pdfmetrics.getRegisteredFontNames())
 
+class FontRegistry:
+    """
+    Process-wide map of (font name, style) to ReportLab registration names
+    
+    Each combination is resolved through the font manager once, later lookups
+    are a single dict access. Fonts that could not be found are resolved again
+    once the font manager has picked up new fonts.
+    """
+    
+    def __init__(self, manager):
+        """
+        Initialize font registry
+        
+        Args:
+            manager: FontManager used to find and register fonts
+        """
+        self.manager = manager
+        self._resolved = {}
+        # Font manager version the cached misses were resolved against
+        self._version = manager._version
+        self.hits = 0
+        self.resolutions = 0
+        self.misses = 0
+    
+    def resolve(self, font_name, font_style=None):
+        """
+        Get registration name for a font, registering it on first use
+        
+        Args:
+            font_name: Font name
+            font_style: Font style (normal, bold, italic, bold-italic)
+            
+        Returns:
+            Registered font name, or None if the font could not be registered
+        """
+        key = (font_name, font_style)
+        try:
+            reg_name = self._resolved[key]
+        except KeyError:
+            pass
+        else:
+            if reg_name is not None or self._version == self.manager._version:
+                self.hits += 1
+                return reg_name
+            self._forget_misses()
+        
+        self.resolutions += 1
+        reg_name = self.manager.register_font(font_name, font_style)
+        if reg_name is None:
+            self.misses += 1
+            if self._version != self.manager._version:
+                # Older misses predate the fonts found since
+                self._forget_misses()
+        self._resolved[key] = reg_name
+        return reg_name
+    
+    def stats(self):
+        """
+        Get registry statistics
+        
+        Returns:
+            Dict with hits, resolutions, misses and number of resolved fonts
+        """
+        return {
+            'hits': self.hits,
+            'resolutions': self.resolutions,
+            'misses': self.misses,
+            'size': len(self._resolved),
+        }
+    
+    def _forget_misses(self):
+        """Drop cached misses after the font manager found new fonts"""
+        self._version = self.manager._version
+        self._resolved = {key: reg_name for key, reg_name in self._resolved.items() if reg_name is not None}
+    
+    def clear(self):
+        """Forget all resolved fonts and reset statistics"""
+        self._resolved = {}
+        self.hits = 0
+        self.resolutions = 0
+        self.misses = 0
+
 # Create a global font manager instance for easy import and use
 font_manager = FontManager()
+
+# Create a global font registry resolving fonts through the global font manager
+font_registry = FontRegistry(font_manager)
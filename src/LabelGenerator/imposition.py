@@ -0,0 +1,122 @@
+from reportlab.lib.units import mm
+from .logger import logger
+
+class SheetLayout:
+    """
+    Grid of label positions on a sheet, used for multi-up imposition
+
+    All sizes are given in millimeters, like LabelPage. Labels are placed
+    row by row starting at the top left corner of the sheet.
+    """
+
+    # Distance between the label grid and the cut marks (mm)
+    MARK_GAP = 1
+
+    def __init__(self, label_width, label_height, sheet_width=210, sheet_height=297,
+                 columns=None, rows=None, margin=5, gutter=2, cut_marks=False, mark_length=3):
+        """
+        Initialize sheet layout
+
+        Args:
+            label_width: Label width (mm)
+            label_height: Label height (mm)
+            sheet_width: Sheet width (mm), default A4
+            sheet_height: Sheet height (mm), default A4
+            columns: Number of columns, None fits as many as possible
+            rows: Number of rows, None fits as many as possible
+            margin: Sheet margin (mm), a number or a (top, right, bottom, left) tuple
+            gutter: Space between labels (mm), a number or a (horizontal, vertical) tuple
+            cut_marks: Whether to draw cut marks around the label grid
+            mark_length: Cut mark length (mm)
+        """
+        if isinstance(margin, (int, float)):
+            margin = (margin,) * 4
+        if isinstance(gutter, (int, float)):
+            gutter = (gutter, gutter)
+        self.label_width = label_width
+        self.label_height = label_height
+        self.sheet_width = sheet_width
+        self.sheet_height = sheet_height
+        self.margin = tuple(margin)
+        self.gutter = tuple(gutter)
+        self.cut_marks = cut_marks
+        self.mark_length = mark_length
+
+        top, right, bottom, left = self.margin
+        if columns is None:
+            columns = int((sheet_width - left - right + self.gutter[0]) // (label_width + self.gutter[0]))
+        if rows is None:
+            rows = int((sheet_height - top - bottom + self.gutter[1]) // (label_height + self.gutter[1]))
+        if columns < 1 or rows < 1:
+            raise ValueError(f"Label of {label_width}x{label_height} mm does not fit on a "
+                             f"{sheet_width}x{sheet_height} mm sheet with the given margins")
+        self.columns = columns
+        self.rows = rows
+        logger.debug("Sheet layout: %s columns x %s rows", columns, rows)
+
+    @property
+    def per_sheet(self):
+        """Number of labels per sheet"""
+        return self.columns * self.rows
+
+    @property
+    def size(self):
+        """Sheet size in points"""
+        return (self.sheet_width * mm, self.sheet_height * mm)
+
+    @property
+    def label_size(self):
+        """Label cell size in points"""
+        return (self.label_width * mm, self.label_height * mm)
+
+    def positions(self):
+        """
+        Get the bottom-left corner of every label cell
+
+        Returns:
+            List of (x, y) tuples in points, in reading order
+        """
+        top, right, bottom, left = self.margin
+        positions = []
+        for row in range(self.rows):
+            y = self.sheet_height - top - self.label_height - row * (self.label_height + self.gutter[1])
+            for column in range(self.columns):
+                x = left + column * (self.label_width + self.gutter[0])
+                positions.append((x * mm, y * mm))
+        return positions
+
+    def cut_mark_lines(self):
+        """
+        Get cut mark lines in the sheet margins, in line with every cell edge
+
+        Marks start MARK_GAP away from the label grid and are shortened to
+        fit the margin on each side.
+
+        Returns:
+            List of (x1, y1, x2, y2) tuples in points
+        """
+        positions = self.positions()
+        width, height = self.label_size
+        top, right, bottom, left = self.margin
+        grid_left = positions[0][0]
+        grid_top = positions[0][1] + height
+        grid_right = positions[self.columns - 1][0] + width
+        grid_bottom = positions[-1][1]
+        xs = sorted({x for x, _ in positions} | {x + width for x, _ in positions})
+        ys = sorted({y for _, y in positions} | {y + height for _, y in positions})
+
+        def extent(side_margin):
+            length = min(self.mark_length, side_margin - self.MARK_GAP)
+            return (self.MARK_GAP * mm, (self.MARK_GAP + length) * mm) if length > 0 else None
+
+        lines = []
+        for side_margin, make in (
+            (top, lambda a, b: [(x, grid_top + a, x, grid_top + b) for x in xs]),
+            (bottom, lambda a, b: [(x, grid_bottom - a, x, grid_bottom - b) for x in xs]),
+            (left, lambda a, b: [(grid_left - a, y, grid_left - b, y) for y in ys]),
+            (right, lambda a, b: [(grid_right + a, y, grid_right + b, y) for y in ys]),
+        ):
+            span = extent(side_margin)
+            if span:
+                lines.extend(make(*span))
+        return lines
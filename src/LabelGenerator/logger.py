@@ -1,8 +1,23 @@
+import atexit
+import gzip
 import logging
+import logging.handlers
 import os
+import queue
+import shutil
 import sys
 from datetime import datetime
 
+def _gzip_namer(name):
+    """Name rotated log files with a .gz suffix"""
+    return name + '.gz'
+
+def _gzip_rotator(source, dest):
+    """Compress a rotated log file with gzip"""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
 class LabelLogger:
     """
     Logger management class for the LabelGenerator library
@@ -44,22 +59,93 @@ class LabelLogger:
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)  # Default log level
+        # Child logger for per-element messages on the render hot path
+        # (element creation, setters, drawing). Messages propagate to the
+        # handlers above; the level can be raised with set_quiet_render.
+        self.render = logging.getLogger(f'{name}.render')
         self.log_file = None
         self.console_handler = None
         self.file_handler = None
+        # Queue based logging, handler I/O runs on the listener thread
+        self.queue_handler = None
+        self.queue_listener = None
+        self._attached_handlers = []
         
         # Set up default handler (console output)
         self._setup_console_handler()
+        
+        if hasattr(os, 'register_at_fork'):
+            # Forked worker processes do not inherit the listener thread
+            os.register_at_fork(after_in_child=self.reset_after_fork)
     
     def _setup_console_handler(self):
         """Set up console log handler"""
-        if self.console_handler is not None:
-            self.logger.removeHandler(self.console_handler)
-            
         self.console_handler = logging.StreamHandler(sys.stdout)
         formatter = logging.Formatter('[%(asctime)s][%(name)s][%(levelname)s] %(message)s')
         self.console_handler.setFormatter(formatter)
-        self.logger.addHandler(self.console_handler)
+        self._apply_handlers()
+    
+    def _apply_handlers(self):
+        """Attach console and file handlers directly, or behind the queue in async mode"""
+        handlers = [h for h in (self.console_handler, self.file_handler) if h is not None]
+        
+        # Detach the handlers attached last time, then attach the current set
+        for handler in self._attached_handlers:
+            self.logger.removeHandler(handler)
+        if self.queue_listener is not None:
+            # Stopping the listener writes out all queued records first
+            self.queue_listener.stop()
+            self.queue_listener = None
+        
+        if self.queue_handler is not None:
+            self.queue_listener = logging.handlers.QueueListener(
+                self.queue_handler.queue, *handlers, respect_handler_level=True)
+            self.queue_listener.start()
+            self._attached_handlers = [self.queue_handler]
+        else:
+            self._attached_handlers = handlers
+        for handler in self._attached_handlers:
+            self.logger.addHandler(handler)
+    
+    def enable_async_logging(self):
+        """
+        Enable queue based logging
+        
+        Log records are put on a queue and written by a background thread,
+        so console and file I/O never blocks the rendering thread.
+        """
+        if self.queue_handler is not None:
+            return
+        self.queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        self._apply_handlers()
+        # Flush queued records when the interpreter exits
+        atexit.register(self.disable_async_logging)
+        self.debug("Async logging enabled")
+    
+    def disable_async_logging(self):
+        """Disable queue based logging, flushing all queued records"""
+        if self.queue_handler is None:
+            return
+        self.queue_handler = None
+        self._apply_handlers()
+        atexit.unregister(self.disable_async_logging)
+    
+    def reset_after_fork(self):
+        """
+        Write log records directly from a forked child process
+        
+        A forked process inherits the queue handler but not the listener
+        thread reading the queue, so records logged there would be lost.
+        Async logging is switched off in the child without touching the
+        listener of the parent. Called automatically after fork where
+        supported and by the export worker initializer.
+        """
+        if self.queue_handler is None:
+            return
+        self.queue_handler = None
+        self.queue_listener = None
+        self._apply_handlers()
+        atexit.unregister(self.disable_async_logging)
     
     def set_level(self, level):
         """
@@ -80,13 +166,43 @@ class LabelLogger:
             self.logger.setLevel(level)
             self.debug(f"Log level set to: {level}")
     
-    def enable_file_logging(self, log_dir=None, log_file=None):
+    def set_quiet_render(self, quiet=True):
+        """
+        Enable or disable quiet render mode
+        
+        In quiet render mode per-element DEBUG and INFO messages are dropped
+        regardless of the main log level, warnings and errors are still logged.
+        
+        Args:
+            quiet: Whether to enable quiet render mode
+        """
+        self.render.setLevel(logging.WARNING if quiet else logging.NOTSET)
+        self.debug("Quiet render mode set to: %s", quiet)
+    
+    def is_enabled_for(self, level):
+        """
+        Check whether messages of a level would be logged, to guard expensive message construction
+        
+        Args:
+            level: Log level, string ('debug', 'info', ...) or logging module level constant
+            
+        Returns:
+            True if messages of this level are logged
+        """
+        if isinstance(level, str):
+            level = self.LOG_LEVELS.get(level.lower(), logging.INFO)
+        return self.logger.isEnabledFor(level)
+    
+    def enable_file_logging(self, log_dir=None, log_file=None, max_bytes=0, backup_count=5, compress=False):
         """
         Enable file logging
         
         Args:
             log_dir: Log directory, default is 'logs' subdirectory in the current working directory
             log_file: Log filename, default is 'labelgenerator_YYYYMMDD_HHMMSS.log'
+            max_bytes: Rotate the log file when it reaches this size, 0 disables rotation
+            backup_count: Number of rotated log files to keep
+            compress: Whether to gzip rotated log files
         """
         if log_dir is None:
             # Default to 'logs' subdirectory in the current working directory
@@ -103,23 +219,32 @@ class LabelLogger:
             
         self.log_file = os.path.join(log_dir, log_file)
         
-        # Remove existing file handler if present
+        # Close existing file handler if present
         if self.file_handler is not None:
-            self.logger.removeHandler(self.file_handler)
+            self.file_handler.close()
             
         # Create new file handler
-        self.file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+        if max_bytes > 0:
+            self.file_handler = logging.handlers.RotatingFileHandler(
+                self.log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+            if compress:
+                self.file_handler.namer = _gzip_namer
+                self.file_handler.rotator = _gzip_rotator
+        else:
+            self.file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
         formatter = logging.Formatter('[%(asctime)s][%(name)s][%(levelname)s] %(message)s')
         self.file_handler.setFormatter(formatter)
-        self.logger.addHandler(self.file_handler)
+        self._apply_handlers()
         
-        self.info(f"File logging enabled: {self.log_file}")
+        self.info("File logging enabled: %s", self.log_file)
     
     def disable_file_logging(self):
         """Disable file logging"""
         if self.file_handler is not None:
-            self.logger.removeHandler(self.file_handler)
+            file_handler = self.file_handler
             self.file_handler = None
+            self._apply_handlers()
+            file_handler.close()
             self.info("File logging disabled")
     
     def log_registered_fonts(self):
@@ -135,30 +260,31 @@ class LabelLogger:
         except Exception as e:
             self.error(f"Error getting registered fonts list: {e}")
     
-    # Proxy log methods
-    def debug(self, message):
+    # Proxy log methods, arguments are merged into the message with % formatting
+    # only when the message is actually logged
+    def debug(self, message, *args, **kwargs):
         """Log DEBUG level message"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args, **kwargs)
         
-    def info(self, message):
+    def info(self, message, *args, **kwargs):
         """Log INFO level message"""
-        self.logger.info(message)
+        self.logger.info(message, *args, **kwargs)
         
-    def warning(self, message):
+    def warning(self, message, *args, **kwargs):
         """Log WARNING level message"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args, **kwargs)
         
-    def error(self, message):
+    def error(self, message, *args, **kwargs):
         """Log ERROR level message"""
-        self.logger.error(message)
+        self.logger.error(message, *args, **kwargs)
         
-    def critical(self, message):
+    def critical(self, message, *args, **kwargs):
         """Log CRITICAL level message"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args, **kwargs)
         
-    def exception(self, message):
+    def exception(self, message, *args, **kwargs):
         """Log exception information, including stack trace"""
-        self.logger.exception(message)
+        self.logger.exception(message, *args, **kwargs)
 
 # Create a default logger instance for easy import and use
 logger = LabelLogger.get_logger()
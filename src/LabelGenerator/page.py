@@ -18,11 +18,13 @@ class LabelPage:
         self.width = width*mm_to_point
         self.height = height*mm_to_point
         self.elements = []
+        # Elements that are identical on every page, exported once as a shared layer
+        self.static_elements = []
         self.background_color = None
         if width and height:
-            logger.info(f"Created new label page, size: {width * 0.3528:.2f} mm × {height * 0.3528:.2f} mm")
+            logger.render.info("Created new label page, size: %.2f mm × %.2f mm", width * 0.3528, height * 0.3528)
         else:
-            logger.info("Created new label page, with default size")
+            logger.render.info("Created new label page, with default size")
         
         
     def set_background_color(self, color):
@@ -40,7 +42,7 @@ class LabelPage:
             self.background_color = (r, g, b)
         else:
             self.background_color = color
-        logger.debug(f"Page background color set: {self.background_color}")
+        logger.render.debug("Page background color set: %s", self.background_color)
         return self
     
     def set_size(self, width, height):
@@ -55,15 +57,41 @@ class LabelPage:
 
         self.width = width*mm_to_point
         self.height = height*mm_to_point
-        logger.debug(f"Page size set: {width}x{height}")
+        logger.render.debug("Page size set: %sx%s", width, height)
         return self
     
-    def add_element(self, element):
+    def add_element(self, element, static=False):
         """
         Add element to page
         
         Args:
             element: Page element object
+            static: Whether the element is part of the static layer. Static
+                    elements and the page background are written once as a
+                    PDF Form XObject and reused by all pages with the same
+                    static layer. They are drawn below the other elements.
         """
         self.elements.append(element)
-        logger.debug(f"Element added to page, current element count: {len(self.elements)}")
\ No newline at end of file
+        if static:
+            self.static_elements.append(element)
+        logger.render.debug("Element added to page, current element count: %s", len(self.elements))
+    
+    def static_key(self):
+        """
+        Get a key identifying the static layer of this page
+        
+        Pages with equal keys have identical static layers and can share
+        the same Form XObject.
+        
+        Returns:
+            Hashable key, or None if the page has no static elements
+        """
+        if not self.static_elements:
+            return None
+        elements = tuple(
+            (type(element).__name__,
+             tuple((name, repr(value)) for name, value in sorted(vars(element).items())
+                   if not name.startswith('_')))
+            for element in self.static_elements
+        )
+        return (self.width, self.height, repr(self.background_color), elements)
@@ -0,0 +1,126 @@
+import time
+
+class TimingStats:
+    """Accumulated wall time of one measured item"""
+    
+    __slots__ = ('count', 'total', 'max')
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def add(self, seconds):
+        """Add one measurement"""
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+    
+    @property
+    def mean(self):
+        """Mean time per measurement in seconds"""
+        return self.total / self.count if self.count else 0.0
+    
+    def as_dict(self):
+        """Return statistics as a dict"""
+        return {'count': self.count, 'total': self.total, 'mean': self.mean, 'max': self.max}
+
+class ProfileSummary:
+    """
+    Summary of an export run recorded by ExportProfiler
+    """
+    
+    def __init__(self, stages, elements, pages):
+        """
+        Initialize summary
+        
+        Args:
+            stages: Dict mapping stage name to TimingStats
+            elements: Dict mapping element type name to TimingStats
+            pages: TimingStats over all pages
+        """
+        self.stages = stages
+        self.elements = elements
+        self.pages = pages
+    
+    def as_dict(self):
+        """Return summary as a dict of plain values, e.g. for JSON output"""
+        return {
+            'stages': {name: stats.as_dict() for name, stats in self.stages.items()},
+            'elements': {name: stats.as_dict() for name, stats in self.elements.items()},
+            'pages': self.pages.as_dict(),
+        }
+    
+    def __str__(self):
+        lines = [f"Pages: {self.pages.count}, total {self.pages.total * 1000:.1f} ms, "
+                 f"mean {self.pages.mean * 1000:.3f} ms, max {self.pages.max * 1000:.3f} ms"]
+        for title, group in (('Stage', self.stages), ('Element', self.elements)):
+            for name, stats in sorted(group.items(), key=lambda item: -item[1].total):
+                lines.append(f"{title} {name}: {stats.count} x, total {stats.total * 1000:.1f} ms, "
+                             f"mean {stats.mean * 1000:.3f} ms")
+        return "\n".join(lines)
+
+class ExportProfiler:
+    """
+    Opt-in timing hook for LabelDocument exports
+    
+    Records wall time per export stage ('canvas', 'draw', 'show_page', 'save'),
+    per page and per element type. Pass an instance as the profiler argument of
+    LabelDocument.export_pdf or export_stream, then read summary(). Events can
+    also be forwarded to a callback as they happen.
+    """
+    
+    STAGE = 'stage'
+    PAGE = 'page'
+    ELEMENT = 'element'
+    
+    # Clock used for all measurements
+    clock = staticmethod(time.perf_counter)
+    
+    def __init__(self, callback=None):
+        """
+        Initialize profiler
+        
+        Args:
+            callback: Optional callable(kind, name, seconds), called for every event.
+                      kind is 'stage', 'page' or 'element'; name is the stage name,
+                      the page number or the element type name.
+        """
+        self.callback = callback
+        self.reset()
+    
+    def reset(self):
+        """Discard all recorded timings"""
+        self.stages = {}
+        self.elements = {}
+        self.pages = TimingStats()
+    
+    def record(self, kind, name, seconds):
+        """
+        Record one timing event
+        
+        Args:
+            kind: Event kind, 'stage', 'page' or 'element'
+            name: Stage name, page number or element type name
+            seconds: Wall time in seconds
+        """
+        if kind == self.PAGE:
+            self.pages.add(seconds)
+        else:
+            group = self.stages if kind == self.STAGE else self.elements
+            stats = group.get(name)
+            if stats is None:
+                stats = group[name] = TimingStats()
+            stats.add(seconds)
+        if self.callback is not None:
+            self.callback(kind, name, seconds)
+    
+    def summary(self):
+        """
+        Get summary of the recorded timings
+        
+        Returns:
+            ProfileSummary object
+        """
+        return ProfileSummary(dict(self.stages), dict(self.elements), self.pages)
@@ -5,6 +5,7 @@ from enum import Enum
 import reportlab.lib.colors as colors
 from reportlab.lib.units import mm
 from .logger import logger
+from .cache import LRUCache
 
 class LabelQRCode:
     """
@@ -18,6 +19,19 @@ class LabelQRCode:
         QUARTILE = qrcode.constants.ERROR_CORRECT_Q # Approx 25% error correction capability
         HIGH = qrcode.constants.ERROR_CORRECT_H     # Approx 30% error correction capability
     
+    class RENDER_MODE(Enum):
+        """QR code rendering mode enumeration"""
+        RASTER = "raster"  # Embed a PNG image rendered with PIL
+        VECTOR = "vector"  # Draw modules directly as filled rectangles
+    
+    # Process-wide cache of encoded QR module matrices shared by all instances,
+    # keyed by (data, error correction level). Only the compact matrix is
+    # cached, images are built per instance, so entries stay a few KB each
+    cache = LRUCache(maxsize=4096)
+    
+    # Maps matrix bytes (1 for dark) to palette indexes (0 for the QR code color)
+    _PALETTE_INDEX = bytes([1, 0]) + bytes(254)
+    
     def __init__(self):
         """Initialize QR code label element"""
         self.x = 0
@@ -27,9 +41,11 @@ class LabelQRCode:
         self.data = ""
         self.color = (0, 0, 0)  # Default black
         self.error_correction = self.ERROR_LEVEL.MEDIUM  # Default medium error correction level
+        self.render_mode = self.RENDER_MODE.RASTER
         self._qr_image = None
+        self._qr_matrix = None
         self._last_data = None
-        logger.info("Created new QR code element, ")
+        logger.render.info("Created new QR code element, ")
     
     def set_location(self, x, y):
         """
@@ -41,7 +57,7 @@ class LabelQRCode:
         """
         self.x = x
         self.y = y
-        logger.debug(f"QR code position set: ({x}, {y})")
+        logger.render.debug("QR code position set: (%s, %s)", x, y)
         return self
     
     def set_size(self, width, height):
@@ -54,7 +70,7 @@ class LabelQRCode:
         """
         self.width = width
         self.height = height
-        logger.debug(f"QR code size set: {width}x{height}")
+        logger.render.debug("QR code size set: %sx%s", width, height)
         return self
     
     def set_data(self, data):
@@ -66,7 +82,9 @@ class LabelQRCode:
         """
         self.data = data
         self._last_data = None  # Reset cache, force QR code regeneration
-        logger.debug(f"QR code data set: {data}")
+        self._qr_image = None
+        self._qr_matrix = None
+        logger.render.debug("QR code data set: %s", data)
         return self
     
     def set_color(self, color):
@@ -77,7 +95,9 @@ class LabelQRCode:
         :return: self, for method chaining
         """
         self.color = color
-        logger.debug(f"QR code color set: {color}")
+        self._qr_image = None  # Reset cache, force QR code regeneration
+        self._qr_matrix = None
+        logger.render.debug("QR code color set: %s", color)
         return self
     
     def set_error_correction(self, level):
@@ -88,45 +108,107 @@ class LabelQRCode:
         :return: self, for method chaining
         """
         self.error_correction = level
-        logger.debug(f"QR code error correction level set: {level}")
+        self._qr_image = None  # Reset cache, force QR code regeneration
+        self._qr_matrix = None
+        logger.render.debug("QR code error correction level set: %s", level)
         return self
     
+    def set_render_mode(self, mode):
+        """
+        Set QR code rendering mode
+        
+        :param mode: Rendering mode, use value from RENDER_MODE enumeration
+        :return: self, for method chaining
+        """
+        self.render_mode = mode
+        logger.render.debug("QR code render mode set: %s", mode)
+        return self
+    
+    @classmethod
+    def cache_stats(cls):
+        """
+        Get statistics of the shared QR code cache
+        
+        :return: Dict with hits, misses, evictions, size and maxsize
+        """
+        return cls.cache.stats()
+    
+    @classmethod
+    def set_cache_size(cls, maxsize):
+        """
+        Set maximum number of entries of the shared QR code cache
+        
+        :param maxsize: Maximum number of entries, 0 disables caching
+        """
+        cls.cache.resize(maxsize)
+        logger.debug("QR code cache size set: %s", maxsize)
+    
+    @classmethod
+    def clear_cache(cls):
+        """Clear the shared QR code cache and its statistics"""
+        cls.cache.clear()
+    
+    def _get_cache_entry(self):
+        """
+        Get the shared cache entry for the current settings, encoding on a miss
+        
+        :return: Dict with 'matrix', a tuple of rows of bytes with 1 for dark modules
+        """
+        key = (self.data, self.error_correction.value)
+        entry = self.cache.get(key)
+        if entry is None:
+            matrix = tuple(bytes(row) for row in self._make_qr().get_matrix())
+            entry = {'matrix': matrix}
+            self.cache.put(key, entry)
+        return entry
+    
+    def _make_qr(self):
+        """
+        Build the qrcode.QRCode object for the current data
+        
+        :return: qrcode.QRCode object
+        """
+        qr = qrcode.QRCode(
+            version=None,  # Auto-determine version
+            error_correction=self.error_correction.value,
+            box_size=1,    # Only the module matrix is used
+            border=0,      # Border width set to 0, we'll manage position ourselves
+        )
+        qr.add_data(self.data)
+        qr.make(fit=True)
+        return qr
+    
+    def _generate_qr_matrix(self):
+        """
+        Generate QR code module matrix based on settings
+        
+        :return: Tuple of rows, each bytes with 1 for dark modules
+        """
+        logger.render.debug("Generating QR code matrix, data: '%s'", self.data)
+        try:
+            self._qr_matrix = self._get_cache_entry()['matrix']
+            self._last_data = self.data
+            return self._qr_matrix
+        except Exception as e:
+            logger.error(f"Failed to generate QR code matrix: {e}")
+            raise
+    
     def _generate_qr_code(self):
         """
         Generate QR code image based on settings
         
         :return: PIL Image object
         """
-        logger.debug(f"Generating QR code image, data: '{self.data}'")
+        logger.render.debug("Generating QR code image, data: '%s'", self.data)
         try:
-            qr = qrcode.QRCode(
-                version=None,  # Auto-determine version
-                error_correction=self.error_correction.value,
-                box_size=10,   # Pixels per box (will be adjusted when drawing)
-                border=0,      # Border width set to 0, we'll manage position ourselves
-            )
-            qr.add_data(self.data)
-            qr.make(fit=True)
-            
-            # Create a black and white QR code image
-            img = qr.make_image(fill_color="black", back_color="white")
-            
-            # If custom color needed, convert colors
-            if self.color != (0, 0, 0):
-                logger.debug(f"Custom QR code color: {self.color}")
-                # Convert B&W image to RGB
-                img = img.convert("RGB")
-                
-                # Get pixel data
-                pixels = img.load()
-                black_color = (0, 0, 0)
-                width, height = img.size
-                
-                # Replace black pixels with specified color
-                for i in range(width):
-                    for j in range(height):
-                        if pixels[i, j] == black_color:
-                            pixels[i, j] = self.color
+            # Build a palette image straight from the module matrix:
+            # index 0 is the QR code color, index 1 is the white background
+            # One pixel per module, drawImage scales it to the element size
+            matrix = self._get_cache_entry()['matrix']
+            modules = len(matrix)
+            pixels = b''.join(matrix).translate(self._PALETTE_INDEX)
+            img = Image.frombytes("P", (modules, modules), pixels)
+            img.putpalette(list(self.color) + [255, 255, 255])
             
             self._qr_image = img
             self._last_data = self.data
@@ -135,13 +217,19 @@ class LabelQRCode:
             logger.error(f"Failed to generate QR code image: {e}")
             raise
     
-    def draw(self, canvas):
+    def draw(self, canvas, y=None):
         """
         Draw QR code on the specified Canvas
         
         :param canvas: ReportLab Canvas object
+        :param y: Top edge y coordinate, default is self.y
         """
-        logger.debug(f"Drawing QR code: '{self.data}', position: ({self.x}, {self.y})")
+        if y is None:
+            y = self.y
+        logger.render.debug("Drawing QR code: '%s', position: (%s, %s)", self.data, self.x, y)
+        if self.render_mode == self.RENDER_MODE.VECTOR:
+            self._draw_vector(canvas, y)
+            return
         try:
             # If data changed or QR code not yet generated, generate new one
             if not self._qr_image or self.data != self._last_data:
@@ -149,19 +237,63 @@ class LabelQRCode:
             
             # Convert PIL image to ReportLab format
             img_byte_arr = BytesIO()
-            self._qr_image.save(img_byte_arr, format='PNG')
+            # Two-color palette is stored with 1 bit per pixel
+            self._qr_image.save(img_byte_arr, format='PNG', bits=1)
             img_byte_arr.seek(0)
             
             # drawImage x and y parameters are bottom-left coordinates
             # But our coordinates are top-left, so we need to convert
             draw_x = self.x
-            draw_y = self.y - self.height
+            draw_y = y - self.height
             
             # Draw image on canvas
             from reportlab.lib.utils import ImageReader
             img_reader = ImageReader(img_byte_arr)
             canvas.drawImage(img_reader, draw_x, draw_y, width=self.width, height=self.height)
-            logger.debug("QR code drawn successfully")
+            logger.render.debug("QR code drawn successfully")
+        except Exception as e:
+            logger.error(f"Error drawing QR code: {e}")
+            raise
+    
+    def _draw_vector(self, canvas, y):
+        """
+        Draw QR code modules directly on the canvas as filled rectangles
+        
+        Horizontal runs of dark modules are merged into a single rectangle and
+        all rectangles are filled as one path.
+        
+        :param canvas: ReportLab Canvas object
+        :param y: Top edge y coordinate
+        """
+        try:
+            if self._qr_matrix is None or self.data != self._last_data:
+                self._generate_qr_matrix()
+            
+            matrix = self._qr_matrix
+            modules = len(matrix)
+            module_width = self.width / modules
+            module_height = self.height / modules
+            
+            # Our coordinates are top-left, first matrix row is the top row
+            top = y
+            path = canvas.beginPath()
+            for row_index, row in enumerate(matrix):
+                row_y = top - (row_index + 1) * module_height
+                run_start = None
+                for col_index, dark in enumerate(row):
+                    if dark and run_start is None:
+                        run_start = col_index
+                    elif not dark and run_start is not None:
+                        path.rect(self.x + run_start * module_width, row_y,
+                                  (col_index - run_start) * module_width, module_height)
+                        run_start = None
+                if run_start is not None:
+                    path.rect(self.x + run_start * module_width, row_y,
+                              (modules - run_start) * module_width, module_height)
+            
+            canvas.setFillColorRGB(*[x/255 for x in self.color])
+            canvas.drawPath(path, fill=1, stroke=0)
+            logger.render.debug("QR code drawn successfully as vector")
         except Exception as e:
             logger.error(f"Error drawing QR code: {e}")
             raise
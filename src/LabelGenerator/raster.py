@@ -0,0 +1,340 @@
+import copy
+import os
+from PIL import Image, ImageDraw, ImageFont
+from reportlab.graphics import shapes
+from .logger import logger
+from .fonts import font_manager
+from .text import LabelText
+from .barcode import LabelBarcode, _BarRecorder
+from .qrcode import LabelQRCode
+from .cache import LRUCache
+from .document import _prepare_output
+
+# Pixel values of 1-bit images
+BLACK = 0
+WHITE = 1
+
+class RasterRenderer:
+    """
+    Renders label pages straight to 1-bit bitmaps for thermal printers
+
+    Pages are drawn at the printer resolution without building a PDF.
+    Bar patterns and QR matrices are turned into images with bulk byte
+    operations and pasted in one step, instead of drawing module by module.
+    The static layer of a page is rendered once and copied for every label.
+    """
+
+    # PIL formats by file extension
+    FORMATS = {
+        '.png': 'PNG',
+        '.pbm': 'PPM',  # PIL writes mode '1' images as binary PBM (P4)
+    }
+
+    def __init__(self, dpi=203, threshold=128):
+        """
+        Initialize raster renderer
+
+        Args:
+            dpi: Printer resolution in dots per inch
+            threshold: Colors with a luminance below this value print black
+        """
+        self.dpi = dpi
+        self.threshold = threshold
+        self.scale = dpi / 72.0
+        self._fonts = {}
+        self._static_layers = LRUCache(maxsize=16)
+        self._painters = {
+            LabelText: self._draw_text,
+            LabelBarcode: self._draw_barcode,
+            LabelQRCode: self._draw_qrcode,
+        }
+        logger.debug("Raster renderer created, resolution: %s dpi", dpi)
+
+    def _px(self, points):
+        """Convert points to whole printer dots"""
+        return int(round(points * self.scale))
+
+    def _bit(self, color):
+        """
+        Convert an RGB color to a 1-bit pixel value
+
+        Args:
+            color: RGB tuple (r,g,b)
+
+        Returns:
+            BLACK or WHITE
+        """
+        if color is None:
+            return WHITE
+        r, g, b = color[:3]
+        return WHITE if 0.299 * r + 0.587 * g + 0.114 * b >= self.threshold else BLACK
+
+    def render_page(self, page):
+        """
+        Render a page to a 1-bit image
+
+        Args:
+            page: LabelPage object
+
+        Returns:
+            PIL Image in mode '1'
+        """
+        if page.static_elements:
+            # Background and static elements are rendered once and copied,
+            # like the shared Form XObject of the PDF export
+            key = page.static_key()
+            base = self._static_layers.get(key)
+            if base is None:
+                base = self._new_image(page)
+                self._draw_elements(base, page.static_elements)
+                self._static_layers.put(key, base)
+            image = base.copy()
+            static_ids = {id(element) for element in page.static_elements}
+            self._draw_elements(image, [e for e in page.elements if id(e) not in static_ids])
+        else:
+            image = self._new_image(page)
+            self._draw_elements(image, page.elements)
+        return image
+    
+    def _new_image(self, page):
+        """Create a blank page image filled with the page background"""
+        return Image.new('1', (self._px(page.width), self._px(page.height)), self._bit(page.background_color))
+    
+    def _draw_elements(self, image, elements):
+        """
+        Draw elements onto a page image
+        
+        Args:
+            image: PIL Image in mode '1'
+            elements: List of page elements
+        """
+        draw = ImageDraw.Draw(image)
+        for element in elements:
+            painter = self._painters.get(type(element))
+            if painter is None:
+                logger.warning(f"Element type cannot be rasterized: {type(element).__name__}")
+                continue
+            try:
+                painter(image, draw, element)
+            except Exception as e:
+                logger.error(f"Failed to rasterize element: {e}")
+
+    def _get_font(self, element):
+        """
+        Get the PIL font for a text element, loaded once per font file and size
+
+        Args:
+            element: LabelText object
+
+        Returns:
+            PIL font object
+        """
+        path = font_manager.registered_fonts.get(element.font_name)
+        size = max(1, self._px(element.font_size))
+        if not path:
+            return self._default_font(size)
+        key = (path, size)
+        font = self._fonts.get(key)
+        if font is None:
+            try:
+                font = ImageFont.truetype(path, size)
+            except OSError:
+                font = self._default_font(size)
+            self._fonts[key] = font
+        return font
+
+    def _default_font(self, size):
+        """
+        Get the PIL default font at a size in dots, loaded once per size
+
+        Args:
+            size: Font size in printer dots
+
+        Returns:
+            PIL font object
+        """
+        key = (None, size)
+        font = self._fonts.get(key)
+        if font is None:
+            try:
+                font = ImageFont.load_default(size)
+            except TypeError:
+                # Pillow before 10.1 has no scalable default font
+                font = ImageFont.load_default()
+            self._fonts[key] = font
+        return font
+
+    def _text(self, draw, position, text, fill, font, anchor):
+        """
+        Draw a string at an anchor point, placing bitmap fonts by their bounding box
+
+        Args:
+            draw: PIL ImageDraw object
+            position: Anchor point (dots)
+            text: String to draw
+            fill: 1-bit fill value
+            font: PIL font object
+            anchor: PIL anchor, 'ls', 'ms' or 'rs'
+        """
+        try:
+            draw.text(position, text, fill=fill, font=font, anchor=anchor)
+        except ValueError:
+            # Bitmap fonts do not support anchors
+            left, top, right, bottom = font.getbbox(text)
+            shift = {'m': (right - left) // 2, 'r': right - left}.get(anchor[0], 0)
+            draw.text((position[0] - shift, position[1] - bottom), text, fill=fill, font=font)
+
+    def _draw_text(self, image, draw, element):
+        """Draw a text element, y is the baseline"""
+        if not element.text:
+            return
+        anchor = {'center': 'ms', 'right': 'rs'}.get(element.alignment, 'ls')
+        self._text(draw, (self._px(element.x), self._px(element.y)), element.text,
+                   self._bit(element.color), self._get_font(element), anchor)
+
+    def _draw_barcode(self, image, draw, element):
+        """
+        Draw a barcode element, y is the bottom edge of the bars
+
+        Linear barcodes are always snapped to printer dots, whatever the
+        element render mode: both modes share the bar geometry of the PDF
+        export, so the bars differ from the PDF by dot rounding only.
+        """
+        entry = element._get_cache_entry()
+        fill = self._bit(element.color)
+        left = self._px(element.x)
+        bottom = self._px(element.y)
+
+        if entry['linear']:
+            # Linear barcode: the NATIVE mode bars at the renderer dpi, grouped by row span
+            rows = {}
+            for x, y, width, height in element._get_bars(entry, self.dpi):
+                rows.setdefault((y, height), []).append((x, width))
+            for (y, height), bars in rows.items():
+                span = bars[-1][0] + bars[-1][1]
+                row = bytearray(span)
+                for x, width in bars:
+                    row[x:x + width] = b'\xff' * width
+                mask = Image.frombytes('L', (span, 1), bytes(row)).resize((span, height), Image.NEAREST)
+                image.paste(fill, (left, bottom - y - height), mask)
+        elif entry['bounds'] is not None:
+            # Widget based barcode: draw its shapes, in widget units as the PDF export does
+            self._draw_shapes(draw, entry['barcode'].draw(), element.x, element.y, fill)
+        else:
+            # Other reportlab barcodes (DataMatrix): draw the rectangles they emit
+            barcode = copy.copy(entry['barcode'])
+            barcode._calculate()
+            barcode.x = barcode.y = 0
+            barcode.canv = _BarRecorder()
+            barcode.draw()
+            for x, y, width, height in barcode.canv.bars:
+                x0, x1 = self._px(element.x + x), self._px(element.x + x + width)
+                y0, y1 = self._px(element.y - y - height), self._px(element.y - y)
+                if x1 > x0 and y1 > y0:
+                    draw.rectangle((x0, y0, x1 - 1, y1 - 1), fill=fill)
+
+        if element.show_text and element.text_location != element.TEXT.NONE:
+            font = self._default_font(max(1, self._px(element.text_size)))
+            center = self._px(element.x + element.width / 2)
+            if element.text_location == element.TEXT.TOP:
+                position = (center, self._px(element.y - element.height - 2))
+            else:
+                position = (center, self._px(element.y + element.text_size + 2))
+            self._text(draw, position, str(element.data), self._bit(element.text_color), font, 'ms')
+
+    def _draw_shapes(self, draw, node, x, y, fill, dx=0, dy=0):
+        """
+        Draw the rectangles and strings of a reportlab drawing node
+
+        Args:
+            draw: PIL ImageDraw object
+            node: reportlab Group or shape
+            x: Element x position (points)
+            y: Element baseline, top-left based (points)
+            fill: 1-bit fill value
+            dx: Offset from enclosing groups (points)
+            dy: Offset from enclosing groups (points)
+        """
+        if isinstance(node, shapes.Group):
+            transform = getattr(node, 'transform', None) or (1, 0, 0, 1, 0, 0)
+            for child in node.contents:
+                self._draw_shapes(draw, child, x, y, fill, dx + transform[4], dy + transform[5])
+        elif isinstance(node, shapes.Rect):
+            if node.fillColor is None:
+                return
+            x0 = self._px(x + dx + node.x)
+            x1 = self._px(x + dx + node.x + node.width)
+            y0 = self._px(y - dy - node.y - node.height)
+            y1 = self._px(y - dy - node.y)
+            if x1 > x0 and y1 > y0:
+                draw.rectangle((x0, y0, x1 - 1, y1 - 1), fill=self._shape_bit(node.fillColor, fill))
+        elif isinstance(node, shapes.String):
+            font = self._default_font(max(1, self._px(node.fontSize)))
+            anchor = {'middle': 'ms', 'end': 'rs'}.get(node.textAnchor, 'ls')
+            self._text(draw, (self._px(x + dx + node.x), self._px(y - dy - node.y)), node.text,
+                       self._shape_bit(node.fillColor, fill), font, anchor)
+    
+    def _shape_bit(self, color, fill):
+        """Map a reportlab shape color to a 1-bit value, dark colors take the element fill"""
+        if color is None:
+            return fill
+        bit = self._bit((color.red * 255, color.green * 255, color.blue * 255))
+        return fill if bit == BLACK else WHITE
+
+    def _draw_qrcode(self, image, draw, element):
+        """Draw a QR code element, y is the top edge"""
+        if not element.data:
+            return
+        matrix = element._get_cache_entry()['matrix']
+        modules = len(matrix)
+        # One byte per module, 255 marks dark modules in the paste mask
+        data = bytes(255 if dark else 0 for row in matrix for dark in row)
+        size = (self._px(element.width), self._px(element.height))
+        mask = Image.frombytes('L', (modules, modules), data).resize(size, Image.NEAREST)
+        image.paste(self._bit(element.color), (self._px(element.x), self._px(element.y)), mask)
+
+    def save_page(self, page, filename, format=None):
+        """
+        Render a page and save it as PNG or PBM
+
+        Args:
+            page: LabelPage object
+            filename: Output path or writable binary stream
+            format: Image format ('PNG' or 'PPM'), by default taken from the file extension
+        """
+        if format is None:
+            format = self.FORMATS.get(os.path.splitext(str(filename))[1].lower(), 'PNG')
+        self.render_page(page).save(filename, format=format)
+
+    def export(self, pages, filename):
+        """
+        Render pages to image files
+
+        A filename containing a format field, e.g. 'labels/{:06d}.png', writes
+        one image per label numbered from 1. A '.pbm' filename or a writable
+        binary stream receives all labels as consecutive PBM images, which
+        netpbm tools and many printer spoolers read as a batch.
+
+        Args:
+            pages: Iterable or generator of LabelPage objects
+            filename: Output filename, pattern or writable binary stream
+
+        Returns:
+            Number of rendered labels
+        """
+        _prepare_output(filename)
+        count = 0
+        if hasattr(filename, 'write'):
+            for count, page in enumerate(pages, 1):
+                self.save_page(page, filename, format='PPM')
+        elif '{' in filename:
+            for count, page in enumerate(pages, 1):
+                self.save_page(page, filename.format(count))
+        elif filename.lower().endswith('.pbm'):
+            with open(filename, 'wb') as f:
+                for count, page in enumerate(pages, 1):
+                    self.save_page(page, f, format='PPM')
+        else:
+            raise ValueError(f"Batch output needs a '.pbm' file or a numbered filename pattern: {filename}")
+        logger.info("Raster export completed, %s labels at %s dpi: %s", count, self.dpi, filename)
+        return count
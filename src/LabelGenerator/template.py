@@ -0,0 +1,98 @@
+from .page import LabelPage
+from .logger import logger
+
+class LabelTemplate:
+    """
+    Label template class, defines a page layout once and fills named variable slots per row
+    
+    Fixed elements are put on the page's static layer, so they are exported once
+    as a shared form. Slot elements are created once and only their values are
+    updated for each row, no element objects are rebuilt.
+    """
+    
+    def __init__(self, width=210, height=297):
+        """
+        Initialize label template
+        
+        Args:
+            width: Page width (mm)
+            height: Page height (mm)
+        """
+        self.page = LabelPage(width, height)
+        self.slots = {}
+        self._values = {}
+        logger.info("Created new label template")
+    
+    def set_background_color(self, color):
+        """
+        Set page background color
+        
+        Args:
+            color: Color, can be RGB tuple (r,g,b) or hex string '#RRGGBB'
+        """
+        self.page.set_background_color(color)
+        return self
+    
+    def add_element(self, element):
+        """
+        Add fixed element, identical on every label
+        
+        Args:
+            element: Page element object
+        """
+        self.page.add_element(element, static=True)
+        return self
+    
+    def add_slot(self, name, element, setter=None, default=""):
+        """
+        Add variable element whose value is filled from each row
+        
+        Args:
+            name: Slot name, used as key in row dicts
+            element: Page element object (LabelText, LabelBarcode, LabelQRCode, ...)
+            setter: Name of the element method used to set the value, default
+                    is 'set_text' for text elements and 'set_data' otherwise
+            default: Value used when a row has no value for this slot
+        """
+        if name in self.slots:
+            raise ValueError(f"Duplicate template slot: {name}")
+        if setter is None:
+            setter = 'set_text' if hasattr(element, 'set_text') else 'set_data'
+        self.page.add_element(element)
+        self.slots[name] = (getattr(element, setter), default)
+        logger.debug("Template slot added: %s, setter: %s", name, setter)
+        return self
+    
+    def fill(self, values):
+        """
+        Fill slots with the values of one row
+        
+        The same page object is returned for every row, it must be drawn
+        (e.g. by LabelDocument.export_stream) before the next row is filled.
+        
+        Args:
+            values: Dict mapping slot names to values
+            
+        Returns:
+            Filled LabelPage object
+        """
+        for name, (setter, default) in self.slots.items():
+            value = values.get(name, default)
+            # Only update elements whose value actually changed
+            if self._values.get(name, self) != value:
+                setter(value)
+                self._values[name] = value
+        return self.page
+    
+    def pages(self, rows):
+        """
+        Generate filled pages for rows
+        
+        Args:
+            rows: Iterable of dicts mapping slot names to values
+            
+        Yields:
+            Filled LabelPage object for each row
+        """
+        for row in rows:
+            yield self.fill(row)
@@ -4,13 +4,18 @@ import os
 import platform
 import glob
 from .logger import logger
-from .fonts import font_manager
+from .fonts import font_manager, font_registry
 
 class LabelText:
     """
     Text element class for creating and managing text in labels
     """
     
+    # Standard fonts don't need registration
+    STANDARD_FONTS = frozenset([
+        "Helvetica", "Courier", "Times-Roman", "Symbol", "ZapfDingbats"
+    ])
+    
     def __init__(self):
         """
         Initialize text element
@@ -23,7 +28,7 @@ class LabelText:
         self.font_style = None  # normal, bold, italic, bold-italic
         self.color = (0, 0, 0)  # Default black
         self.alignment = 'left'  # left, center, right
-        logger.info("Created new text element")
+        logger.render.info("Created new text element")
         
     def set_location(self, x, y):
         """
@@ -35,7 +40,7 @@ class LabelText:
         """
         self.x = x
         self.y = y
-        logger.debug(f"Text position set: ({x}, {y})")
+        logger.render.debug("Text position set: (%s, %s)", x, y)
         
     def set_text(self, text):
         """
@@ -45,7 +50,7 @@ class LabelText:
             text: Text content
         """
         self.text = text
-        logger.debug(f"Text content set: {text}")
+        logger.render.debug("Text content set: %s", text)
         
     def set_font(self, font_name, font_size, font_style=None):
         """
@@ -59,18 +64,14 @@ class LabelText:
         self.font_name = font_name
         self.font_size = font_size
         self.font_style = font_style
-        logger.debug(f"Text font set: {font_name}, size: {font_size}, style: {font_style}")
+        logger.render.debug("Text font set: %s, size: %s, style: %s", font_name, font_size, font_style)
         
         # Standard fonts don't need registration
-        standard_fonts = [
-            "Helvetica", "Courier", "Times-Roman", "Symbol", "ZapfDingbats"
-        ]
-        
-        if font_name in standard_fonts:
+        if font_name in self.STANDARD_FONTS:
             return
         
-        # Use font manager to register font
-        registered_name = font_manager.register_font(font_name, font_style)
+        # Resolve through the font registry, each font is registered once per process
+        registered_name = font_registry.resolve(font_name, font_style)
         if registered_name:
             self.font_name = registered_name
         else:
@@ -92,7 +93,7 @@ class LabelText:
             self.color = (r, g, b)
         else:
             self.color = color
-        logger.debug(f"Text color set: {self.color}")
+        logger.render.debug("Text color set: %s", self.color)
     
     def set_alignment(self, alignment):
         """
@@ -102,16 +103,19 @@ class LabelText:
             alignment: Alignment (left, center, right)
         """
         self.alignment = alignment
-        logger.debug(f"Text alignment set: {alignment}")
+        logger.render.debug("Text alignment set: %s", alignment)
     
-    def draw(self, canvas):
+    def draw(self, canvas, y=None):
         """
         Draw text on PDF canvas
         
         Args:
             canvas: reportlab Canvas object
+            y: Optional baseline y coordinate, default is self.y
         """
-        logger.debug(f"Drawing text: '{self.text}', position: ({self.x}, {self.y})")
+        if y is None:
+            y = self.y
+        logger.render.debug("Drawing text: '%s', position: (%s, %s)", self.text, self.x, y)
         try:
             # Save current graphics state
             canvas.saveState()
@@ -131,20 +135,20 @@ class LabelText:
                 for std_font in ["Helvetica", "Courier", "Times-Roman"]:
                     try:
                         canvas.setFont(std_font, self.font_size)
-                        logger.debug(f"Successfully fell back to standard font: {std_font}")
+                        logger.render.debug("Successfully fell back to standard font: %s", std_font)
                         break
                     except:
                         continue
             
             # Draw text according to alignment
             if self.alignment == 'left':
-                canvas.drawString(self.x, self.y, self.text)
+                canvas.drawString(self.x, y, self.text)
             elif self.alignment == 'center':
-                canvas.drawCentredString(self.x, self.y, self.text)
+                canvas.drawCentredString(self.x, y, self.text)
             elif self.alignment == 'right':
-                canvas.drawRightString(self.x, self.y, self.text)
+                canvas.drawRightString(self.x, y, self.text)
             else:
-                canvas.drawString(self.x, self.y, self.text)
+                canvas.drawString(self.x, y, self.text)
             
             # Restore graphics state
             canvas.restoreState()
@@ -0,0 +1,253 @@
+import qrcode
+from reportlab.pdfbase import pdfmetrics
+from .logger import logger
+from .text import LabelText
+from .barcode import LabelBarcode
+from .qrcode import LabelQRCode
+from .cache import LRUCache
+from .document import _prepare_output
+
+def _field_data(data):
+    """
+    Build a ZPL field data command, escaping control characters with ^FH
+
+    Args:
+        data: Field text
+
+    Returns:
+        '^FH^FD...^FS' command string
+    """
+    text = str(data)
+    for char in '_^~\n\r':
+        text = text.replace(char, '_%02X' % ord(char))
+    return f"^FH^FD{text}^FS"
+
+class ZPLRenderer:
+    """
+    Converts label pages to ZPL II for Zebra-compatible printers
+
+    Text is sent as printer font fields and barcodes and QR codes as native
+    printer symbologies, so labels are rasterized by the printer at engine
+    speed. Output is plain UTF-8 text and identical for identical pages.
+    """
+
+    # ZPL barcode commands by LabelBarcode type, formatted with the bar height
+    # in dots, the interpretation line flag and the text-above flag
+    BARCODE_COMMANDS = {
+        'code128': "^BCN,{height},{text},{above},N",
+        'code39': "^B3N,N,{height},{text},{above}",
+        'ean13': "^BEN,{height},{text},{above}",
+        'ean8': "^B8N,{height},{text},{above}",
+        'upca': "^BUN,{height},{text},{above},Y",
+    }
+
+    # Wide to narrow bar ratio of reportlab's Code 39
+    CODE39_RATIO = 2.2
+
+    # Printer font used for text without an entry in the font map
+    DEFAULT_FONT = '0'
+
+    def __init__(self, dpi=203, fonts=None, threshold=128):
+        """
+        Initialize ZPL renderer
+
+        Args:
+            dpi: Printer resolution in dots per inch
+            fonts: Optional dict mapping font names to printer font files,
+                   e.g. {'Microsoft YaHei': 'E:MSYH.TTF'} for CJK text
+            threshold: Colors with a luminance below this value print black,
+                       lighter elements are printed reversed
+        """
+        self.dpi = dpi
+        self.scale = dpi / 72.0
+        self.threshold = threshold
+        self.fonts = {self._font_key(name): path for name, path in (fonts or {}).items()}
+        self._static_layers = LRUCache(maxsize=16)
+        self._qr_sizes = LRUCache(maxsize=4096)
+        self._writers = {
+            LabelText: self._text_commands,
+            LabelBarcode: self._barcode_commands,
+            LabelQRCode: self._qrcode_commands,
+        }
+        logger.debug("ZPL renderer created, resolution: %s dpi", dpi)
+
+    @staticmethod
+    def _font_key(name):
+        return name.lower().replace(' ', '')
+
+    def _px(self, points):
+        """Convert points to whole printer dots"""
+        return int(round(points * self.scale))
+
+    def _is_light(self, color):
+        """Whether a color prints white"""
+        if color is None:
+            return True
+        r, g, b = color[:3]
+        return 0.299 * r + 0.587 * g + 0.114 * b >= self.threshold
+
+    def _reverse(self, color):
+        """Field reverse command for light elements"""
+        return "" if not self._is_light(color) else "^FR"
+
+    def render_page(self, page):
+        """
+        Convert a page to a ZPL label format
+
+        Args:
+            page: LabelPage object
+
+        Returns:
+            ZPL string from ^XA to ^XZ
+        """
+        commands = ["^XA", "^CI28", f"^PW{self._px(page.width)}", f"^LL{self._px(page.height)}", "^LH0,0"]
+        if page.static_elements:
+            # Static commands are generated once per static layer
+            key = page.static_key()
+            static = self._static_layers.get(key)
+            if static is None:
+                static = self._background_commands(page) + self._element_commands(page.static_elements)
+                self._static_layers.put(key, static)
+            commands.extend(static)
+            static_ids = {id(element) for element in page.static_elements}
+            commands.extend(self._element_commands([e for e in page.elements if id(e) not in static_ids]))
+        else:
+            commands.extend(self._background_commands(page))
+            commands.extend(self._element_commands(page.elements))
+        commands.append("^XZ")
+        return "\n".join(commands) + "\n"
+
+    def _background_commands(self, page):
+        """Fill dark page backgrounds with a solid box"""
+        if self._is_light(page.background_color):
+            return []
+        width, height = self._px(page.width), self._px(page.height)
+        return [f"^FO0,0^GB{width},{height},{min(width, height)}^FS"]
+
+    def _element_commands(self, elements):
+        """
+        Convert page elements to ZPL field commands
+
+        Args:
+            elements: List of page elements
+
+        Returns:
+            List of command strings
+        """
+        commands = []
+        for element in elements:
+            writer = self._writers.get(type(element))
+            if writer is None:
+                logger.warning(f"Element type cannot be converted to ZPL: {type(element).__name__}")
+                continue
+            try:
+                command = writer(element)
+            except Exception as e:
+                logger.error(f"Failed to convert element to ZPL: {e}")
+                continue
+            if command:
+                commands.append(command)
+        return commands
+
+    def _text_commands(self, element):
+        """Text field with its baseline at the element position"""
+        if not element.text:
+            return None
+        height = max(1, self._px(element.font_size))
+        font_name = element.font_name or ''
+        printer_font = self.fonts.get(self._font_key(font_name)) \
+            or self.fonts.get(self._font_key(font_name.split('-')[0]))
+        if printer_font:
+            font = f"^A@N,{height},{height},{printer_font}"
+        else:
+            font = f"^A{self.DEFAULT_FONT}N,{height},{height}"
+
+        x = element.x
+        if element.alignment in ('center', 'right'):
+            try:
+                width = pdfmetrics.stringWidth(element.text, font_name, element.font_size)
+            except Exception:
+                width = 0
+            x -= width / 2 if element.alignment == 'center' else width
+        return f"^FT{self._px(x)},{self._px(element.y)}{font}{self._reverse(element.color)}{_field_data(element.text)}"
+
+    def _barcode_commands(self, element):
+        """Native barcode field, the element y is the bottom edge of the bars"""
+        barcode_type = element.barcode_type.lower()
+        reverse = self._reverse(element.color)
+        if barcode_type == 'datamatrix':
+            symbol = element._get_cache_entry()['barcode']
+            # Largest whole dot module size that keeps the symbol inside the element
+            module = max(1, min(self._px(element.width) // symbol.col_modules,
+                                self._px(element.height) // symbol.row_modules))
+            size = module * symbol.row_modules
+            return f"^FO{self._px(element.x)},{max(0, self._px(element.y) - size)}^BXN,{module},200{reverse}{_field_data(element.data)}"
+
+        command = self.BARCODE_COMMANDS.get(barcode_type)
+        if command is None:
+            logger.warning(f"Unknown barcode type: {element.barcode_type}, using default type code128")
+            barcode_type, command = 'code128', self.BARCODE_COMMANDS['code128']
+        height = max(1, self._px(element.height))
+        module = max(1, self._px(element.width / 150))
+        ratio = f",{self.CODE39_RATIO}" if barcode_type == 'code39' else ""
+        show = element.show_text and element.text_location != element.TEXT.NONE
+        symbol = command.format(height=height, text='Y' if show else 'N',
+                                above='Y' if show and element.text_location == element.TEXT.TOP else 'N')
+        return (f"^FO{self._px(element.x)},{max(0, self._px(element.y) - height)}^BY{module}{ratio}"
+                f"{symbol}{reverse}{_field_data(element.data)}")
+
+    def _qrcode_commands(self, element):
+        """Native QR code field, the element y is the top edge"""
+        if not element.data:
+            return None
+        modules = self._qr_modules(element)
+        # Rounded down so the symbol never outgrows the element
+        magnification = min(10, max(1, min(self._px(element.width), self._px(element.height)) // modules))
+        level = element.error_correction.name[0]
+        return (f"^FO{self._px(element.x)},{self._px(element.y)}^BQN,2,{magnification}"
+                f"{self._reverse(element.color)}{_field_data(level + 'A,' + str(element.data))}")
+
+    def _qr_modules(self, element):
+        """
+        Get the number of modules per side of a QR code
+
+        The printer encodes the data itself, so only the symbol version is
+        needed here. It is found without building the matrix and masks.
+
+        Args:
+            element: LabelQRCode object
+
+        Returns:
+            Modules per side
+        """
+        key = (element.data, element.error_correction.value)
+        modules = self._qr_sizes.get(key)
+        if modules is None:
+            qr = qrcode.QRCode(error_correction=element.error_correction.value)
+            qr.add_data(element.data)
+            modules = qr.best_fit() * 4 + 17
+            self._qr_sizes.put(key, modules)
+        return modules
+
+    def export(self, pages, filename):
+        """
+        Write pages as one ZPL job
+
+        Args:
+            pages: Iterable or generator of LabelPage objects
+            filename: Output ZPL filename or writable binary stream
+
+        Returns:
+            Number of labels written
+        """
+        _prepare_output(filename)
+        count = 0
+        if hasattr(filename, 'write'):
+            for count, page in enumerate(pages, 1):
+                filename.write(self.render_page(page).encode('utf-8'))
+        else:
+            with open(filename, 'w', encoding='utf-8', newline='\n') as f:
+                for count, page in enumerate(pages, 1):
+                    f.write(self.render_page(page))
+        logger.info("ZPL export completed, %s labels at %s dpi", count, self.dpi)
+        return count
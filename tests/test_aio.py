@@ -0,0 +1,151 @@
+"""
+Tests for the asyncio export API
+"""
+import unittest
+import asyncio
+import io
+import os
+import tempfile
+import threading
+import time
+from LabelGenerator import LabelDocument, LabelPage, LabelText, LabelBarcode, AsyncExporter, logger
+
+class TestAsyncExporter(unittest.TestCase):
+    """Test cases for AsyncExporter and LabelDocument.export_async"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.loop = asyncio.new_event_loop()
+        self.document = LabelDocument()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.loop.close()
+        self.temp_dir.cleanup()
+
+    def slow_pages(self, count, delay, started=None):
+        """Generate pages slowly, counting the pages handed out"""
+        for _ in range(count):
+            time.sleep(delay)
+            if started is not None:
+                started.append(threading.current_thread().name)
+            yield LabelPage(width=40, height=30)
+
+    def test_export_bytes(self):
+        """Test exporting without a filename returns the PDF bytes"""
+        self.document.add_page(LabelPage(width=40, height=30))
+        content = self.loop.run_until_complete(self.document.export_async())
+        self.assertTrue(content.startswith(b'%PDF'))
+        self.assertIn(b'/Count 1', content)
+
+    def test_concurrent_exports(self):
+        """Test concurrent exports of one document on the loop's thread pool draw shared elements safely"""
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            self.skipTest("pypdf is not installed")
+
+        text = LabelText()
+        text.set_text("SN0001")
+        text.set_location(5, 20)
+        barcode = LabelBarcode()
+        barcode.set_data("SN0001")
+        barcode.set_location(5, 35)
+        for _ in range(200):
+            page = LabelPage(width=60, height=40)
+            page.add_element(text)
+            page.add_element(barcode)
+            self.document.add_page(page)
+
+        def page_contents(content):
+            return [page.get_contents().get_data() for page in PdfReader(io.BytesIO(content)).pages]
+
+        reference = page_contents(self.document.export_bytes())
+        self.assertEqual(len(set(reference)), 1)
+
+        async def main():
+            return await asyncio.gather(*[self.document.export_async() for _ in range(8)])
+
+        # Per-page log records would serialize the threads and hide races
+        logger.set_quiet_render(True)
+        try:
+            results = self.loop.run_until_complete(main())
+        finally:
+            logger.set_quiet_render(False)
+        for content in results:
+            self.assertEqual(page_contents(content).count(reference[0]), 200)
+        self.assertEqual((text.y, barcode.y), (20, 35))
+
+    def test_profiler_with_workers(self):
+        """Test a profiler together with worker processes is rejected"""
+        from LabelGenerator import ExportProfiler
+        exporter = AsyncExporter(max_concurrency=1)
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(exporter.export(self.document, jobs=2, profiler=ExportProfiler()))
+        self.assertEqual(exporter.active, 0)
+
+    def test_event_loop_not_blocked(self):
+        """Test the event loop keeps running while pages are rendered"""
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        async def main():
+            task = self.loop.create_task(ticker())
+            content = await self.document.export_async(pages=self.slow_pages(20, 0.01))
+            task.cancel()
+            return content
+
+        content = self.loop.run_until_complete(main())
+        self.assertIn(b'/Count 20', content)
+        self.assertGreater(len(ticks), 5)
+
+    def test_max_concurrency(self):
+        """Test exports beyond the limit wait for a free slot"""
+        exporter = AsyncExporter(max_concurrency=1)
+        peak = []
+
+        async def watch(tasks):
+            while not all(task.done() for task in tasks):
+                peak.append(exporter.active)
+                await asyncio.sleep(0.005)
+
+        async def main():
+            tasks = [self.loop.create_task(exporter.export(self.document, self.slow_pages(5, 0.01)))
+                     for _ in range(3)]
+            await watch(tasks)
+            return await asyncio.gather(*tasks)
+
+        results = self.loop.run_until_complete(main())
+        self.assertEqual(len(results), 3)
+        self.assertEqual(max(peak), 1)
+        self.assertEqual(exporter.active, 0)
+
+    def test_cancel(self):
+        """Test cancelling stops rendering between pages and writes no file"""
+        exporter = AsyncExporter(max_concurrency=1)
+        filename = os.path.join(self.temp_dir.name, 'cancelled.pdf')
+        started = []
+
+        async def main():
+            task = self.loop.create_task(
+                self.document.export_async(filename, pages=self.slow_pages(1000, 0.01, started), exporter=exporter))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            # A small job still gets the slot once the render thread has stopped
+            return await self.document.export_async(pages=[LabelPage(width=40, height=30)], exporter=exporter)
+
+        content = self.loop.run_until_complete(main())
+        self.assertTrue(content.startswith(b'%PDF'))
+        self.assertLess(len(started), 1000)
+        self.assertFalse(os.path.exists(filename))
+        self.assertEqual(exporter.active, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,11 @@
 Tests for the barcode module
 """
 import unittest
+import re
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 from reportlab.lib.units import mm
+from reportlab.pdfgen import canvas
 from LabelGenerator import LabelBarcode
 
 class TestLabelBarcode(unittest.TestCase):
@@ -92,6 +96,152 @@ class TestLabelBarcode(unittest.TestCase):
         size = 12
         self.barcode.set_text_size(size)
         self.assertEqual(self.barcode.text_size, size)
+    
+    def test_shared_cache(self):
+        """Test identical barcodes are built once across instances"""
+        LabelBarcode.clear_cache()
+        other = LabelBarcode()
+        first = self.barcode._get_cache_entry()
+        second = other._get_cache_entry()
+        self.assertIs(first['barcode'], second['barcode'])
+        self.assertEqual(LabelBarcode.cache_stats()['misses'], 1)
+        self.assertEqual(LabelBarcode.cache_stats()['hits'], 1)
+        
+        # Size and type are part of the key, the type case is not
+        other.set_size(60, 15)
+        self.assertIsNot(other._get_cache_entry()['barcode'], first['barcode'])
+        other.set_size(self.barcode.width, self.barcode.height)
+        other.set_barcode_type("CODE128")
+        self.assertIs(other._get_cache_entry()['barcode'], first['barcode'])
+    
+    def test_concurrent_draw(self):
+        """Test threads drawing the same cached barcode do not disturb each other"""
+        def draw_pages(count):
+            barcode = LabelBarcode()
+            barcode.set_data("SN0001")
+            barcode.set_location(10, 50)
+            buffer = BytesIO()
+            c = canvas.Canvas(buffer, pageCompression=0)
+            for _ in range(count):
+                barcode.draw(c)
+                c.showPage()
+            c.save()
+            return buffer.getvalue().count(b' re')
+        
+        expected = draw_pages(1)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            counts = list(executor.map(draw_pages, [200] * 8))
+        self.assertEqual(counts, [expected * 200] * 8)
+    
+    def test_cached_bounds(self):
+        """Test widget based barcodes cache their bounds"""
+        LabelBarcode.clear_cache()
+        self.barcode.set_barcode_type("ean13")
+        self.barcode.set_data("590123412345")
+        entry = self.barcode._get_cache_entry()
+        self.assertEqual(len(entry['bounds']), 4)
+        
+        c = canvas.Canvas(BytesIO())
+        self.barcode.draw(c)
+        self.barcode.draw(c)
+        self.assertEqual(LabelBarcode.cache_stats()['misses'], 1)
+    
+    def test_unknown_type(self):
+        """Test unknown types fall back to Code128"""
+        LabelBarcode.clear_cache()
+        self.barcode.set_barcode_type("unknown")
+        entry = self.barcode._get_cache_entry()
+        self.assertEqual(type(entry['barcode']).__name__, "Code128")
+        self.assertIsNone(entry['bounds'])
+    
+    def test_cache_size(self):
+        """Test the cache can be resized and disabled"""
+        LabelBarcode.set_cache_size(0)
+        try:
+            self.barcode._get_cache_entry()
+            self.assertEqual(len(LabelBarcode.cache), 0)
+        finally:
+            LabelBarcode.set_cache_size(4096)
+    
+    def test_native_render(self):
+        """Test native mode draws linear barcodes as one path"""
+        self.barcode.set_size(120, 10)
+        self.barcode.set_data("SN0123456789")
+        self.barcode.set_render_mode(LabelBarcode.RENDER_MODE.NATIVE)
+        c = canvas.Canvas(BytesIO())
+        self.barcode.draw(c)
+        operations = [op for op in c._code if op.endswith(('re', 'f*', 're f*'))]
+        self.assertEqual(operations[-1], 'f*')
+        self.assertEqual(sum(op.endswith('re f*') for op in c._code), 0)
+        
+        # The path holds the same bars reportlab draws
+        reference = canvas.Canvas(BytesIO())
+        self.barcode.set_render_mode(LabelBarcode.RENDER_MODE.REPORTLAB)
+        self.barcode.draw(reference)
+        bars = sum(op.endswith('re f*') for op in reference._code)
+        self.assertEqual(operations[0].count(' re'), bars)
+    
+    def test_dpi_snapping(self):
+        """Test bar widths are whole printer dots of equal module width"""
+        self.barcode.set_size(120, 10)
+        self.barcode.set_dpi(300)
+        entry = self.barcode._get_cache_entry()
+        pattern = self.barcode._get_bars(entry, 300)
+        dots_per_module = round(entry['barcode'].barWidth / (72.0 / 300))
+        for x, y, width, height in pattern:
+            self.assertIsInstance(x, int)
+            self.assertEqual(width % dots_per_module, 0)
+        
+        # Path operators are formatted once and reused
+        self.barcode.set_render_mode(LabelBarcode.RENDER_MODE.NATIVE)
+        self.barcode.draw(canvas.Canvas(BytesIO()))
+        self.assertTrue(entry['paths'][300].startswith(f"{pattern[0][0]} 0 "))
+    
+    def _ink_extent(self, c):
+        """Left and right page x of the bars drawn on a canvas"""
+        edges = []
+        scale, offset = 1, 0
+        for op in c._code:
+            if op.endswith(' cm'):
+                scale, offset = float(op.split()[0]), float(op.split()[4])
+            for x, _, width, _ in re.findall(r'(\S+) (\S+) (\S+) (\S+) re', op):
+                edges += [offset + scale * float(x), offset + scale * (float(x) + float(width))]
+        return min(edges), max(edges)
+    
+    def test_native_width(self):
+        """Test native mode draws the bars where REPORTLAB mode does"""
+        self.barcode.set_size(120, 10)
+        self.barcode.set_data("SN0123456789")
+        self.barcode.set_location(10.3, 50)
+        reference = canvas.Canvas(BytesIO())
+        self.barcode.draw(reference)
+        left, right = self._ink_extent(reference)
+        
+        self.barcode.set_render_mode(LabelBarcode.RENDER_MODE.NATIVE)
+        symbol = self.barcode._get_cache_entry()['barcode']
+        ink_modules = (symbol.width - symbol.lquiet - symbol.rquiet) / symbol.barWidth
+        for dpi in (None, 203, 300):
+            self.barcode.set_dpi(dpi)
+            c = canvas.Canvas(BytesIO())
+            self.barcode.draw(c)
+            native_left, native_right = self._ink_extent(c)
+            if dpi is None:
+                self.assertAlmostEqual(native_left, left, places=3)
+                self.assertAlmostEqual(native_right, right, places=3)
+            else:
+                # Origin and module width are each rounded to whole dots
+                dot = 72.0 / dpi
+                self.assertLessEqual(abs(native_left - left), dot)
+                self.assertLessEqual(abs((native_right - native_left) - (right - left)), ink_modules * dot / 2)
+    
+    def test_native_fallback(self):
+        """Test native mode keeps drawing widget based types through reportlab"""
+        self.barcode.set_barcode_type("ean13")
+        self.barcode.set_data("590123412345")
+        self.barcode.set_render_mode(LabelBarcode.RENDER_MODE.NATIVE)
+        c = canvas.Canvas(BytesIO())
+        self.barcode.draw(c)
+        self.assertNotIn('paths', self.barcode._get_cache_entry())
 
 if __name__ == '__main__':
     unittest.main()
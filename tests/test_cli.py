@@ -0,0 +1,68 @@
+"""
+Tests for the command line renderer
+"""
+import unittest
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stderr
+from unittest import mock
+from LabelGenerator.cli import main, load_template
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples', 'assets')
+
+class TestCli(unittest.TestCase):
+    """Test cases for the labelgen command"""
+    
+    def setUp(self):
+        """Keep font scans of the example template off the user font cache"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {
+            'LABELGENERATOR_FONT_CACHE': os.path.join(self.temp_dir.name, 'font_index.json')})
+        self.env.start()
+    
+    def tearDown(self):
+        """Remove temporary files"""
+        self.env.stop()
+        self.temp_dir.cleanup()
+    
+    def test_load_template_invalid_spec(self):
+        """Test template specs without an attribute are rejected"""
+        with self.assertRaises(ValueError):
+            load_template('LabelGenerator.template')
+    
+    def test_render_csv(self):
+        """Test rendering the example CSV through the example template"""
+        template = os.path.join(EXAMPLE_DIR, 'template.py') + ':label_template'
+        csv_path = os.path.join(EXAMPLE_DIR, 'contents.csv')
+        with open(csv_path, encoding='utf-8-sig') as f:
+            row_count = sum(1 for _ in f) - 1
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = os.path.join(temp_dir, 'labels.pdf')
+            progress = io.StringIO()
+            with redirect_stderr(progress):
+                exit_code = main([template, csv_path, '-o', output, '--progress', '5'])
+            
+            self.assertEqual(exit_code, 0)
+            with open(output, 'rb') as f:
+                self.assertIn(f'/Count {row_count}'.encode(), f.read())
+            self.assertIn(f'Done: {row_count} labels', progress.getvalue())
+    
+    def test_render_to_stdout(self):
+        """Test '-o -' writes the PDF to stdout and keeps messages on stderr"""
+        template = os.path.join(EXAMPLE_DIR, 'template.py') + ':label_template'
+        csv_path = os.path.join(EXAMPLE_DIR, 'contents.csv')
+        src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [src_dir, os.environ.get('PYTHONPATH')])))
+        result = subprocess.run([sys.executable, '-m', 'LabelGenerator.cli', template, csv_path, '-o', '-'],
+                                capture_output=True, env=env)
+        
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertTrue(result.stdout.startswith(b'%PDF'))
+        self.assertTrue(result.stdout.rstrip().endswith(b'%%EOF'))
+
+if __name__ == '__main__':
+    unittest.main()
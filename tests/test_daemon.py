@@ -0,0 +1,146 @@
+"""
+Tests for the render daemon and its client
+"""
+import unittest
+import io
+import os
+import socket
+import tempfile
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+from LabelGenerator import RenderDaemon, DaemonClient
+from LabelGenerator.client import DaemonError, read_message
+from LabelGenerator.daemon import parse_templates
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples', 'assets')
+
+ROW = {'AssetNum': 'NET202401150001A1B2C3', 'Category': '网络设备', 'Name': 'Router',
+       'Description': '软路由', 'P/N': 'PN-1234', 'S/N': 'SN0001', 'ImportDate': '2024-01-15',
+       'HASH': 'A1B2C3'}
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix sockets are not supported")
+class TestRenderDaemon(unittest.TestCase):
+    """Test cases for RenderDaemon and DaemonClient"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start one daemon for all tests"""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        # Keep font scans of the example template off the user font cache
+        cls.env = mock.patch.dict(os.environ, {
+            'LABELGENERATOR_FONT_CACHE': os.path.join(cls.temp_dir.name, 'font_index.json')})
+        cls.env.start()
+        cls.socket_path = os.path.join(cls.temp_dir.name, 'labelgen.sock')
+        cls.template = os.path.join(EXAMPLE_DIR, 'template.py') + ':label_template'
+        cls.daemon = RenderDaemon({'asset': cls.template}, cls.socket_path, jobs=1)
+        cls.daemon.start()
+        cls.thread = threading.Thread(target=cls.daemon.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the daemon"""
+        cls.daemon.stop()
+        cls.thread.join()
+        cls.env.stop()
+        cls.temp_dir.cleanup()
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = DaemonClient(self.socket_path, timeout=30)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.client.close()
+
+    def test_socket_permissions(self):
+        """Test only the owner can connect to the socket"""
+        self.assertEqual(os.stat(self.socket_path).st_mode & 0o777, 0o600)
+
+    def test_render_pdf(self):
+        """Test rendering rows into PDF bytes over one connection"""
+        for count in (1, 3):
+            content = self.client.render('asset', [ROW] * count)
+            self.assertTrue(content.startswith(b'%PDF'))
+            self.assertIn(f'/Count {count}'.encode(), content)
+
+    def test_render_zpl(self):
+        """Test rendering rows into ZPL at a given resolution"""
+        content = self.client.render('asset', [ROW, ROW], format='zpl', dpi=300)
+        self.assertEqual(content.count(b'^XA'), 2)
+        self.assertIn(b'^PW472', content)
+
+    def test_render_to_file(self):
+        """Test the daemon writes the output file when a path is given"""
+        filename = os.path.join(self.temp_dir.name, 'labels.pdf')
+        self.assertEqual(self.client.render('asset', [ROW], output=filename), filename)
+        with open(filename, 'rb') as f:
+            self.assertTrue(f.read().startswith(b'%PDF'))
+
+    def test_errors(self):
+        """Test rejected jobs raise DaemonError and keep the connection usable"""
+        with self.assertRaises(DaemonError):
+            self.client.render('missing', [ROW])
+        with self.assertRaises(DaemonError):
+            self.client.render('asset', [ROW], format='svg')
+        self.assertTrue(self.client.render('asset', [ROW]).startswith(b'%PDF'))
+        self.assertGreaterEqual(self.client.stats()['failed'], 2)
+
+    def test_malformed_jobs(self):
+        """Test lines that are not job objects are answered with errors on the same connection"""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(10)
+            sock.connect(self.socket_path)
+            stream = sock.makefile('rwb')
+            # A job announcing a payload is answered without waiting for it
+            stream.write(b'[1]\nnot json\n{"id": 7, "command": "stats", "length": 100}\n')
+            stream.flush()
+            for _ in range(2):
+                header, _ = read_message(stream)
+                self.assertFalse(header['ok'])
+                self.assertIn('Invalid job', header['error'])
+            header, _ = read_message(stream)
+            self.assertEqual(header['id'], 7)
+            self.assertTrue(header['ok'])
+            stream.close()
+
+    def test_non_object_response(self):
+        """Test a response that is not a JSON object raises ValueError in the client"""
+        with self.assertRaises(ValueError):
+            read_message(io.BytesIO(b'[1]\n'))
+
+    def test_worker_crash(self):
+        """Test a dead worker is replaced and the next job still renders"""
+        executor = self.daemon._executor
+        crash = executor.submit(os._exit, 1)
+        with self.assertRaises(BrokenProcessPool):
+            crash.result(timeout=30)
+        self.assertTrue(self.client.render('asset', [ROW]).startswith(b'%PDF'))
+        self.assertIsNot(self.daemon._executor, executor)
+
+    def test_socket_in_use(self):
+        """Test a second daemon does not take over the socket of a running one"""
+        with self.assertRaises(OSError):
+            RenderDaemon({'asset': self.template}, self.socket_path, jobs=1).start()
+        self.assertTrue(self.client.render('asset', [ROW]).startswith(b'%PDF'))
+
+    def test_stale_socket(self):
+        """Test a socket file nobody listens on is replaced"""
+        socket_path = os.path.join(self.temp_dir.name, 'stale.sock')
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(socket_path)
+        daemon = RenderDaemon({'asset': self.template}, socket_path, jobs=1)
+        daemon.start()
+        try:
+            self.assertEqual(os.stat(socket_path).st_mode & 0o777, 0o600)
+        finally:
+            daemon.stop()
+
+    def test_parse_templates(self):
+        """Test template arguments with and without names"""
+        self.assertEqual(parse_templates(['asset=pkg.labels:asset', 'pkg.labels:cable']),
+                         {'asset': 'pkg.labels:asset', 'pkg.labels:cable': 'pkg.labels:cable'})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,9 +2,12 @@
 Tests for the document module
 """
 import unittest
+import gc
+import io
 import os
 import tempfile
-from LabelGenerator import LabelDocument, LabelPage
+import weakref
+from LabelGenerator import LabelDocument, LabelPage, LabelText
 
 class TestLabelDocument(unittest.TestCase):
     """Test cases for the LabelDocument class"""
@@ -18,6 +21,23 @@ class TestLabelDocument(unittest.TestCase):
         """Test initialization with default parameters"""
         self.assertEqual(self.document.pages, [])
         self.assertEqual(len(self.document.pages), 0)
+
+    def test_export_stream(self):
+        """Test exporting pages from a generator without adding them"""
+        def generate_pages(count):
+            for _ in range(count):
+                yield LabelPage(width=40, height=30)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'stream', 'labels.pdf')
+            result = self.document.export_stream(generate_pages(3), filename)
+            
+            self.assertEqual(result, filename)
+            self.assertTrue(os.path.exists(filename))
+            with open(filename, 'rb') as f:
+                self.assertIn(b'/Count 3', f.read())
+            # Streamed pages are not kept on the document
+            self.assertEqual(self.document.pages, [])
     
     def test_add_page(self):
         """Test adding pages to document"""
@@ -60,5 +80,138 @@ class TestLabelDocument(unittest.TestCase):
         self.document.clear_pages()
         self.assertEqual(len(self.document.pages), 0)
 
+    def test_export_stream_releases_pages(self):
+        """Test streamed pages are released while later pages are drawn"""
+        references = []
+        alive = []
+        
+        def generate_pages(count):
+            for _ in range(count):
+                # The export loop still holds the previous page, earlier ones must be gone
+                gc.collect()
+                alive.append(sum(1 for ref in references[:-1] if ref() is not None))
+                page = LabelPage(width=40, height=30)
+                references.append(weakref.ref(page))
+                yield page
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.document.export_stream(generate_pages(5), os.path.join(temp_dir, 'labels.pdf'))
+        
+        self.assertEqual(alive, [0] * 5)
+    
+    def test_export_stream_to_stream(self):
+        """Test exporting to a writable binary stream"""
+        buffer = io.BytesIO()
+        pages = (LabelPage(width=40, height=30) for _ in range(3))
+        result = self.document.export_stream(pages, buffer)
+        
+        self.assertIs(result, buffer)
+        self.assertTrue(buffer.getvalue().startswith(b'%PDF'))
+        self.assertIn(b'/Count 3', buffer.getvalue())
+    
+    def test_export_bytes(self):
+        """Test exporting the document pages as PDF bytes"""
+        self.document.add_page(LabelPage(width=40, height=30))
+        content = self.document.export_bytes()
+        
+        self.assertIsInstance(content, bytes)
+        self.assertTrue(content.startswith(b'%PDF'))
+        self.assertIn(b'/Count 1', content)
+    
+    def test_export_parallel(self):
+        """Test parallel export merges chunks in page order"""
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            self.skipTest("pypdf is not installed")
+        
+        # Page widths encode the original order
+        pages = [LabelPage(width=20 + i, height=30) for i in range(7)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'parallel.pdf')
+            self.document.export_parallel(iter(pages), filename, jobs=2, chunk_size=3)
+            
+            reader = PdfReader(filename)
+            widths = [round(float(p.mediabox.width)) for p in reader.pages]
+            self.assertEqual(widths, [round(p.width) for p in pages])
+    
+    def test_export_parallel_to_stream(self):
+        """Test parallel export writes the merged document to a stream"""
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            self.skipTest("pypdf is not installed")
+        
+        buffer = io.BytesIO()
+        pages = [LabelPage(width=40, height=30) for _ in range(5)]
+        self.document.export_parallel(iter(pages), buffer, jobs=2, chunk_size=2)
+        
+        buffer.seek(0)
+        self.assertEqual(len(PdfReader(buffer).pages), 5)
+
+    def test_export_parallel_late_font(self):
+        """Test fonts registered while pages are generated reach running workers"""
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            self.skipTest("pypdf is not installed")
+        import reportlab
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        from LabelGenerator.fonts import font_manager
+        
+        font_path = os.path.join(os.path.dirname(reportlab.__file__), 'fonts', 'VeraBd.ttf')
+        reg_name = 'LateVeraBd'
+        
+        def generate_pages(count):
+            for i in range(count):
+                page = LabelPage(width=40, height=30)
+                text = LabelText()
+                text.set_text(f"SN{i:04d}")
+                if i >= 2:
+                    # Registered after the first chunk was sent to the workers
+                    if reg_name not in font_manager.registered_fonts:
+                        pdfmetrics.registerFont(TTFont(reg_name, font_path))
+                        font_manager.registered_fonts[reg_name] = font_path
+                    text.font_name = reg_name
+                page.add_element(text)
+                yield page
+        
+        buffer = io.BytesIO()
+        try:
+            self.document.export_parallel(generate_pages(6), buffer, jobs=2, chunk_size=2)
+        finally:
+            font_manager.registered_fonts.pop(reg_name, None)
+        
+        buffer.seek(0)
+        fonts = [[str(font['/BaseFont']) for font in page['/Resources']['/Font'].values()]
+                 for page in PdfReader(buffer).pages]
+        self.assertEqual(fonts[:2], [['/Helvetica']] * 2)
+        for page_fonts in fonts[2:]:
+            self.assertTrue(any('BitstreamVeraSans-Bold' in name for name in page_fonts), page_fonts)
+    
+    def test_static_layer_form(self):
+        """Test static elements are written once as a shared Form XObject"""
+        def generate_pages(count):
+            for i in range(count):
+                page = LabelPage(width=40, height=30)
+                page.set_background_color((255, 255, 255))
+                caption = LabelText()
+                caption.set_text("S/N")
+                page.add_element(caption, static=True)
+                serial = LabelText()
+                serial.set_text(f"SN{i:04d}")
+                page.add_element(serial)
+                yield page
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'static.pdf')
+            self.document.export_stream(generate_pages(5), filename)
+            with open(filename, 'rb') as f:
+                content = f.read()
+        
+        self.assertEqual(content.count(b'/Subtype /Form'), 1)
+        self.assertIn(b'/Count 5', content)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,289 @@
+"""
+Tests for the fonts module
+"""
+import unittest
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from unittest import mock
+from LabelGenerator import FontManager, FontRegistry
+from LabelGenerator.fonts import _read_font_names
+
+class TestFontManagerCache(unittest.TestCase):
+    """Test cases for the persistent font index"""
+    
+    def setUp(self):
+        """Set up a font manager scanning a temporary font directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.font_dir = os.path.join(self.temp_dir.name, 'fonts')
+        os.makedirs(os.path.join(self.font_dir, 'sub'))
+        self._touch(os.path.join(self.font_dir, 'Arial.ttf'))
+        self._touch(os.path.join(self.font_dir, 'sub', 'Consolas.ttf'))
+        
+        self.cache_path = os.path.join(self.temp_dir.name, 'cache', 'font_index.json')
+        self.env = mock.patch.dict(os.environ, {'LABELGENERATOR_FONT_CACHE': self.cache_path})
+        self.env.start()
+        
+        # Bypass the singleton so the global font manager is left untouched
+        self.manager = object.__new__(FontManager)
+        self.manager._scanned = True
+        self.manager._scanning = False
+        self.manager._scan_lock = threading.RLock()
+        self.manager.fonts = {}
+        self.manager.fonts_by_family = {}
+        self.manager.registered_fonts = {}
+        self.manager.system_font_dirs = [self.font_dir]
+        self.manager.custom_font_dirs = []
+        self.manager._dir_mtimes = {}
+    
+    def tearDown(self):
+        """Remove temporary files"""
+        self.env.stop()
+        self.temp_dir.cleanup()
+    
+    def _touch(self, path):
+        with open(path, 'wb'):
+            pass
+    
+    def _new_manager(self):
+        manager = object.__new__(FontManager)
+        manager.__dict__.update(self.manager.__dict__)
+        manager.fonts = {}
+        manager.fonts_by_family = {}
+        manager._dir_mtimes = {}
+        return manager
+    
+    def test_scan_writes_cache(self):
+        """Test a cold scan finds fonts recursively and writes the cache"""
+        self.manager._scan_fonts()
+        self.assertEqual(sorted(self.manager.fonts), ['arial', 'consolas'])
+        self.assertTrue(os.path.exists(self.cache_path))
+    
+    def test_scan_follows_symlinks(self):
+        """Test symlinked font directories are scanned and link cycles end"""
+        linked_dir = os.path.join(self.temp_dir.name, 'linked')
+        os.makedirs(linked_dir)
+        self._touch(os.path.join(linked_dir, 'SimHei.ttf'))
+        os.symlink(linked_dir, os.path.join(self.font_dir, 'linked'))
+        os.symlink(self.font_dir, os.path.join(self.font_dir, 'sub', 'loop'))
+        
+        self.manager._scan_directories([self.font_dir])
+        self.assertEqual(sorted(self.manager.fonts), ['arial', 'consolas', 'simhei'])
+        self.assertNotIn(os.path.join(self.font_dir, 'sub', 'loop'), self.manager._dir_mtimes)
+    
+    def test_warm_start_uses_cache(self):
+        """Test an unchanged font tree is loaded without scanning"""
+        self.manager._scan_fonts()
+        
+        manager = self._new_manager()
+        self.assertEqual(self._scanned_directories(manager), [])
+        self.assertEqual(manager.fonts, self.manager.fonts)
+        self.assertEqual(manager.fonts_by_family, self.manager.fonts_by_family)
+        
+        # The same check sees the rescan once the cache is gone
+        os.remove(self.cache_path)
+        self.assertEqual(self._scanned_directories(self._new_manager()), [self.font_dir])
+    
+    def test_lookup_waits_for_scan(self):
+        """Test a lookup from another thread during the first scan waits instead of caching a miss"""
+        self.manager._scanned = False
+        started = threading.Event()
+        release = threading.Event()
+        scan_fonts = FontManager._scan_fonts
+        
+        def slow_scan(manager):
+            started.set()
+            release.wait(10)
+            scan_fonts(manager)
+        
+        results = []
+        with mock.patch.object(FontManager, '_scan_fonts', autospec=True, side_effect=slow_scan):
+            scanner = threading.Thread(target=self.manager._ensure_scanned)
+            scanner.start()
+            try:
+                self.assertTrue(started.wait(10))
+                lookup = threading.Thread(target=lambda: results.append(self.manager.get_font_path('Arial')))
+                lookup.start()
+                lookup.join(0.2)
+                waited = lookup.is_alive()
+            finally:
+                release.set()
+                scanner.join(10)
+            lookup.join(10)
+        
+        self.assertTrue(waited)
+        self.assertEqual(results, [os.path.join(self.font_dir, 'Arial.ttf')])
+    
+    def _scanned_directories(self, manager):
+        """Run _scan_fonts and return the directories handed to the scanner"""
+        scan_directories = FontManager._scan_directories
+        with mock.patch.object(FontManager, '_scan_directories', autospec=True,
+                               side_effect=scan_directories) as scan:
+            manager._scan_fonts()
+        return [directory for call in scan.call_args_list for directory in call[0][1]]
+    
+    def test_changed_directory_invalidates_cache(self):
+        """Test adding a font file triggers a rescan"""
+        self.manager._scan_fonts()
+        
+        new_font = os.path.join(self.font_dir, 'sub', 'SimHei.ttf')
+        self._touch(new_font)
+        # Make sure the directory mtime differs even on coarse timestamp filesystems
+        stat = os.stat(os.path.dirname(new_font))
+        os.utime(os.path.dirname(new_font), (stat.st_atime, stat.st_mtime + 10))
+        
+        manager = self._new_manager()
+        manager._scan_fonts()
+        self.assertIn('simhei', manager.fonts)
+
+class TestFontLookup(unittest.TestCase):
+    """Test cases for indexed font lookup"""
+    
+    def setUp(self):
+        """Set up a font manager with a fixed font list"""
+        self.manager = object.__new__(FontManager)
+        self.manager._scanned = True
+        self.manager.fonts = {}
+        self.manager.fonts_by_family = {}
+        self.manager.system_font_dirs = []
+        for path in ['/fonts/DejaVuSans.ttf', '/fonts/DejaVuSans-Bold.ttf',
+                     '/fonts/NotoSansCJK-Regular.ttc', '/fonts/NotoSansCJK-Bold.ttc']:
+            self.manager._register_font_path(path)
+    
+    def test_exact_and_styled_match(self):
+        """Test exact and styled names are found"""
+        self.assertEqual(self.manager.get_font_path('DejaVu Sans'), '/fonts/DejaVuSans.ttf')
+        self.assertEqual(self.manager.get_font_path('NotoSansCJK-', 'Bold'), '/fonts/NotoSansCJK-Bold.ttc')
+    
+    def test_substring_match_keeps_scan_order(self):
+        """Test fuzzy matching returns the first font in scan order"""
+        self.assertEqual(self.manager.get_font_path('sanscjk'), '/fonts/NotoSansCJK-Regular.ttc')
+        self.assertEqual(self.manager.get_font_path('bold'), '/fonts/DejaVuSans-Bold.ttf')
+        # Names shorter than the n-gram size are matched too
+        self.assertEqual(self.manager.get_font_path('ns'), '/fonts/DejaVuSans.ttf')
+    
+    def test_lookup_is_memoized(self):
+        """Test repeated lookups, including misses, are memoized"""
+        self.assertIsNone(self.manager.get_font_path('Missing Font'))
+        with mock.patch.object(FontManager, '_search_font_path') as search:
+            self.assertIsNone(self.manager.get_font_path('missingfont'))
+            self.manager.get_font_path('DejaVu Sans', 'bold')
+            self.manager.get_font_path('DejaVu Sans', 'bold')
+            self.assertEqual(search.call_count, 1)
+    
+    def test_new_font_invalidates_memo(self):
+        """Test adding fonts clears memoized misses"""
+        self.assertIsNone(self.manager.get_font_path('Consolas'))
+        self.manager._register_font_path('/fonts/Consolas.ttf')
+        self.assertEqual(self.manager.get_font_path('Consolas'), '/fonts/Consolas.ttf')
+
+class TestFontNames(unittest.TestCase):
+    """Test cases for reading names from font files"""
+    
+    def setUp(self):
+        """Locate the fonts shipped with ReportLab"""
+        import reportlab
+        self.font_dir = os.path.join(os.path.dirname(reportlab.__file__), 'fonts')
+    
+    def test_read_font_names(self):
+        """Test family and subfamily are read from the name table"""
+        names = _read_font_names(os.path.join(self.font_dir, 'VeraBd.ttf'))
+        self.assertEqual(names, ('Bitstream Vera Sans', 'Bold'))
+        self.assertIsNone(_read_font_names(__file__))
+    
+    def test_scan_uses_font_names(self):
+        """Test scanned fonts are grouped by their real family name"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for filename in ['Vera.ttf', 'VeraBd.ttf']:
+                shutil.copy(os.path.join(self.font_dir, filename), os.path.join(temp_dir, filename))
+            
+            manager = object.__new__(FontManager)
+            manager._scanned = True
+            manager.fonts = {}
+            manager.fonts_by_family = {}
+            manager._dir_mtimes = {}
+            manager._scan_directories([temp_dir])
+            
+            self.assertEqual(manager.fonts_by_family, {'bitstreamverasans': ['vera', 'verabd']})
+            self.assertEqual(manager.fonts['verabd']['style'], 'Bold')
+            self.assertEqual(manager.get_font_path('Bitstream Vera Sans', 'bold'),
+                             os.path.join(temp_dir, 'VeraBd.ttf'))
+
+class TestFontRegistry(unittest.TestCase):
+    """Test cases for the resolved font registry"""
+    
+    def test_resolve_once(self):
+        """Test each font and style is resolved through the manager once"""
+        manager = mock.Mock()
+        manager.register_font.side_effect = lambda name, style: None if name == 'Missing' else f"{name}-{style}"
+        registry = FontRegistry(manager)
+        
+        for _ in range(3):
+            self.assertEqual(registry.resolve('Consolas', 'bold'), 'Consolas-bold')
+            self.assertIsNone(registry.resolve('Missing'))
+        
+        self.assertEqual(manager.register_font.call_count, 2)
+        self.assertEqual(registry.stats(), {'hits': 4, 'resolutions': 2, 'misses': 1, 'size': 2})
+        
+        registry.clear()
+        self.assertEqual(registry.stats()['size'], 0)
+    
+    def test_retry_after_new_fonts(self):
+        """Test fonts that were not found are resolved again once new fonts are known"""
+        manager = object.__new__(FontManager)
+        manager._scanned = True
+        manager.fonts = {}
+        manager.fonts_by_family = {}
+        registry = FontRegistry(manager)
+        register = lambda name, style: manager.get_font_path(name, style) and name
+        with mock.patch.object(manager, 'register_font', side_effect=register) as register_font:
+            self.assertIsNone(registry.resolve('Consolas'))
+            self.assertIsNone(registry.resolve('Consolas'))
+            self.assertEqual(register_font.call_count, 1)
+            
+            manager._register_font_path('/fonts/Consolas.ttf')
+            self.assertEqual(registry.resolve('Consolas'), 'Consolas')
+            self.assertEqual(registry.resolve('Consolas'), 'Consolas')
+            self.assertEqual(register_font.call_count, 2)
+
+class TestLazyImport(unittest.TestCase):
+    """Test cases for lazy package and font manager initialization"""
+    
+    def setUp(self):
+        """Keep font scans of the child processes off the user font cache"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        """Remove temporary files"""
+        self.temp_dir.cleanup()
+    
+    def _run(self, code):
+        src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+        env = dict(os.environ, PYTHONPATH=os.path.abspath(src_dir),
+                   LABELGENERATOR_FONT_CACHE=os.path.join(self.temp_dir.name, 'font_index.json'))
+        return subprocess.run([sys.executable, '-c', code], env=env,
+                              capture_output=True, text=True, check=True).stdout.split()
+    
+    def test_import_does_not_load_dependencies(self):
+        """Test importing the package does not import ReportLab"""
+        output = self._run("import sys, LabelGenerator; print('reportlab' in sys.modules)")
+        self.assertEqual(output, ['False'])
+    
+    def test_standard_font_does_not_scan(self):
+        """Test fonts are only scanned when a non-standard font is requested"""
+        output = self._run(
+            "from LabelGenerator import LabelText, font_manager, logger\n"
+            "logger.set_level('error')\n"
+            "text = LabelText()\n"
+            "text.set_font('Helvetica', 10)\n"
+            "print(font_manager._scanned)\n"
+            "text.set_font('NoSuchFont', 10)\n"
+            "print(font_manager._scanned)"
+        )
+        self.assertEqual(output, ['False', 'True'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Tests for the imposition module
+"""
+import unittest
+import os
+import tempfile
+from reportlab.lib.units import mm
+from LabelGenerator import LabelDocument, LabelPage, LabelText, SheetLayout
+
+class TestSheetLayout(unittest.TestCase):
+    """Test cases for the SheetLayout class"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.temp_dir.cleanup()
+    
+    def make_pages(self, count):
+        """Create pages with a static caption and a serial number"""
+        for i in range(count):
+            page = LabelPage(width=40, height=30)
+            caption = LabelText()
+            caption.set_text("S/N")
+            caption.set_location(2, 10)
+            page.add_element(caption, static=True)
+            serial = LabelText()
+            serial.set_text(f"SN{i:04d}")
+            serial.set_location(2, 20)
+            page.add_element(serial)
+            yield page
+    
+    def test_fit_grid(self):
+        """Test columns and rows are fitted to the sheet"""
+        layout = SheetLayout(40, 30)
+        self.assertEqual((layout.columns, layout.rows), (4, 9))
+        self.assertEqual(layout.per_sheet, 36)
+        
+        layout = SheetLayout(40, 30, columns=2, rows=3, margin=(10, 0, 0, 20), gutter=(5, 4))
+        positions = layout.positions()
+        self.assertEqual(len(positions), 6)
+        self.assertAlmostEqual(positions[0][0], 20 * mm)
+        self.assertAlmostEqual(positions[0][1], (297 - 10 - 30) * mm)
+        self.assertAlmostEqual(positions[1][0], 65 * mm)
+        self.assertAlmostEqual(positions[2][1], (297 - 10 - 30 - 34) * mm)
+    
+    def test_too_large(self):
+        """Test labels larger than the sheet are rejected"""
+        with self.assertRaises(ValueError):
+            SheetLayout(300, 30)
+    
+    def test_cut_marks(self):
+        """Test cut marks line up with cell edges and stay on the sheet"""
+        layout = SheetLayout(40, 30, columns=2, rows=2, margin=5, gutter=0, cut_marks=True)
+        lines = layout.cut_mark_lines()
+        # 3 vertical edges top and bottom, 3 horizontal edges left and right
+        self.assertEqual(len(lines), 12)
+        width, height = layout.size
+        for x1, y1, x2, y2 in lines:
+            for x, y in ((x1, y1), (x2, y2)):
+                self.assertTrue(0 <= x <= width and 0 <= y <= height)
+        self.assertEqual(SheetLayout(40, 30, margin=0).cut_mark_lines(), [])
+    
+    def test_export_imposed(self):
+        """Test labels are tiled onto sheets sharing one static layer"""
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            self.skipTest("pypdf is not installed")
+        filename = os.path.join(self.temp_dir.name, "sheets.pdf")
+        layout = SheetLayout(40, 30, cut_marks=True)
+        LabelDocument().export_imposed(self.make_pages(40), filename, layout)
+        
+        reader = PdfReader(filename)
+        self.assertEqual(len(reader.pages), 2)
+        self.assertAlmostEqual(float(reader.pages[0].mediabox.width), 210 * mm, places=2)
+        content = reader.pages[0].get_contents().get_data()
+        self.assertEqual(content.count(b"StaticLayer1 Do"), 36)
+        self.assertEqual(content.count(b" re W* n"), 36)
+        content = reader.pages[1].get_contents().get_data()
+        self.assertEqual(content.count(b"StaticLayer1 Do"), 4)
+    
+    def test_export_imposed_logs_failure(self):
+        """Test a failing page source is logged and re-raised"""
+        def pages():
+            yield from self.make_pages(2)
+            raise RuntimeError("page source failed")
+        
+        filename = os.path.join(self.temp_dir.name, "sheets.pdf")
+        with self.assertLogs('LabelGenerator', level='ERROR') as logs:
+            with self.assertRaises(RuntimeError):
+                LabelDocument().export_imposed(pages(), filename, SheetLayout(40, 30))
+        self.assertIn("Imposed PDF export failed: page source failed", logs.output[-1])
+
+if __name__ == '__main__':
+    unittest.main()
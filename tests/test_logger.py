@@ -0,0 +1,102 @@
+"""
+Tests for the logger module
+"""
+import unittest
+import gzip
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from LabelGenerator import logger, LabelText
+
+class TestLabelLogger(unittest.TestCase):
+    """Test cases for the LabelLogger class"""
+    
+    def tearDown(self):
+        """Restore default logger settings"""
+        logger.set_level('info')
+        logger.set_quiet_render(False)
+    
+    def test_lazy_message_formatting(self):
+        """Test message arguments are not formatted for disabled levels"""
+        class Counter:
+            calls = 0
+            def __str__(self):
+                Counter.calls += 1
+                return "counter"
+        
+        logger.set_level('info')
+        self.assertFalse(logger.is_enabled_for('debug'))
+        logger.debug("Value: %s", Counter())
+        logger.render.debug("Value: %s", Counter())
+        self.assertEqual(Counter.calls, 0)
+    
+    def test_quiet_render(self):
+        """Test quiet render mode drops per-element messages only"""
+        with self.assertLogs('LabelGenerator', level='INFO') as logs:
+            LabelText()
+            logger.set_quiet_render(True)
+            LabelText()
+            logger.render.warning("Render warning")
+            logger.info("Export message")
+        
+        messages = [record.getMessage() for record in logs.records]
+        self.assertEqual(messages, ["Created new text element", "Render warning", "Export message"])
+
+    def test_async_rotating_file_logging(self):
+        """Test queued file logging with size based rotation and compression"""
+        logger.set_level('info')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger.enable_async_logging()
+            try:
+                logger.enable_file_logging(temp_dir, 'render.log', max_bytes=200, backup_count=2, compress=True)
+                self.assertIs(logger.logger.handlers[-1], logger.queue_handler)
+                for i in range(20):
+                    logger.info("Rotating log line %s", i)
+            finally:
+                # Flushes the queue and stops the background thread
+                logger.disable_async_logging()
+                logger.disable_file_logging()
+            
+            files = sorted(os.listdir(temp_dir))
+            self.assertEqual(files, ['render.log', 'render.log.1.gz', 'render.log.2.gz'])
+            with gzip.open(os.path.join(temp_dir, 'render.log.1.gz'), 'rt', encoding='utf-8') as f:
+                self.assertIn('Rotating log line', f.read())
+            with open(os.path.join(temp_dir, 'render.log'), encoding='utf-8') as f:
+                self.assertIn('Rotating log line 19', f.read())
+        
+        self.assertIsNone(logger.queue_listener)
+        self.assertIn(logger.console_handler, logger.logger.handlers)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), "fork is not supported")
+    def test_async_logging_in_forked_worker(self):
+        """Test records logged in a forked export worker reach the log file"""
+        from LabelGenerator.document import _init_export_worker
+        logger.set_level('info')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger.enable_file_logging(temp_dir, 'worker.log')
+            logger.enable_async_logging()
+            try:
+                context = multiprocessing.get_context('fork')
+                with ProcessPoolExecutor(max_workers=1, mp_context=context,
+                                         initializer=_init_export_worker, initargs=({},)) as executor:
+                    executor.submit(_log_in_worker, "Worker log line").result()
+                # A plain forked process, without the export worker initializer
+                process = context.Process(target=_log_in_worker, args=("Forked log line",))
+                process.start()
+                process.join()
+            finally:
+                logger.disable_async_logging()
+                logger.disable_file_logging()
+            
+            with open(os.path.join(temp_dir, 'worker.log'), encoding='utf-8') as f:
+                content = f.read()
+        self.assertIn('Worker log line', content)
+        self.assertIn('Forked log line', content)
+
+def _log_in_worker(message):
+    """Log one message, run in a child process"""
+    logger.info(message)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -55,6 +55,26 @@ class TestLabelPage(unittest.TestCase):
         self.assertEqual(len(self.page.elements), 3)
         self.assertEqual(self.page.elements[2], qrcode)
     
+    def test_add_static_element(self):
+        """Test adding elements to the static layer"""
+        caption = LabelText()
+        caption.set_text("S/N")
+        self.page.add_element(caption, static=True)
+        self.page.add_element(LabelText())
+        self.assertEqual(len(self.page.elements), 2)
+        self.assertEqual(self.page.static_elements, [caption])
+        
+        # Pages with the same static content share the same key
+        other = LabelPage(width=100, height=150)
+        other_caption = LabelText()
+        other_caption.set_text("S/N")
+        other.add_element(other_caption, static=True)
+        self.assertEqual(self.page.static_key(), other.static_key())
+        
+        other_caption.set_text("P/N")
+        self.assertNotEqual(self.page.static_key(), other.static_key())
+        self.assertIsNone(LabelPage().static_key())
+    
     def test_clear_elements(self):
         """Test clearing all elements from page"""
         # Add elements
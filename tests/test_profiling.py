@@ -0,0 +1,94 @@
+"""
+Tests for the profiling module
+"""
+import unittest
+import os
+import tempfile
+from LabelGenerator import LabelDocument, LabelPage, LabelText, LabelQRCode, ExportProfiler
+
+class TestExportProfiler(unittest.TestCase):
+    """Test cases for the ExportProfiler class"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.temp_dir.name, "profile.pdf")
+        self.doc = LabelDocument()
+        for i in range(3):
+            page = LabelPage(width=40, height=30)
+            self.doc.add_page(page)
+            caption = LabelText()
+            caption.set_text("Asset")
+            page.add_element(caption, static=True)
+            text = LabelText()
+            text.set_text(f"SN{i:03d}")
+            page.add_element(text)
+            qrcode = LabelQRCode()
+            qrcode.set_data(f"SN{i:03d}")
+            page.add_element(qrcode)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.temp_dir.cleanup()
+    
+    def test_record(self):
+        """Test events are grouped by kind and name"""
+        profiler = ExportProfiler()
+        profiler.record(ExportProfiler.STAGE, 'save', 0.5)
+        profiler.record(ExportProfiler.ELEMENT, 'LabelText', 0.1)
+        profiler.record(ExportProfiler.ELEMENT, 'LabelText', 0.3)
+        profiler.record(ExportProfiler.PAGE, 1, 0.4)
+        
+        summary = profiler.summary()
+        self.assertEqual(summary.stages['save'].total, 0.5)
+        self.assertEqual(summary.elements['LabelText'].count, 2)
+        self.assertAlmostEqual(summary.elements['LabelText'].mean, 0.2)
+        self.assertEqual(summary.elements['LabelText'].max, 0.3)
+        self.assertEqual(summary.pages.count, 1)
+        
+        profiler.reset()
+        self.assertEqual(profiler.summary().pages.count, 0)
+    
+    def test_export_pdf(self):
+        """Test export records stages, pages and element types"""
+        profiler = ExportProfiler()
+        self.doc.export_pdf(self.output, profiler=profiler)
+        self.assertTrue(os.path.exists(self.output))
+        
+        summary = profiler.summary()
+        self.assertEqual(summary.pages.count, 3)
+        self.assertEqual(set(summary.stages), {'canvas', 'draw', 'show_page', 'save'})
+        self.assertEqual(summary.stages['draw'].count, 3)
+        self.assertEqual(summary.stages['save'].count, 1)
+        # The static caption is drawn once into the shared form
+        self.assertEqual(summary.elements['LabelText'].count, 4)
+        self.assertEqual(summary.elements['LabelQRCode'].count, 3)
+        
+        data = summary.as_dict()
+        self.assertEqual(data['pages']['count'], 3)
+        self.assertIn("Element LabelQRCode", str(summary))
+    
+    def test_parallel_export_rejects_profiler(self):
+        """Test a profiler is not silently dropped by worker process exports"""
+        profiler = ExportProfiler()
+        with self.assertRaises(ValueError):
+            self.doc.export_pdf(self.output, jobs=2, profiler=profiler)
+        with self.assertRaises(ValueError):
+            self.doc.export_bytes(jobs=2, profiler=profiler)
+        self.assertFalse(os.path.exists(self.output))
+        # jobs=1 renders in this process and is profiled
+        self.doc.export_bytes(jobs=1, profiler=profiler)
+        self.assertEqual(profiler.summary().pages.count, 3)
+    
+    def test_callback(self):
+        """Test events are forwarded to the callback"""
+        events = []
+        profiler = ExportProfiler(callback=lambda kind, name, seconds: events.append((kind, name)))
+        self.doc.export_stream(iter(self.doc.pages), self.output, profiler=profiler)
+        
+        self.assertEqual(events[0], ('stage', 'canvas'))
+        self.assertEqual(events[-1], ('stage', 'save'))
+        self.assertIn(('page', 3), events)
+
+if __name__ == '__main__':
+    unittest.main()
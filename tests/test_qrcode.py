@@ -109,5 +109,95 @@ class TestLabelQRCode(unittest.TestCase):
         cached_image = self.qrcode._generate_qr()
         self.assertEqual(cached_image, image)
 
+    def test_vector_render_mode(self):
+        """Test vector rendering draws modules without embedding an image"""
+        from io import BytesIO
+        from reportlab.pdfgen import canvas
+        
+        self.qrcode.set_data("https://example.com")
+        self.qrcode.set_render_mode(LabelQRCode.RENDER_MODE.VECTOR)
+        self.assertEqual(self.qrcode.render_mode, LabelQRCode.RENDER_MODE.VECTOR)
+        
+        buffer = BytesIO()
+        c = canvas.Canvas(buffer)
+        self.qrcode.set_location(10, 100)
+        self.qrcode.draw(c)
+        c.showPage()
+        c.save()
+        
+        self.assertIsNotNone(self.qrcode._qr_matrix)
+        self.assertIsNone(self.qrcode._qr_image)
+        self.assertNotIn(b'/Subtype /Image', buffer.getvalue())
+
+    def test_shared_cache(self):
+        """Test encoded QR codes are shared across instances"""
+        LabelQRCode.clear_cache()
+        
+        first = LabelQRCode()
+        first.set_data("NET2023112115CA4C")
+        first._generate_qr_matrix()
+        self.assertEqual(LabelQRCode.cache_stats()['misses'], 1)
+        
+        # Same data, level and color on a new instance hits the cache
+        second = LabelQRCode()
+        second.set_data("NET2023112115CA4C")
+        second._generate_qr_matrix()
+        self.assertIs(second._qr_matrix, first._qr_matrix)
+        self.assertEqual(LabelQRCode.cache_stats()['hits'], 1)
+        
+        # A different error correction level is a different entry
+        second.set_error_correction(LabelQRCode.ERROR_LEVEL.HIGH)
+        second._generate_qr_matrix()
+        self.assertEqual(LabelQRCode.cache_stats()['misses'], 2)
+    
+    def test_shared_cache_holds_matrix_only(self):
+        """Test cache entries are compact matrices shared by all colors"""
+        LabelQRCode.clear_cache()
+        self.qrcode.set_data("NET2023112115CA4C")
+        self.qrcode._generate_qr_code()
+        self.qrcode.set_color((255, 0, 0))
+        self.qrcode._generate_qr_code()
+        
+        stats = LabelQRCode.cache_stats()
+        self.assertEqual((stats['misses'], stats['size']), (1, 1))
+        entry = self.qrcode._get_cache_entry()
+        self.assertEqual(list(entry), ['matrix'])
+        self.assertTrue(all(isinstance(row, bytes) for row in entry['matrix']))
+    
+    def test_shared_cache_eviction(self):
+        """Test the shared cache is bounded with LRU eviction"""
+        LabelQRCode.clear_cache()
+        LabelQRCode.set_cache_size(2)
+        try:
+            for data in ["A", "B", "A", "C"]:
+                self.qrcode.set_data(data)
+                self.qrcode._generate_qr_matrix()
+            
+            stats = LabelQRCode.cache_stats()
+            self.assertEqual(stats['size'], 2)
+            self.assertEqual(stats['evictions'], 1)
+            # "B" was least recently used and has been evicted
+            self.assertNotIn(("B", LabelQRCode.ERROR_LEVEL.MEDIUM.value), LabelQRCode.cache)
+            self.assertIn(("C", LabelQRCode.ERROR_LEVEL.MEDIUM.value), LabelQRCode.cache)
+        finally:
+            LabelQRCode.set_cache_size(4096)
+            LabelQRCode.clear_cache()
+
+    def test_colored_palette_image(self):
+        """Test colored QR codes are generated as two-color palette images"""
+        LabelQRCode.clear_cache()
+        self.qrcode.set_data("https://example.com")
+        self.qrcode.set_color((255, 0, 0))
+        image = self.qrcode._generate_qr_code()
+        
+        self.assertEqual(image.mode, "P")
+        self.assertEqual(image.getpalette()[:6], [255, 0, 0, 255, 255, 255])
+        # Top-left module of the finder pattern is dark, i.e. the QR code color
+        self.assertEqual(image.convert("RGB").getpixel((0, 0)), (255, 0, 0))
+        
+        modules = len(self.qrcode._qr_matrix or self.qrcode._generate_qr_matrix())
+        # One pixel per module, drawImage scales the image to the element size
+        self.assertEqual(image.size, (modules, modules))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,163 @@
+"""
+Tests for the raster module
+"""
+import unittest
+import io
+import os
+import re
+import tempfile
+from unittest import mock
+from PIL import Image, ImageFont
+from reportlab.pdfgen import canvas
+from LabelGenerator import LabelDocument, LabelPage, LabelText, LabelBarcode, LabelQRCode, RasterRenderer
+
+class TestRasterRenderer(unittest.TestCase):
+    """Test cases for the RasterRenderer class"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.renderer = RasterRenderer(dpi=203)
+        self.page = LabelPage(width=60, height=40)
+        self.text = LabelText()
+        self.text.set_text("SN001")
+        self.text.set_location(5, 20)
+        self.page.add_element(self.text)
+        self.barcode = LabelBarcode()
+        self.barcode.set_location(5, 100)
+        self.barcode.set_size(120, 20)
+        self.barcode.set_data("SN001")
+        self.page.add_element(self.barcode)
+        self.qrcode = LabelQRCode()
+        self.qrcode.set_location(100, 5)
+        self.qrcode.set_size(50, 50)
+        self.qrcode.set_data("NET001")
+        self.page.add_element(self.qrcode)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.temp_dir.cleanup()
+    
+    def test_render_page(self):
+        """Test pages render to 1-bit images at the printer resolution"""
+        image = self.renderer.render_page(self.page)
+        self.assertEqual(image.mode, '1')
+        self.assertEqual(image.size, (round(self.page.width * 203 / 72), round(self.page.height * 203 / 72)))
+        # Corner of the QR finder pattern is black, the page corner is white
+        self.assertEqual(image.getpixel((round(100 * 203 / 72) + 1, round(5 * 203 / 72) + 1)), 0)
+        self.assertNotEqual(image.getpixel((0, 0)), 0)
+    
+    def test_barcode_modules(self):
+        """Test barcode bars are whole dots wide and sit above the element y"""
+        image = self.renderer.render_page(self.page)
+        bottom = round(100 * 203 / 72)
+        row = [image.getpixel((x, bottom - 2)) for x in range(image.width)]
+        runs = []
+        previous, length = row[0], 0
+        for value in row:
+            if value == previous:
+                length += 1
+            else:
+                if previous == 0:
+                    runs.append(length)
+                previous, length = value, 1
+        narrow = min(runs)
+        self.assertGreater(len(runs), 10)
+        self.assertTrue(all(run % narrow == 0 for run in runs))
+        self.assertNotEqual(image.getpixel((round(5 * 203 / 72) + 40, bottom + 2)), 0)
+    
+    def test_barcode_matches_pdf(self):
+        """Test raster bars span the width the PDF export draws"""
+        self.barcode.set_data("SN0123456789")
+        c = canvas.Canvas(io.BytesIO())
+        self.barcode.draw(c)
+        edges = []
+        offset = 0
+        for op in c._code:
+            if op.endswith(' cm'):
+                offset = float(op.split()[4])
+            for x, _, width, _ in re.findall(r'(\S+) (\S+) (\S+) (\S+) re', op):
+                edges += [offset + float(x), offset + float(x) + float(width)]
+        
+        image = self.renderer.render_page(self.page)
+        row = [image.getpixel((x, round(100 * 203 / 72) - 2)) for x in range(image.width)]
+        black = [x for x, value in enumerate(row) if value == 0]
+        dot = 72 / 203
+        symbol = self.barcode._get_cache_entry()['barcode']
+        modules = (symbol.width - symbol.lquiet - symbol.rquiet) / symbol.barWidth
+        self.assertLessEqual(abs(black[0] * dot - min(edges)), dot)
+        self.assertLessEqual(abs((black[-1] + 1 - black[0]) * dot - (max(edges) - min(edges))), modules * dot / 2)
+    
+    def test_fixed_default_font(self):
+        """Test barcode text renders with the bitmap default font of older Pillow"""
+        load_default = ImageFont.load_default
+        
+        def fixed_size(*args, **kwargs):
+            if args or kwargs:
+                raise TypeError("load_default() takes 0 positional arguments")
+            return load_default()
+        
+        self.barcode.enable_text()
+        with mock.patch.object(ImageFont, 'load_default', side_effect=fixed_size):
+            image = self.renderer.render_page(self.page)
+        # Human readable text is drawn below the bars
+        bottom = round(100 * 203 / 72)
+        self.assertTrue(any(image.getpixel((x, y)) == 0
+                            for x in range(image.width) for y in range(bottom + 1, image.height)))
+    
+    def test_static_layer(self):
+        """Test the static layer is rendered once and reused"""
+        caption = LabelText()
+        caption.set_text("S/N")
+        caption.set_location(5, 40)
+        self.page.add_element(caption, static=True)
+        first = self.renderer.render_page(self.page)
+        self.qrcode.set_data("NET002")
+        second = self.renderer.render_page(self.page)
+        self.assertEqual(len(self.renderer._static_layers), 1)
+        self.assertNotEqual(first.tobytes(), second.tobytes())
+        
+        # The static layer matches a page drawn without it
+        plain = LabelPage(width=60, height=40)
+        for element in self.page.elements:
+            plain.add_element(element)
+        self.assertEqual(self.renderer.render_page(plain).tobytes(), second.tobytes())
+    
+    def test_background(self):
+        """Test dark backgrounds render black"""
+        page = LabelPage(width=10, height=10)
+        page.set_background_color((0, 0, 0))
+        image = self.renderer.render_page(page)
+        self.assertEqual(image.getextrema(), (0, 0))
+    
+    def test_export_pattern(self):
+        """Test numbered filenames write one PNG per label"""
+        pattern = os.path.join(self.temp_dir.name, "labels", "{:03d}.png")
+        count = self.renderer.export([self.page, self.page], pattern)
+        self.assertEqual(count, 2)
+        with Image.open(pattern.format(2)) as image:
+            self.assertEqual(image.mode, '1')
+    
+    def test_export_pbm_batch(self):
+        """Test a PBM file holds all labels as consecutive images"""
+        filename = os.path.join(self.temp_dir.name, "labels.pbm")
+        count = LabelDocument().export_raster(iter([self.page] * 3), filename, dpi=300)
+        self.assertEqual(count, 3)
+        with open(filename, 'rb') as f:
+            data = f.read()
+        self.assertEqual(data.count(b"P4\n"), 3)
+    
+    def test_export_stream(self):
+        """Test a binary stream receives all labels as PBM images"""
+        buffer = io.BytesIO()
+        count = self.renderer.export([self.page] * 2, buffer)
+        self.assertEqual(count, 2)
+        self.assertEqual(buffer.getvalue().count(b"P4\n"), 2)
+    
+    def test_export_batch_png(self):
+        """Test PNG batches need a filename pattern"""
+        with self.assertRaises(ValueError):
+            self.renderer.export([self.page], os.path.join(self.temp_dir.name, "labels.png"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Tests for the template module
+"""
+import unittest
+import os
+import tempfile
+from LabelGenerator import LabelDocument, LabelTemplate, LabelText, LabelBarcode, LabelQRCode
+
+class TestLabelTemplate(unittest.TestCase):
+    """Test cases for the LabelTemplate class"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.template = LabelTemplate(width=40, height=30)
+        self.caption = LabelText()
+        self.caption.set_text("S/N")
+        self.template.add_element(self.caption)
+        self.serial = LabelText()
+        self.template.add_slot("sn", self.serial)
+        self.qrcode = LabelQRCode()
+        self.template.add_slot("asset", self.qrcode)
+    
+    def test_add_element_is_static(self):
+        """Test fixed elements go to the static layer"""
+        self.assertEqual(self.template.page.static_elements, [self.caption])
+        self.assertEqual(len(self.template.page.elements), 3)
+    
+    def test_duplicate_slot(self):
+        """Test adding a slot name twice is rejected"""
+        with self.assertRaises(ValueError):
+            self.template.add_slot("sn", LabelBarcode())
+    
+    def test_fill(self):
+        """Test filling slots reuses the same page and elements"""
+        page = self.template.fill({"sn": "SN001", "asset": "NET001"})
+        self.assertEqual(self.serial.text, "SN001")
+        self.assertEqual(self.qrcode.data, "NET001")
+        
+        second = self.template.fill({"sn": "SN002"})
+        self.assertIs(second, page)
+        self.assertEqual(page.elements[1], self.serial)
+        self.assertEqual(self.serial.text, "SN002")
+        # Missing values fall back to the slot default
+        self.assertEqual(self.qrcode.data, "")
+    
+    def test_export_pages(self):
+        """Test exporting template rows through a stream"""
+        rows = [{"sn": f"SN{i:03d}", "asset": f"NET{i:03d}"} for i in range(4)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'template.pdf')
+            LabelDocument().export_stream(self.template.pages(rows), filename)
+            with open(filename, 'rb') as f:
+                content = f.read()
+        
+        self.assertIn(b'/Count 4', content)
+        self.assertEqual(content.count(b'/Subtype /Form'), 1)
+
+if __name__ == '__main__':
+    unittest.main()
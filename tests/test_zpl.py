@@ -0,0 +1,102 @@
+"""
+Tests for the zpl module
+"""
+import unittest
+import io
+import os
+import tempfile
+from LabelGenerator import LabelDocument, LabelPage, LabelText, LabelBarcode, LabelQRCode, ZPLRenderer
+
+class TestZPLRenderer(unittest.TestCase):
+    """Test cases for the ZPLRenderer class"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.renderer = ZPLRenderer(dpi=203)
+        self.page = LabelPage(width=60, height=40)
+        self.text = LabelText()
+        self.text.set_text("SN001")
+        self.text.set_location(5, 20)
+        self.page.add_element(self.text)
+        self.barcode = LabelBarcode()
+        self.barcode.set_location(5, 100)
+        self.barcode.set_size(120, 20)
+        self.barcode.set_data("SN001")
+        self.page.add_element(self.barcode)
+        self.qrcode = LabelQRCode()
+        self.qrcode.set_location(100, 5)
+        self.qrcode.set_size(50, 50)
+        self.qrcode.set_data("NET001")
+        self.qrcode.set_error_correction(LabelQRCode.ERROR_LEVEL.LOW)
+        self.page.add_element(self.qrcode)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.temp_dir.cleanup()
+    
+    def test_render_page(self):
+        """Test a page becomes one label format with native symbologies"""
+        lines = self.renderer.render_page(self.page).splitlines()
+        self.assertEqual(lines[:5], ["^XA", "^CI28", "^PW480", "^LL320", "^LH0,0"])
+        self.assertEqual(lines[-1], "^XZ")
+        self.assertEqual(lines[5], "^FT14,56^A0N,28,28^FH^FDSN001^FS")
+        self.assertEqual(lines[6], "^FO14,226^BY2^BCN,56,N,N,N^FH^FDSN001^FS")
+        self.assertTrue(lines[7].startswith("^FO282,14^BQN,2,"))
+        self.assertTrue(lines[7].endswith("^FH^FDLA,NET001^FS"))
+        modules = len(self.qrcode._get_cache_entry()['matrix'])
+        # Magnification is rounded down, the symbol stays inside the element
+        self.assertIn(f"^BQN,2,{141 // modules}", lines[7])
+    
+    def test_escaping(self):
+        """Test ZPL control characters in data are hex escaped"""
+        self.text.set_text("A^B~C_D")
+        output = self.renderer.render_page(self.page)
+        self.assertIn("^FH^FDA_5EB_7EC_5FD^FS", output)
+    
+    def test_font_map(self):
+        """Test mapped fonts use printer font files"""
+        renderer = ZPLRenderer(dpi=300, fonts={"Microsoft YaHei": "E:MSYH.TTF"})
+        self.text.font_name = "MicrosoftYaHei-Bold"
+        self.assertIn("^A@N,42,42,E:MSYH.TTF", renderer.render_page(self.page))
+    
+    def test_barcode_options(self):
+        """Test barcode types and text position map to command parameters"""
+        self.barcode.enable_text(True)
+        self.barcode.set_text_location(LabelBarcode.TEXT.TOP)
+        self.assertIn("^BCN,56,Y,Y,N", self.renderer.render_page(self.page))
+        self.barcode.set_barcode_type("code39")
+        self.assertIn("^BY2,2.2^B3N,N,56,Y,Y", self.renderer.render_page(self.page))
+        self.barcode.set_barcode_type("ean13")
+        self.assertIn("^BEN,56,Y,Y", self.renderer.render_page(self.page))
+    
+    def test_datamatrix_size(self):
+        """Test DataMatrix modules follow the element size without outgrowing it"""
+        self.barcode.set_barcode_type("datamatrix")
+        symbol = self.barcode._get_cache_entry()['barcode']
+        for size in (20, 40, 60):
+            self.barcode.set_size(size, size)
+            module = max(1, round(size * 203 / 72) // symbol.col_modules)
+            output = self.renderer.render_page(self.page)
+            self.assertIn(f"^BXN,{module},200", output)
+            self.assertIn(f"^FO14,{282 - module * symbol.row_modules}^BXN", output)
+    
+    def test_export(self):
+        """Test export writes identical labels for identical pages"""
+        filename = os.path.join(self.temp_dir.name, "labels.zpl")
+        count = LabelDocument().export_zpl(iter([self.page] * 3), filename)
+        self.assertEqual(count, 3)
+        with open(filename, encoding='utf-8') as f:
+            data = f.read()
+        label = self.renderer.render_page(self.page)
+        self.assertEqual(data, label * 3)
+    
+    def test_export_stream(self):
+        """Test export writes UTF-8 ZPL to a binary stream"""
+        buffer = io.BytesIO()
+        count = self.renderer.export([self.page] * 2, buffer)
+        self.assertEqual(count, 2)
+        self.assertEqual(buffer.getvalue(), self.renderer.render_page(self.page).encode('utf-8') * 2)
+
+if __name__ == '__main__':
+    unittest.main()